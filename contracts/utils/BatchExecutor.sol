@@ -0,0 +1,77 @@
+pragma solidity 0.5.17;
+pragma experimental ABIEncoderV2;
+
+import "../openzeppelin/Ownable.sol";
+
+/**
+ * @title Batch executor contract.
+ *
+ * @notice Executes several calls in one transaction, so an action touching
+ * many contracts or accounts is submitted to the multisig once and confirmed
+ * once by every signer instead of once per call. A batch is either atomic
+ * (executeBatch) or best effort (executeBatchBestEffort).
+ *
+ * @dev The calls are made from this contract, so it has to hold the role the
+ * called functions require (e.g. a Staking admin for cancelTeamVesting).
+ * Only the owner (the multisig) can execute batches.
+ * */
+contract BatchExecutor is Ownable {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    /* Events */
+
+    event BatchExecuted(address indexed sender, uint256 numberOfCalls);
+
+    event CallFailed(uint256 indexed index, address indexed target, bytes returnData);
+
+    /* Functions */
+
+    /**
+     * @notice Execute all the calls in order, reverting the whole batch if any of them fails.
+     * @dev The revert reason of the failed call is bubbled up.
+     * @param calls The targets and encoded calldata.
+     * */
+    function executeBatch(Call[] memory calls) public onlyOwner {
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            if (!success) {
+                _revertWithData(ret);
+            }
+        }
+        emit BatchExecuted(msg.sender, calls.length);
+    }
+
+    /**
+     * @notice Execute all the calls in order, skipping the failed ones.
+     * @dev A failed call is reverted on its own and reported with a CallFailed event.
+     * @param calls The targets and encoded calldata.
+     * @return successes Whether each call succeeded.
+     * */
+    function executeBatchBestEffort(Call[] memory calls)
+        public
+        onlyOwner
+        returns (bool[] memory successes)
+    {
+        successes = new bool[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            successes[i] = success;
+            if (!success) {
+                emit CallFailed(i, calls[i].target, ret);
+            }
+        }
+        emit BatchExecuted(msg.sender, calls.length);
+    }
+
+    function _revertWithData(bytes memory ret) internal pure {
+        if (ret.length > 0) {
+            assembly {
+                revert(add(ret, 32), mload(ret))
+            }
+        }
+        revert("BatchExecutor: call failed");
+    }
+}
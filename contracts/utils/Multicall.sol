@@ -0,0 +1,92 @@
+pragma solidity 0.5.17;
+pragma experimental ABIEncoderV2;
+
+/**
+ * @title Multicall contract.
+ *
+ * @notice Aggregates the results of several read-only calls so off-chain
+ * scripts can read many values with a single eth_call. All the calls are
+ * executed against the same block, which is returned along with the results.
+ *
+ * @dev Based on MakerDAO's Multicall2. Not meant to be called in transactions.
+ * */
+contract Multicall {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /**
+     * @notice Execute all the calls, reverting if any of them fails.
+     * @param calls The targets and encoded calldata.
+     * @return blockNumber The block the calls were executed on.
+     * @return returnData The raw return data of each call.
+     * */
+    function aggregate(
+        Call[] memory calls
+    ) public returns (uint256 blockNumber, bytes[] memory returnData) {
+        blockNumber = block.number;
+        returnData = new bytes[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            require(success, "Multicall aggregate: call failed");
+            returnData[i] = ret;
+        }
+    }
+
+    /**
+     * @notice Execute all the calls, optionally allowing individual calls to fail.
+     * @param requireSuccess Whether to revert if any call fails.
+     * @param calls The targets and encoded calldata.
+     * @return returnData The success flag and raw return data of each call.
+     * */
+    function tryAggregate(
+        bool requireSuccess,
+        Call[] memory calls
+    ) public returns (Result[] memory returnData) {
+        returnData = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            if (requireSuccess) {
+                require(success, "Multicall aggregate: call failed");
+            }
+            returnData[i] = Result(success, ret);
+        }
+    }
+
+    /**
+     * @notice Same as tryAggregate but also returns the block number.
+     * @param requireSuccess Whether to revert if any call fails.
+     * @param calls The targets and encoded calldata.
+     * @return blockNumber The block the calls were executed on.
+     * @return returnData The success flag and raw return data of each call.
+     * */
+    function tryBlockAndAggregate(
+        bool requireSuccess,
+        Call[] memory calls
+    ) public returns (uint256 blockNumber, Result[] memory returnData) {
+        blockNumber = block.number;
+        returnData = tryAggregate(requireSuccess, calls);
+    }
+
+    function getBlockNumber() public view returns (uint256 blockNumber) {
+        blockNumber = block.number;
+    }
+
+    function getBlockHash(uint256 blockNumber) public view returns (bytes32 blockHash) {
+        blockHash = blockhash(blockNumber);
+    }
+
+    function getCurrentBlockTimestamp() public view returns (uint256 timestamp) {
+        timestamp = block.timestamp;
+    }
+
+    function getEthBalance(address addr) public view returns (uint256 balance) {
+        balance = addr.balance;
+    }
+}
@@ -0,0 +1,137 @@
+'''
+Asyncio based concurrent read engine for per-address audit loops.
+
+Audit scripts walk thousands of CSV rows and make several reads per row, some of which depend on
+each other (e.g. vesting address -> staked balance of the vesting). The engine runs the per-row
+call graphs concurrently with a bounded number of requests in flight, retries transient RPC
+failures with exponential backoff and hands the row results back in input order.
+
+usage:
+    engine = AsyncReadEngine(concurrency=16)
+
+    async def readRow(engine, row):
+        user = row[1]
+        balance, vesting = await asyncio.gather(engine.call(token.balanceOf, user), engine.call(registry.getVesting, user))
+        vested = await engine.call(staking.balanceOf, vesting) # depends on the vesting address
+        return [user, balance, vested]
+
+    engine.streamToCsv(rows, readRow, 'output.csv', header=['user', 'balance', 'vested'])
+'''
+import asyncio
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from scripts.contractInteraction.rpc_stats import callingHelper, runAsHelper
+
+# errors worth retrying - reverts (ValueError from web3) are returned to the caller straight away
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, ConnectionError, TimeoutError)
+
+class AsyncReadEngine:
+    '''
+    concurrency - max number of RPC calls in flight
+    retries - max retries of a call failing with a transient error
+    backoff - delay in seconds before the first retry, doubled on every next one
+    window - max number of rows processed at once, bounds the memory used by the reorder buffer
+    '''
+    def __init__(self, concurrency=16, retries=3, backoff=0.5, window=None):
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.window = window if window != None else concurrency * 4
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+        self.semaphore = None
+        self.calls = 0
+        self.retried = 0
+
+    async def call(self, method, *args):
+        '''
+        runs a blocking call (e.g. a brownie contract call) in the engine thread pool
+        '''
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        helper = callingHelper()
+        async with self.semaphore:
+            attempt = 0
+            while True:
+                try:
+                    self.calls += 1
+                    return await loop.run_in_executor(self.executor, lambda: runAsHelper(helper, method, *args))
+                except TRANSIENT_ERRORS:
+                    if attempt >= self.retries:
+                        raise
+                    self.retried += 1
+                    await asyncio.sleep(self.backoff * 2**attempt)
+                    attempt += 1
+
+    async def orderedResults(self, rows, rowFn):
+        '''
+        async generator yielding rowFn(engine, row) results in the order of rows
+        at most `window` rows are in progress, the next rows are started as the first ones complete
+        if a row fails the rows still in progress are cancelled and the error is raised
+        '''
+        pending = {}
+        rowsIter = enumerate(rows)
+        exhausted = False
+        nextIndex = 0
+        try:
+            while True:
+                while not exhausted and len(pending) < self.window:
+                    try:
+                        index, row = next(rowsIter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[index] = asyncio.ensure_future(rowFn(self, row))
+                if nextIndex not in pending:
+                    return
+                result = await pending.pop(nextIndex)
+                nextIndex += 1
+                yield result
+        finally:
+            for task in pending.values():
+                task.cancel()
+            if len(pending) > 0:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    def mapRows(self, rows, rowFn):
+        '''
+        returns the list of rowFn(engine, row) results in input order
+        '''
+        async def collect():
+            return [result async for result in self.orderedResults(rows, rowFn)]
+        return self.run(collect())
+
+    def streamToCsv(self, rows, rowFn, fileName, header=None):
+        '''
+        writes the rowFn(engine, row) results (lists of columns, None to skip the row) to fileName in input order
+        rows are flushed to the file as soon as all the previous rows are done
+        returns the number of rows written
+        '''
+        async def write():
+            written = 0
+            with open(fileName, 'w', newline='') as file:
+                writer = csv.writer(file)
+                if header != None:
+                    writer.writerow(header)
+                async for result in self.orderedResults(rows, rowFn):
+                    if result is None:
+                        continue
+                    writer.writerow(result)
+                    written += 1
+                    if written % 100 == 0:
+                        file.flush()
+            return written
+        start = time.time()
+        written = self.run(write())
+        print("rows written:", written, "calls:", self.calls, "retried:", self.retried, "time:", round(time.time() - start, 2), "s")
+        return written
+
+    def run(self, coroutine):
+        # a new event loop per run, the semaphore is bound to the loop it was created in
+        self.semaphore = None
+        return asyncio.run(coroutine)
+
+    def close(self):
+        self.executor.shutdown()
@@ -0,0 +1,206 @@
+'''
+Persistent eth_call cache for calls pinned to a historical block.
+
+The result of an eth_call at a given block never changes, so it is stored in SQLite keyed by
+(network, blockNumber, to, calldata). Re-running the same read scripts against the same block
+(e.g. on a hardhat fork started with --fork-block-number) then costs no RPC at all.
+The network is the hash of the genesis block, not the chainId: every hardhat fork has chainId 31337,
+but serves the genesis block of the network it forks (RSK mainnet and testnet forks do not mix).
+The cache is size capped with least-recently-used eviction. Inserts and access times are written in
+batches (every flushEvery writes or flushInterval seconds, and on disable) instead of one commit per call.
+
+usage - on a fork at block 4929553:
+    enableCallCache(pinLatest=True)
+    ... run the read helpers ...
+    printCallCacheStats()
+
+maxBlock - only calls at or below this block are cached (blocks above it can still change).
+    Defaults to the fork block on a hardhat fork (the blocks mined on the fork differ between sessions),
+    otherwise to the current block minus CONFIRMATIONS. It is never above the fork block.
+pinLatest - rewrite 'latest' eth_calls to maxBlock so they are cached as well.
+    Only use it for read-only runs: a transaction sent afterwards is not seen by the reads.
+'''
+from brownie import *
+import atexit
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH = './scripts/contractInteraction/.call_cache.sqlite'
+CONFIRMATIONS = 12
+
+class CallCache:
+    def __init__(self, path=DEFAULT_PATH, maxEntries=200000, flushEvery=1000, flushInterval=10):
+        self.path = path
+        self.maxEntries = maxEntries
+        self.flushEvery = flushEvery
+        self.flushInterval = flushInterval
+        self.lock = threading.RLock()
+        # key -> last access time of the hits not written yet
+        self.touched = {}
+        self.unflushed = 0
+        self.lastFlush = time.time()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('''CREATE TABLE IF NOT EXISTS calls (
+            network TEXT NOT NULL,
+            blockNumber INTEGER NOT NULL,
+            toAddress TEXT NOT NULL,
+            data TEXT NOT NULL,
+            result TEXT NOT NULL,
+            lastAccess REAL NOT NULL,
+            PRIMARY KEY (network, blockNumber, toAddress, data)
+        )''')
+        self.db.execute('CREATE INDEX IF NOT EXISTS calls_lastAccess ON calls (lastAccess)')
+        self.db.commit()
+        self.entries = self.db.execute('SELECT COUNT(*) FROM calls').fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, network, blockNumber, toAddress, data):
+        key = (network, blockNumber, toAddress.lower(), data.lower())
+        with self.lock:
+            row = self.db.execute('SELECT result FROM calls WHERE network=? AND blockNumber=? AND toAddress=? AND data=?', key).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.touched[key] = time.time()
+            self._written()
+            return row[0]
+
+    def put(self, network, blockNumber, toAddress, data, result):
+        with self.lock:
+            self.db.execute('INSERT OR REPLACE INTO calls VALUES (?, ?, ?, ?, ?, ?)',
+                (network, blockNumber, toAddress.lower(), data.lower(), result, time.time()))
+            self.entries += 1
+            if self.entries > self.maxEntries:
+                self.evict()
+            self._written()
+
+    def _written(self):
+        self.unflushed += 1
+        if self.unflushed >= self.flushEvery or time.time() - self.lastFlush >= self.flushInterval:
+            self.flush()
+
+    def flush(self):
+        '''
+        writes the pending access times and commits the pending inserts
+        '''
+        with self.lock:
+            if len(self.touched) > 0:
+                self.db.executemany('UPDATE calls SET lastAccess=? WHERE network=? AND blockNumber=? AND toAddress=? AND data=?',
+                    [(lastAccess,) + key for key, lastAccess in self.touched.items()])
+                self.touched = {}
+            self.db.commit()
+            self.unflushed = 0
+            self.lastFlush = time.time()
+
+    def evict(self):
+        # the pending access times decide what is least recently used
+        self.flush()
+        # evict a tenth of the cap at once so eviction does not run on every insert
+        count = self.db.execute('SELECT COUNT(*) FROM calls').fetchone()[0]
+        toEvict = count - self.maxEntries + self.maxEntries // 10
+        if toEvict > 0:
+            self.db.execute('DELETE FROM calls WHERE rowid IN (SELECT rowid FROM calls ORDER BY lastAccess LIMIT ?)', (toEvict,))
+            self.evictions += toEvict
+        self.entries = count - max(toEvict, 0)
+
+    def clear(self):
+        with self.lock:
+            self.touched = {}
+            self.db.execute('DELETE FROM calls')
+            self.db.commit()
+            self.entries = 0
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits / lookups if lookups > 0 else 0,
+            "evictions": self.evictions
+        }
+
+def networkOf(w3):
+    '''
+    returns (network, fork block) of the node of w3: the hash of its genesis block and
+    the block a hardhat fork was started at, None if the node is not a hardhat fork
+    '''
+    network = w3.provider.make_request('eth_getBlockByNumber', ['0x0', False])['result']['hash']
+    metadata = w3.provider.make_request('hardhat_metadata', [])
+    forkedNetwork = metadata['result'].get('forkedNetwork') if 'result' in metadata else None
+    return network, forkedNetwork['forkBlockNumber'] if forkedNetwork != None else None
+
+def callCacheMiddleware(cache, network, maxBlock, pinLatest=False):
+    '''
+    web3 middleware serving the eth_calls of network pinned to a block <= maxBlock from the cache
+    it is injected next to the provider, so the params are already JSON-RPC formatted
+    '''
+    def middleware(make_request, w3):
+        def middlewareFn(method, params):
+            if method != 'eth_call' or len(params) < 2 or 'to' not in params[0]:
+                return make_request(method, params)
+            blockIdentifier = params[1]
+            if blockIdentifier == 'latest' and pinLatest:
+                blockIdentifier = maxBlock
+                params = [params[0], hex(maxBlock)] + list(params[2:])
+            if isinstance(blockIdentifier, str):
+                if not blockIdentifier.startswith('0x'):
+                    return make_request(method, params)
+                blockIdentifier = int(blockIdentifier, 16)
+            if blockIdentifier > maxBlock or len(params) > 2:
+                # not final yet, or with a state override
+                return make_request(method, params)
+            call = params[0]
+            data = call.get('data', call.get('input', '0x'))
+            result = cache.get(network, blockIdentifier, call['to'], data)
+            if result is not None:
+                return {'jsonrpc': '2.0', 'id': 0, 'result': result, 'fromCallCache': True}
+            response = make_request(method, params)
+            if 'result' in response and 'error' not in response:
+                cache.put(network, blockIdentifier, call['to'], data, response['result'])
+            return response
+
+        return middlewareFn
+    return middleware
+
+activeCache = None
+
+def enableCallCache(path=DEFAULT_PATH, maxEntries=200000, maxBlock=None, pinLatest=False):
+    global activeCache
+    if activeCache is not None:
+        return activeCache
+    network, forkBlock = networkOf(web3)
+    if forkBlock != None and (maxBlock is None or maxBlock > forkBlock):
+        maxBlock = forkBlock
+    elif maxBlock is None:
+        maxBlock = web3.eth.blockNumber - CONFIRMATIONS
+    activeCache = CallCache(path, maxEntries)
+    web3.middleware_onion.inject(callCacheMiddleware(activeCache, network, maxBlock, pinLatest), name='callCache', layer=0)
+    # the last batch of inserts and access times is written on exit
+    atexit.register(disableCallCache)
+    print("eth_call cache enabled:", path, "- caching calls up to block", maxBlock)
+    return activeCache
+
+def disableCallCache():
+    global activeCache
+    if activeCache is None:
+        return
+    web3.middleware_onion.remove('callCache')
+    activeCache.close()
+    activeCache = None
+
+def printCallCacheStats():
+    if activeCache is None:
+        print("eth_call cache is not enabled")
+        return
+    stats = activeCache.stats()
+    print("eth_call cache - entries:", stats["entries"], "hits:", stats["hits"], "misses:", stats["misses"],
+        "hit rate:", round(stats["hitRate"] * 100, 1), "% evictions:", stats["evictions"])
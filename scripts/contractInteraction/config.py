@@ -1,95 +1,148 @@
+'''
+Network config for the contractInteraction helpers.
+
+`conf.contracts` and `conf.acct` are resolved lazily on first access instead of at import time:
+- the per-network *_contracts.json is parsed once and cached
+- `conf.acct` is a LazyAccount - its address is known without decrypting the keystore,
+  the signer is only loaded on the first write (transaction, deploy)
+- in read-only mode (export READ_ONLY=1 or conf.setReadOnly(True)) the keystore is never loaded
+  and any attempt to sign raises
+
+conf.loadConfig() can still be called explicitly to (re)load the config of the active network.
+'''
 from brownie import *
 from brownie.network.contract import InterfaceContainer
 import json
 from os import environ
 
+CONFIG_DIR = './scripts/contractInteraction/'
+
+# network -> [keystore account id, contracts file prefix]
+NETWORKS = {
+    "testnet": ["rskdeployer", "testnet"],
+    "testnet-dev": ["rskdeployerdev", "testnet"],
+    "testnet-shared": ["rskdeployershared", "testnet"],
+    "testnet-dev-shared": ["rskdeployerdevshared", "testnet"],
+    "testnet-ws": ["rskdeployer", "testnet"],
+    "rsk-testnet": ["rskdeployer", "testnet"],
+    "testnet-pub": ["rskdeployer", "testnet"],
+    "rsk-mainnet": ["rskdeployer", "mainnet"],
+    "rsk-mainnet2": ["rskdeployer", "mainnet"],
+    "rsk-mainnet-ws": ["rskdeployer", "mainnet"],
+    "rsk-mainnet-websocket": ["rskdeployer", "mainnet"],
+    "rsk-mainnet2-ws": ["rskdeployer", "mainnet"],
+    "bsc-testnet": ["rskdeployer", "bsc_testnet"],
+    "sepolia": ["rskdeployer", "sepolia"],
+}
+
+readOnly = environ.get('READ_ONLY') == "1"
+_contractsCache = {}
+
+class LazyAccount:
+    '''
+    stands in for a brownie account until a signature is actually needed
+    resolver - function returning the brownie account
+    address - the account address if it is known without resolving (e.g. from the keystore file)
+    needsKeystore - True if resolving decrypts a keystore (not allowed in read-only mode)
+    '''
+    def __init__(self, resolver, address=None, needsKeystore=False):
+        self._resolver = resolver
+        self._address = address
+        self._needsKeystore = needsKeystore
+        self._account = None
+
+    def resolve(self):
+        if self._account is None:
+            if readOnly and self._needsKeystore:
+                raise Exception("Config is read-only: the signer is not loaded. Unset READ_ONLY to send transactions.")
+            self._account = self._resolver()
+        return self._account
+
+    @property
+    def address(self):
+        if self._account is None and self._address is not None:
+            return self._address
+        if self._account is None and readOnly and self._needsKeystore:
+            # calling from the zero address would silently read the wrong state
+            raise Exception("Config is read-only and the keystore address is unknown. Unset READ_ONLY or add the address to the keystore file.")
+        return self.resolve().address
+
+    def balance(self):
+        if self._account is None:
+            return web3.eth.getBalance(self.address)
+        return self._account.balance()
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __str__(self):
+        return self.address
+
+    def __repr__(self):
+        return "<LazyAccount '" + self.address + "'>"
+
+    def __eq__(self, other):
+        return str(self).lower() == str(other).lower()
+
+    def __hash__(self):
+        return hash(str(self).lower())
+
+def setReadOnly(flag):
+    global readOnly
+    readOnly = flag
+
+def keystoreAddress(accountId):
+    '''
+    reads the public address of a brownie keystore without decrypting it
+    '''
+    from brownie._config import _get_data_folder
+    path = _get_data_folder().joinpath("accounts").joinpath(accountId + ".json")
+    try:
+        with path.open() as keystoreFile:
+            address = json.load(keystoreFile).get("address")
+    except (OSError, ValueError):
+        return None
+    if address is None:
+        return None
+    return web3.toChecksumAddress(address if address.startswith("0x") else "0x" + address)
+
+def keystoreAccount(accountId):
+    return LazyAccount(lambda: accounts.load(accountId), keystoreAddress(accountId), True)
+
+def readContracts(fileName):
+    configPath = CONFIG_DIR + fileName + "_contracts.json"
+    if configPath not in _contractsCache:
+        with open(configPath) as configFile:
+            _contractsCache[configPath] = json.load(configFile)
+    return _contractsCache[configPath]
+
 def loadConfig():
     global contracts, acct
     thisNetwork = network.show_active()
     if thisNetwork == "development":
-        acct = accounts[0]
         devAcc = environ.get('ACC_NAME')
-        if(devAcc != None):
-            acct = accounts.load(devAcc)
-        else: 
-            acct = accounts.load("rskdeployer")
+        acct = keystoreAccount(devAcc if devAcc != None else "rskdeployer")
         netName = environ.get('DEV_NET_NAME')
-        if(netName != None): 
-            configPath = "./scripts/contractInteraction/" + netName + "_contracts.json"
-            configFile = open(configPath)
-        else:
-            configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "testnet":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "testnet-dev":
-        acct = accounts.load("rskdeployerdev")
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "testnet-shared":
-        acct = accounts.load("rskdeployershared")
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "testnet-dev-shared":
-        acct = accounts.load("rskdeployerdevshared")
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "testnet-ws":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
+        contracts = readContracts(netName if netName != None else "testnet")
     #  Adds a conditional for the cron job , it will check id the
     #  script is executed as part of the feeWithdrawal/setBlock cron job
-    elif thisNetwork == "rsk-testnet" and environ.get('REWARDS_CRON') == "1":
-        print("Running cron job")
-        acct = accounts.add(
-            environ.get('FEE_CLAIMER'))
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "rsk-mainnet" and environ.get('REWARDS_CRON') == "1":
-        acct = accounts.add(
-            environ.get('FEE_CLAIMER'))
-        configFile = open(
-            './scripts/contractInteraction/mainnet_contracts.json')
-    elif thisNetwork == "rsk-testnet":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "testnet-pub":
-        acct = accounts.load("rskdeployer")
-        configFile =  open('./scripts/contractInteraction/testnet_contracts.json')
-    elif thisNetwork == "rsk-mainnet":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/mainnet_contracts.json')
-    elif thisNetwork == "rsk-mainnet2":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/mainnet_contracts.json')
-    elif thisNetwork == "rsk-mainnet-ws":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/mainnet_contracts.json')
-    elif thisNetwork == "rsk-mainnet-websocket":
-        acct = accounts.load("rskdeployer")
-        configFile =  open('./scripts/contractInteraction/mainnet_contracts.json')
-    elif thisNetwork == "rsk-mainnet2-ws":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/mainnet_contracts.json')
-    elif thisNetwork == "bsc-testnet":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/bsc_testnet_contracts.json')
-    elif thisNetwork == "sepolia":
-        acct = accounts.load("rskdeployer")
-        configFile = open(
-            './scripts/contractInteraction/sepolia_contracts.json')
+    elif (thisNetwork == "rsk-testnet" or thisNetwork == "rsk-mainnet") and environ.get('REWARDS_CRON') == "1":
+        if thisNetwork == "rsk-testnet":
+            print("Running cron job")
+        acct = LazyAccount(lambda: accounts.add(environ.get('FEE_CLAIMER')))
+        contracts = readContracts(NETWORKS[thisNetwork][1])
+    elif thisNetwork in NETWORKS:
+        acct = keystoreAccount(NETWORKS[thisNetwork][0])
+        contracts = readContracts(NETWORKS[thisNetwork][1])
     else:
         raise Exception("Network not supported.")
-    contracts = json.load(configFile)
-
+    if environ.get('RPC_STATS') == "1":
+        from scripts.contractInteraction.rpc_stats import enableRpcStats
+        enableRpcStats(environ.get('RPC_STATS_JSON'))
 
-loadConfig()
\ No newline at end of file
+def __getattr__(name):
+    # module level lazy attributes: the config is only loaded when a helper first needs it
+    if name in ("contracts", "acct"):
+        loadConfig()
+        return globals()[name]
+    raise AttributeError("module " + __name__ + " has no attribute " + name)
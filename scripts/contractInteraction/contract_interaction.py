@@ -26,6 +26,12 @@ def main():
     2) run the script respectively:
     export DEV_NET_NAME="testnet" && brownie run scripts/contractInteraction/contract_interaction.py --network development
     export DEV_NET_NAME="mainnet" && brownie run scripts/contractInteraction/contract_interaction.py --network development
+
+    3) optionally cache the reads of the fork block on disk, so re-running read-only scripts costs no RPC:
+    enableCallCache(pinLatest=True)
+
+    to see which helpers make the most RPC calls and where the time goes, add RPC_STATS=1
+    (and optionally RPC_STATS_JSON=./rpc_stats.json) to the exports - a summary is printed at exit
     '''
 
     # call the function you want here
@@ -34,6 +40,7 @@ def main():
 
     #cancelTeamVestingsOfAccount('0x673b37941AB527e0EEe13C1Ff09298ef1911d7D6', 1703845695)
     #cancelTeamVestingsOfAccount('0x56B00ca0a274fB53449fBF2DB0253B809E364975')
+    #cancelTeamVestingsOfAccounts(['0x673b37941AB527e0EEe13C1Ff09298ef1911d7D6', '0x56B00ca0a274fB53449fBF2DB0253B809E364975'], 0) # needs deployBatchExecutor() and addBatchExecutorAsStakingAdmin()
 
     #getReleaseScheduleFromDevelopmentFund()
     #getReleaseScheduleFromAdoptionFund()
@@ -7,6 +7,12 @@ import time;
 import copy
 from scripts.utils import *  
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import *
+from scripts.contractInteraction.multicall import *
+from scripts.contractInteraction.rpc_batch import *
+from scripts.contractInteraction.call_cache import *
+from scripts.contractInteraction.rpc_stats import *
+from scripts.contractInteraction.tx_pipeline import *
 from scripts.contractInteraction.loan_tokens import *
 from scripts.contractInteraction.protocol import *
 from scripts.contractInteraction.staking_vesting import *
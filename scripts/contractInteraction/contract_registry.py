@@ -0,0 +1,84 @@
+'''
+Process-wide registry of contract handles and ABI files used by the contractInteraction helpers.
+
+Every helper used to build a fresh Contract.from_abi(...) object (and often re-read an ABI JSON
+from ./scripts/contractInteraction/ABIs/) on each call. The registry builds a handle once per
+(logical name, address, ABI source, owner) and ABI files are parsed lazily on first use.
+
+usage:
+    from scripts.contractInteraction.contract_registry import getContract, loadAbi
+    watcher = getContract("Watcher", address=conf.contracts['Watcher'], abi=loadAbi('Watcher'), owner=conf.acct)
+    printRegistryStats()
+'''
+from brownie import Contract
+import json
+
+ABI_DIR = './scripts/contractInteraction/ABIs/'
+
+class ContractRegistry:
+    def __init__(self):
+        self.handles = {}
+        self.abis = {}
+        self.hits = 0
+        self.misses = 0
+        self.abiLoads = 0
+
+    def loadAbi(self, abiName):
+        '''
+        returns the parsed ABI of ./scripts/contractInteraction/ABIs/<abiName>.json, reading the file only once
+        '''
+        abi = self.abis.get(abiName)
+        if abi is None:
+            with open(ABI_DIR + abiName + '.json') as abiFile:
+                abi = json.load(abiFile)
+            self.abis[abiName] = abi
+            self.abiLoads += 1
+        return abi
+
+    def getContract(self, name, address, abi, owner=None):
+        '''
+        drop-in replacement for Contract.from_abi(name, address, abi, owner) returning a cached handle
+        abi - either an ABI list (e.g. LoanTokenLogicStandard.abi, loadAbi('Watcher')) or the name of a file in ABIs/
+        '''
+        if isinstance(abi, str):
+            abi = self.loadAbi(abi)
+        # ABI lists and owner objects are keyed by identity: artifacts and loadAbi() always hand out the same
+        # list object, so hashing the full ABI on every call is avoided. The entry keeps a reference to both
+        # so their ids cannot be reused while the handle is cached.
+        ownerKey = owner.lower() if isinstance(owner, str) else id(owner)
+        key = (name, str(address).lower(), id(abi), ownerKey)
+        entry = self.handles.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        contract = Contract.from_abi(name, address=address, abi=abi, owner=owner)
+        self.handles[key] = (contract, abi, owner)
+        return contract
+
+    def clear(self):
+        self.handles = {}
+        self.abis = {}
+        self.hits = 0
+        self.misses = 0
+        self.abiLoads = 0
+
+    def stats(self):
+        return {
+            "handles": len(self.handles),
+            "hits": self.hits,
+            "misses": self.misses,
+            "abiFilesLoaded": self.abiLoads
+        }
+
+registry = ContractRegistry()
+
+def getContract(name, address, abi, owner=None):
+    return registry.getContract(name, address, abi, owner)
+
+def loadAbi(abiName):
+    return registry.loadAbi(abiName)
+
+def printRegistryStats():
+    stats = registry.stats()
+    print("contract handles cached:", stats["handles"], "hits:", stats["hits"], "misses:", stats["misses"], "ABI files loaded:", stats["abiFilesLoaded"])
@@ -10,6 +10,8 @@ from brownie.network.contract import InterfaceContainer
 import json, os, time, copy, csv
 from scripts.utils import * 
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract
+from scripts.contractInteraction.rpc_batch import readCallsRpc
 
 def readStakingDelegates(userAddress, timeLockDate):
     staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
@@ -74,8 +76,10 @@ def main():
         print("stakes: ", stakes)
 
         # print('Checking delegates:')
-        for stakeTimeLockDate in stakes[0]:
-            delegate = readStakingDelegates(userAddress, stakeTimeLockDate)
+        # the delegates of all lock dates are read with JSON-RPC batches instead of one request per date
+        staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+        delegates = readCallsRpc([(staking.delegates, userAddress, stakeTimeLockDate) for stakeTimeLockDate in stakes[0]])
+        for stakeTimeLockDate, delegate in zip(stakes[0], delegates):
             print("staking.delegates(", userAddress, ", ", stakeTimeLockDate, "): ", delegate)
 
             # Append CSV data
@@ -0,0 +1,58 @@
+'''
+Packing of list arguments (dates, receivers, amounts, ...) into the fewest transactions that fit a gas budget.
+
+A chunk is grown or shrunk from the gas estimate of the previous attempt, assuming the gas grows
+about linearly with the chunk size, and every chunk returned was estimated with eth_estimateGas.
+
+usage:
+    buildData = lambda chunk: staking.setVestingStakes.encode_input([item[0] for item in chunk], [item[1] for item in chunk])
+    for chunk, data, gas in packByGas(items, buildData, staking.address, conf.contracts['multisig']):
+        sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
+'''
+from brownie import *
+
+# RSK blocks are limited to 6.8M gas, the rest is left for the multisig execution overhead
+DEFAULT_GAS_LIMIT = 5000000
+MAX_ESTIMATES = 8
+
+def estimateGas(to, data, sender, value=0):
+    return web3.eth.estimateGas({'from': str(sender), 'to': str(to), 'data': data, 'value': value})
+
+def packByGas(items, buildData, to, sender, gasLimit=DEFAULT_GAS_LIMIT, firstChunk=50):
+    '''
+    items - the list to split, in order
+    buildData - function returning the calldata of a chunk (a slice of items)
+    to, sender - the estimated transaction (sender must be allowed to call it, e.g. the multisig)
+    returns the list of (chunk, data, estimated gas) tuples
+    '''
+    chunks = []
+    size = firstChunk
+    i = 0
+    while i < len(items):
+        remaining = len(items) - i
+        size = max(1, min(size, remaining))
+        best = None
+        tooBig = remaining + 1
+        for attempt in range(0, MAX_ESTIMATES):
+            chunk = items[i:i + size]
+            data = buildData(chunk)
+            gas = estimateGas(to, data, sender)
+            if gas <= gasLimit:
+                best = (chunk, data, gas)
+                grown = min(remaining, tooBig - 1, size * gasLimit // gas)
+                if grown <= size:
+                    break
+                size = grown
+            else:
+                if size == 1:
+                    raise Exception("a single item needs " + str(gas) + " gas, above the limit of " + str(gasLimit))
+                tooBig = size
+                size = max(1, min(size - 1, size * gasLimit // gas))
+                if best is not None and size <= len(best[0]):
+                    break
+        if best is None:
+            raise Exception("no chunk under " + str(gasLimit) + " gas found after " + str(MAX_ESTIMATES) + " estimates")
+        chunks.append(best)
+        size = len(best[0])
+        i += size
+    return chunks
@@ -54,8 +54,15 @@ def setLockedSOV(newLockedSOV):
     data = lm.setLockedSOV.encode_input(newLockedSOV)
     sendWithMultisig(conf.contracts['multisig'], lm.address, data, conf.acct)
 
-def addPoolsToLM():
+def addBatchExecutorAsLMAdmin():
+    lm = Contract.from_abi("LiquidityMining", address = conf.contracts['LiquidityMiningProxy'], abi = LiquidityMining.abi, owner = conf.acct)
+    data = lm.addAdmin.encode_input(conf.contracts['BatchExecutor'])
+    sendWithMultisig(conf.contracts['multisig'], lm.address, data, conf.acct)
+
+def addPoolsToLM(batch = None):
     liquidityMining = Contract.from_abi("LiquidityMining", address = conf.contracts['LiquidityMiningProxy'], abi = LiquidityMining.abi, owner = conf.acct)
+    requireBatchRole(batch, lambda executor: liquidityMining.admins(executor) or liquidityMining.owner() == executor, "admin of LiquidityMining (addBatchExecutorAsLMAdmin)")
+    submit = batch.add if batch != None else lambda contractAddress, data: sendWithMultisig(conf.contracts['multisig'], contractAddress, data, conf.acct)
     # TODO prepare pool tokens list
     poolTokens = [conf.contracts['(WR)BTC/USDT1'], conf.contracts['(WR)BTC/USDT2'], conf.contracts['(WR)BTC/DOC1'], conf.contracts['(WR)BTC/DOC2'], conf.contracts['(WR)BTC/BPRO1'], conf.contracts['(WR)BTC/BPRO2']]
     allocationPoints = [1, 1, 1, 1, 1, 1]
@@ -65,10 +72,10 @@ def addPoolsToLM():
         print('adding pool', i)
         data = liquidityMining.add.encode_input(poolTokens[i], allocationPoints[i], withUpdate)
         print(data)
-        sendWithMultisig(conf.contracts['multisig'], liquidityMining.address, data, conf.acct)
+        submit(liquidityMining.address, data)
     data = liquidityMining.updateAllPools.encode_input()
     print(data)
-    sendWithMultisig(conf.contracts['multisig'], liquidityMining.address, data, conf.acct)
+    submit(liquidityMining.address, data)
 
 def addMOCPoolToken():
     lm = Contract.from_abi("LiquidityMining", address = conf.contracts['LiquidityMiningProxy'], abi = LiquidityMining.abi, owner = conf.acct)
@@ -5,10 +5,12 @@ import time;
 import copy
 from scripts.utils import * 
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract, loadAbi
+from scripts.contractInteraction.multicall import readCalls
 
 def lendToPool(loanTokenAddress, tokenAddress, amount):
-    token = Contract.from_abi("TestToken", address = tokenAddress, abi = TestToken.abi, owner = conf.acct)
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    token = getContract("TestToken", address = tokenAddress, abi = TestToken.abi, owner = conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     if(token.allowance(conf.acct, loanToken.address) < amount):
         token.approve(loanToken.address, amount)
     tx = loanToken.mint(conf.acct, amount)
@@ -16,8 +18,8 @@ def lendToPool(loanTokenAddress, tokenAddress, amount):
     return tx
 
 def lendToPoolWithMS(loanTokenAddress, tokenAddress, amount):
-    token = Contract.from_abi("TestToken", address = tokenAddress, abi = TestToken.abi, owner = conf.acct)
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    token = getContract("TestToken", address = tokenAddress, abi = TestToken.abi, owner = conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     if(token.allowance(conf.contracts['multisig'], loanToken.address) < amount):
         data = token.approve.encode_input(loanToken.address, amount)
         sendWithMultisig(conf.contracts['multisig'], token.address, data, conf.acct)
@@ -25,44 +27,46 @@ def lendToPoolWithMS(loanTokenAddress, tokenAddress, amount):
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def removeFromPool(loanTokenAddress, amount):
-    loanToken = Contract.from_abi("loanToken", address = loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address = loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     tx = loanToken.burn(conf.acct, amount)
     tx.info()
     return tx
 
 def removeFromPoolWithMS(loanTokenAddress, amount, receiver):
-    loanToken = Contract.from_abi("loanToken", address = loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address = loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     data = loanToken.burn.encode_input(receiver, amount)
     print(data)
     sendWithMultisig(conf.contracts['multisig'], loanTokenAddress, data, conf.acct)
 
-def readLoanTokenState(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    tas = loanToken.totalAssetSupply()
+def readLoanTokenState(loanTokenAddress, batched=True):
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    tas, tab, abir, ir, bir = readCalls([
+        (loanToken.totalAssetSupply,),
+        (loanToken.totalAssetBorrow,),
+        (loanToken.avgBorrowInterestRate,),
+        (loanToken.nextSupplyInterestRate, 0),
+        (loanToken.nextBorrowInterestRate, 0)
+    ], batched)
     print("total supply", tas/1e18);
     #print((balance - tas)/1e18)
-    tab = loanToken.totalAssetBorrow()
     print("total asset borrowed", tab/1e18)
-    abir = loanToken.avgBorrowInterestRate()
     print("average borrow interest rate", abir/1e18)
-    ir = loanToken.nextSupplyInterestRate(0)
     print("next supply interest rate", ir)
-    bir = loanToken.nextBorrowInterestRate(0)
     print("next borrow interest rate", bir)
 
 def readUnderlying(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print(loanToken.loanTokenAddress())
 
 def getTokenPrice(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     price = loanToken.tokenPrice()
     print("token price",price)
     return price
 
 def testTokenBurning(loanTokenAddress, testTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    testToken = Contract.from_abi("TestToken", address = testTokenAddress, abi = TestToken.abi, owner = conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    testToken = getContract("TestToken", address = testTokenAddress, abi = TestToken.abi, owner = conf.acct)
 
     testToken.approve(loanToken,1e17) 
     loanToken.mint(conf.acct, 1e17)
@@ -80,9 +84,9 @@ def testTokenBurning(loanTokenAddress, testTokenAddress):
     assert(tx.events["Burn"]["tokenAmount"] == burnAmount)
 
 def testTradeOpeningAndClosing(protocolAddress, loanTokenAddress, underlyingTokenAddress, collateralTokenAddress, loanTokenSent, leverage, testClose, sendValue):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    testToken = Contract.from_abi("TestToken", address = underlyingTokenAddress, abi = TestToken.abi, owner = conf.acct)
-    sovryn = Contract.from_abi("sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    testToken = getContract("TestToken", address = underlyingTokenAddress, abi = TestToken.abi, owner = conf.acct)
+    sovryn = getContract("sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     if(sendValue == 0 and testToken.allowance(conf.acct, loanTokenAddress) < loanTokenSent):
         testToken.approve(loanToken, loanTokenSent)
     print('going to trade')
@@ -113,9 +117,9 @@ def testTradeOpeningAndClosing(protocolAddress, loanTokenAddress, underlyingToke
 
 
 def testTradeOpeningAndClosingWithCollateral(protocolAddress, loanTokenAddress, underlyingTokenAddress, collateralTokenAddress, collateralTokenSent, leverage, testClose, sendValue):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    testToken = Contract.from_abi("TestToken", address = collateralTokenAddress, abi = TestToken.abi, owner = conf.acct)
-    sovryn = Contract.from_abi("sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    testToken = getContract("TestToken", address = collateralTokenAddress, abi = TestToken.abi, owner = conf.acct)
+    sovryn = getContract("sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     if(sendValue == 0 and testToken.allowance(conf.acct, loanTokenAddress) < collateralTokenSent):
        testToken.approve(loanToken, collateralTokenSent)
     print('going to trade')
@@ -147,8 +151,8 @@ def withdrawRBTCFromIWRBTC(toAddress, amount):
     withdrawRBTCFromLoanTokenTo(loanTokenAddress, toAddress, amount)
 
 def goSOVLongWithMS(sovSent):
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    sovToken = Contract.from_abi("TestToken", address = conf.contracts['SOV'], abi = TestToken.abi, owner = conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    sovToken = getContract("TestToken", address = conf.contracts['SOV'], abi = TestToken.abi, owner = conf.acct)
 
     if(sovToken.allowance(conf.contracts['multisig'], loanToken.address) < sovSent):
         print("getting approval")
@@ -177,7 +181,7 @@ def withdrawRBTCFromIWRBTC(toAddress, amount):
 
 def withdrawRBTCFromLoanTokenTo(loanTokenAddress, toAddress, amount):
     #read contract abis
-    tokenContract = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    tokenContract = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     data = tokenContract.withdrawRBTCTo.encode_input(toAddress, amount)
     print("=============================================================")
     print("Sending RBTC")
@@ -190,7 +194,7 @@ def withdrawRBTCFromLoanTokenTo(loanTokenAddress, toAddress, amount):
 
 def withdrawRBTCFromLoanTokenTo(loanTokenAddress, toAddress, amount):
     #read contract abis
-    tokenContract = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    tokenContract = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     data = tokenContract.withdrawRBTCTo.encode_input(toAddress, amount)
     print("=============================================================")
     print("Sending RBTC")
@@ -204,9 +208,9 @@ def withdrawRBTCFromLoanTokenTo(loanTokenAddress, toAddress, amount):
 
 def testBorrow(protocolAddress, loanTokenAddress, underlyingTokenAddress, collateralTokenAddress, amount):
     #read contract abis
-    sovryn = Contract.from_abi("sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    testToken = Contract.from_abi("TestToken", address = collateralTokenAddress, abi = TestToken.abi, owner = conf.acct)
+    sovryn = getContract("sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    testToken = getContract("TestToken", address = collateralTokenAddress, abi = TestToken.abi, owner = conf.acct)
     
     # determine borrowing parameter
     withdrawAmount = amount #i want to borrow 10 USD
@@ -246,8 +250,8 @@ def testBorrow(protocolAddress, loanTokenAddress, underlyingTokenAddress, collat
 def borrowRBTCWithMultisigUsingSOV(withdrawAmount, receiver):
     print("amount: ", withdrawAmount)
 
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    sovToken = Contract.from_abi("SOV", address = conf.contracts['SOV'], abi = TestToken.abi, owner = conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    sovToken = getContract("SOV", address = conf.contracts['SOV'], abi = TestToken.abi, owner = conf.acct)
 
     durationInSeconds = 28*24*60*60 # 28 days
     collateralTokenSent = loanToken.getDepositAmountForBorrow(withdrawAmount, durationInSeconds, conf.contracts['SOV'])
@@ -278,7 +282,7 @@ def borrowRBTCWithMultisigUsingSOV(withdrawAmount, receiver):
 sets a collateral token address as collateral for borrowing
 '''
 def setupTorqueLoanParams(loanTokenAddress, underlyingTokenAddress, collateralTokenAddress, minInitialMargin):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     params = []
     setup = [
         b"0x0", ## id
@@ -299,7 +303,7 @@ def setupTorqueLoanParams(loanTokenAddress, underlyingTokenAddress, collateralTo
 sets a collateral token address as collateral for margin trading
 '''
 def setupMarginLoanParams(collateralTokenAddress, loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     
     params = [];
     setup = [
@@ -320,7 +324,7 @@ def setupMarginLoanParams(collateralTokenAddress, loanTokenAddress):
 sets a collateral token address as collateral for margin trading
 '''
 def setupMarginLoanParamsMinInitialMargin(collateralTokenAddress, loanTokenAddress, minInitialMargin):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     #loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, #abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     
     params = []
@@ -340,7 +344,7 @@ def setupMarginLoanParamsMinInitialMargin(collateralTokenAddress, loanTokenAddre
 
 
 def setupLoanParamsForCollaterals(loanTokenAddress, collateralAddresses):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     marginParams = []
     torqueParams = []
     for collateralAddress in collateralAddresses:
@@ -370,12 +374,12 @@ def setupLoanParamsForCollaterals(loanTokenAddress, collateralAddresses):
 
 
 def setTransactionLimits(loanTokenAddress, addresses, limits):
-    localLoanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    localLoanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = localLoanToken.setTransactionLimits.encode_input(addresses,limits)
     sendWithMultisig(conf.contracts['multisig'], localLoanToken.address, data, conf.acct)
 
 def readTransactionLimits(loanTokenAddress, SUSD, RBTC, USDT, BPro, XUSD):
-    localLoanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanToken.abi, owner=conf.acct)
+    localLoanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanToken.abi, owner=conf.acct)
     limit = localLoanToken.transactionLimit(RBTC)
     print("RBTC limit, ",limit)
     limit = localLoanToken.transactionLimit(SUSD)
@@ -388,7 +392,7 @@ def readTransactionLimits(loanTokenAddress, SUSD, RBTC, USDT, BPro, XUSD):
     print("XUSD limit, ",limit)
 
 def readLendingBalanceForUser(loanTokenAddress, userAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=userAddress)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=userAddress)
     bal = loanToken.balanceOf(userAddress)
     print('iToken balance', bal)
     bal = loanToken.assetBalanceOf(userAddress)
@@ -512,17 +516,21 @@ def deployNewLoanTokenLogicFirstTime():
     print("LoanTokenLogicWrbtc new owner: ", loanTokenLogicBeaconWrbtc.owner())
 
 def setBeaconLoanTokenLogicProxy(loanTokenAddress, loanTokenLogicBeaconAddress):
-    loanTokenWithProxyABI = Contract.from_abi("loanTokenWithProxyABI", address=loanTokenAddress, abi=LoanTokenLogicProxy.abi, owner=conf.acct)
+    loanTokenWithProxyABI = getContract("loanTokenWithProxyABI", address=loanTokenAddress, abi=LoanTokenLogicProxy.abi, owner=conf.acct)
     data = loanTokenWithProxyABI.setBeaconAddress.encode_input(loanTokenLogicBeaconAddress)
     sendWithMultisig(conf.contracts['multisig'], loanTokenWithProxyABI.address, data, conf.acct)
 
-def replaceLoanTokenLogicOnAllContracts():
+def replaceLoanTokenLogicOnAllContracts(batch = None):
     # This function will do:
     # 1. Deploy the LoanTokenLogicLM
     # 2. Re-register the module/function signature inside LoanTokenLogicLM to the LoanTokenLogicBeaconLM
     # 3. Deploy the LoanTokenLogicWrbtc
     # 4. Re-register the module/function signature inside LoanTokenLogicWrbtc to the LoanTokenLogicBeaconWrbtc
-
+    # batch - a MultisigBatch to add the registrations to, the beacons have to be owned by its BatchExecutor
+    submit = batch.add if batch != None else lambda contractAddress, data: sendWithMultisig(conf.contracts['multisig'], contractAddress, data, conf.acct)
+    for beaconName in ['LoanTokenLogicBeaconLM', 'LoanTokenLogicBeaconWrbtc']:
+        beacon = getContract(beaconName, address=conf.contracts[beaconName], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+        requireBatchRole(batch, lambda executor: beacon.owner() == executor, "owner of " + beaconName)
 
     # ===================================== LM =====================================
     print("Deploying LoanTokenlogicLM")
@@ -530,9 +538,9 @@ def replaceLoanTokenLogicOnAllContracts():
     print("new LoanTokenLogicLM contract deployed at: ", logicContractLM.address)
 
     print("Registering function signature to the LoanTokenLogicBeaconLM")
-    loanTokenLogicBeaconLM = Contract.from_abi("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconLM = getContract("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     data = loanTokenLogicBeaconLM.registerLoanTokenModule.encode_input(logicContractLM.address)
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconLM.address, data, conf.acct)
+    submit(loanTokenLogicBeaconLM.address, data)
 
     print("Deploy Loan Token Settings Lower Admin Module")
     loanTokenSettingsLowerAdmin = conf.acct.deploy(LoanTokenSettingsLowerAdmin)
@@ -540,7 +548,7 @@ def replaceLoanTokenLogicOnAllContracts():
 
     print("Registering Loan Protocol Settings Module to LoanTOkenLogicBeaconLM")
     data = loanTokenLogicBeaconLM.registerLoanTokenModule.encode_input(loanTokenSettingsLowerAdmin.address)
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconLM.address, data, conf.acct)
+    submit(loanTokenLogicBeaconLM.address, data)
 
     # ===================================== WRBTC =====================================
 
@@ -549,50 +557,50 @@ def replaceLoanTokenLogicOnAllContracts():
     print("new LoanTokenLogicWRBTC contract deployed at: ", logicContractWrbtc.address)
 
     print("Registering function signature to the LoanTokenLogicBeaconWRBTC")
-    loanTokenLogicBeaconWrbtc = Contract.from_abi("loanTokenLogicBeaconWrbtc", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconWrbtc = getContract("loanTokenLogicBeaconWrbtc", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     data = loanTokenLogicBeaconWrbtc.registerLoanTokenModule.encode_input(logicContractWrbtc.address)
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconWrbtc.address, data, conf.acct)
+    submit(loanTokenLogicBeaconWrbtc.address, data)
 
     # Can use the same Loan Protocol Settings with the LoanTokenLogicLM
     print("Registering Loan Protocol Settings Module to LoanTOkenLogicBeaconWrbtc")
     data = loanTokenLogicBeaconWrbtc.registerLoanTokenModule.encode_input(loanTokenSettingsLowerAdmin.address)
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconWrbtc.address, data, conf.acct)
+    submit(loanTokenLogicBeaconWrbtc.address, data)
     
 
 def replaceLoanTokenLogic(loanTokenAddress, logicAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanToken.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanToken.abi, owner=conf.acct)
     data = loanToken.setTarget.encode_input(logicAddress)
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
     
 
 def triggerEmergencyStop(loanTokenAddress, turnOn):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     functionSignature = "marginTrade(bytes32,uint256,uint256,uint256,address,address,uint256,bytes)"
     #functionSignature = "borrow(bytes32,uint256,uint256,uint256,address,address,address,bytes)"
     triggerFunctionEmergencyStop(loanToken.address, functionSignature, turnOn)
 
 def triggerFunctionEmergencyStop(loanTokenAddress, functionSignature, turnOn):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.toggleFunctionPause.encode_input(functionSignature, turnOn)
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def readPauser(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=interface.ILoanTokenModules.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=interface.ILoanTokenModules.abi, owner=conf.acct)
     print(loanToken.pauser.encode_input())
 
 def setPauser(loanTokenAddress, pauser):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=interface.ILoanTokenModules.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=interface.ILoanTokenModules.abi, owner=conf.acct)
     data = loanToken.setPauser.encode_input(pauser)
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def checkPause(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=interface.ILoanTokenModules.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=interface.ILoanTokenModules.abi, owner=conf.acct)
     funcId = "borrow(bytes32,uint256,uint256,uint256,address,address,address,bytes)"
     print(loanToken.checkPause(funcId))
 
 def checkLoanTokenFunctionsPause(loanTokenNames):
     for loanTokenName in loanTokenNames:
-        loanToken = Contract.from_abi("loanToken", address=conf.contracts[loanTokenName], abi=interface.ILoanTokenModules.abi, owner=conf.acct)
+        loanToken = getContract("loanToken", address=conf.contracts[loanTokenName], abi=interface.ILoanTokenModules.abi, owner=conf.acct)
         print('loan token', loanTokenName, "@", conf.contracts[loanTokenName],":")
         
         funcId = "borrow(bytes32,uint256,uint256,uint256,address,address,address,bytes)"
@@ -602,52 +610,55 @@ def checkLoanTokenFunctionsPause(loanTokenNames):
         print('                 marginTrade paused:', loanToken.checkPause(funcId))
 
 def disableLoanParams(loanTokenAddress, collateralToken):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.disableLoanParams.encode_input([collateralToken, collateralToken], [False, True])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def readAdminOfLoanToken(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     print(loanToken.admin())
 
 def setAdminOnLoanToken(loanTokenAddress, admin):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(admin)
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def setAdminOnLoanTokenWithWallet(loanTokenAddress, admin):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     loanToken.setAdmin(admin)
 
-def readLiquidity():
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    tasRBTC = loanToken.totalAssetSupply()
-    tabRBTC = loanToken.totalAssetBorrow()
+def readLiquidity(batched=True):
+    iRBTC = getContract("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    iDOC = getContract("loanToken", address=conf.contracts['iDOC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    iXUSD = getContract("loanToken", address=conf.contracts['iXUSD'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    usdt = getContract("Token", address=conf.contracts['USDT'], abi=TestToken.abi, owner=conf.acct)
+    wrbtc = getContract("Token", address=conf.contracts['WRBTC'], abi=TestToken.abi, owner=conf.acct)
+    tasRBTC, tabRBTC, tasDOC, tabDOC, tasXUSD, tabXUSD, balUSDT, balRBTC = readCalls([
+        (iRBTC.totalAssetSupply,),
+        (iRBTC.totalAssetBorrow,),
+        (iDOC.totalAssetSupply,),
+        (iDOC.totalAssetBorrow,),
+        (iXUSD.totalAssetSupply,),
+        (iXUSD.totalAssetBorrow,),
+        (usdt.balanceOf, conf.contracts['ConverterUSDT']),
+        (wrbtc.balanceOf, conf.contracts['ConverterUSDT'])
+    ], batched)
+
     print(tabRBTC/tasRBTC)
     print("liquidity on iRBTC", (tasRBTC-tabRBTC)/1e18)
     
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iDOC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    tasIUSD = loanToken.totalAssetSupply()
-    tabIUSD = loanToken.totalAssetBorrow()
-    print("liquidity on iDOC", (tasIUSD-tabIUSD)/1e18)
+    print("liquidity on iDOC", (tasDOC-tabDOC)/1e18)
     
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iXUSD'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
-    tasIUSD = loanToken.totalAssetSupply()
-    tabIUSD = loanToken.totalAssetBorrow()
-    print(tabIUSD/tasIUSD)
-    print("liquidity on iUSDT", (tasIUSD-tabIUSD)/1e18)
-
-    tokenContract = Contract.from_abi("Token", address=conf.contracts['USDT'], abi=TestToken.abi, owner=conf.acct)
-    bal = tokenContract.balanceOf(conf.contracts['ConverterUSDT'])
-    print("supply of USDT on swap", bal/1e18)
+    print(tabXUSD/tasXUSD)
+    print("liquidity on iUSDT", (tasXUSD-tabXUSD)/1e18)
+
+    print("supply of USDT on swap", balUSDT/1e18)
     
-    tokenContract = Contract.from_abi("Token", address=conf.contracts['WRBTC'], abi=TestToken.abi, owner=conf.acct)
-    bal = tokenContract.balanceOf(conf.contracts['ConverterUSDT'])
-    print("supply of rBTC on swap", bal/1e18)
+    print("supply of rBTC on swap", balRBTC/1e18)
 
 def testSwapsExternal(underlyingTokenAddress, collateralTokenAddress, amount):
-    sovryn = Contract.from_abi("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
-    underlyingToken = Contract.from_abi("TestToken", address=underlyingTokenAddress, abi=ERC20.abi, owner=conf.acct)
+    sovryn = getContract("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    underlyingToken = getContract("TestToken", address=underlyingTokenAddress, abi=ERC20.abi, owner=conf.acct)
 
     receiver = conf.acct
     tx = underlyingToken.approve(conf.contracts['sovrynProtocol'], amount)
@@ -677,11 +688,11 @@ def testSwapsExternal(underlyingTokenAddress, collateralTokenAddress, amount):
 # 1. make sure you have 3 times balance of underlyingTokenAddress
 # 2. make sure you have 2 times balance of amountCollateral
 def wrappedIntegrationTest(loanTokenAddress, underlyingTokenAddress, collateralTokenAddress, amountUnderlying, amountCollateral):
-    sovryn = Contract.from_abi("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    sovryn = getContract("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
 
-    underlyingToken = Contract.from_abi("TestToken", address=underlyingTokenAddress, abi=ERC20.abi, owner=conf.acct)
-    collateralToken = Contract.from_abi("TestToken", address=collateralTokenAddress, abi=ERC20.abi, owner=conf.acct)
+    underlyingToken = getContract("TestToken", address=underlyingTokenAddress, abi=ERC20.abi, owner=conf.acct)
+    collateralToken = getContract("TestToken", address=collateralTokenAddress, abi=ERC20.abi, owner=conf.acct)
     
     prevUnderlyingBalance = underlyingToken.balanceOf(conf.acct)
     prevCollateralBalance = collateralToken.balanceOf(conf.acct)
@@ -837,53 +848,69 @@ def wrappedIntegrationTest(loanTokenAddress, underlyingTokenAddress, collateralT
     print(errorMsg)
 
 def getDepositAmountForBorrow(loanTokenAddress, borrowAmount, initialLoanDuration, collateralTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     result = loanToken.getDepositAmountForBorrow(borrowAmount, initialLoanDuration, collateralTokenAddress)
     print(result)
 
 def isLoanTokenLogicBeaconLMPaused():
-    loanTokenLogicBeaconLM = Contract.from_abi("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconLM = getContract("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     print('isLoanTokenLogicBeaconLMPaused:', loanTokenLogicBeaconLM.paused())
 
-def pauseLoanTokenLogicBeaconLM():
-    loanTokenLogicBeaconLM = Contract.from_abi("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+def pauseLoanTokenLogicBeaconLM(batch = None):
+    loanTokenLogicBeaconLM = getContract("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    requireBatchRole(batch, lambda executor: executor in [loanTokenLogicBeaconLM.pauser(), loanTokenLogicBeaconLM.owner()], "pauser of LoanTokenLogicBeaconLM (setBatchExecutorAsLoanTokenLogicBeaconsPauser)")
+    submit = batch.add if batch != None else lambda contractAddress, data: sendWithMultisig(conf.contracts['multisig'], contractAddress, data, conf.acct)
     data = loanTokenLogicBeaconLM.pause.encode_input()
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconLM.address, data, conf.acct)
+    submit(loanTokenLogicBeaconLM.address, data)
 
-def unpauseLoanTokenLogicBeaconLM():
-    loanTokenLogicBeaconLM = Contract.from_abi("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+def unpauseLoanTokenLogicBeaconLM(batch = None):
+    loanTokenLogicBeaconLM = getContract("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    requireBatchRole(batch, lambda executor: executor in [loanTokenLogicBeaconLM.pauser(), loanTokenLogicBeaconLM.owner()], "pauser of LoanTokenLogicBeaconLM (setBatchExecutorAsLoanTokenLogicBeaconsPauser)")
+    submit = batch.add if batch != None else lambda contractAddress, data: sendWithMultisig(conf.contracts['multisig'], contractAddress, data, conf.acct)
     data = loanTokenLogicBeaconLM.unpause.encode_input()
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconLM.address, data, conf.acct)
+    submit(loanTokenLogicBeaconLM.address, data)
 
 def isLoanTokenLogicBeaconWRBTCPaused():
-    loanTokenLogicBeaconWRBTC = Contract.from_abi("loanTokenLogicBeaconWRBTC", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconWRBTC = getContract("loanTokenLogicBeaconWRBTC", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     print('isLoanTokenLogicBeaconWRBTCPaused:', loanTokenLogicBeaconWRBTC.paused())
 
 def areAllLendingPoolsPaused():
     isLoanTokenLogicBeaconLMPaused()
     isLoanTokenLogicBeaconWRBTCPaused()
 
-def pauseLoanTokenLogicBeaconWRBTC():
-    loanTokenLogicBeaconWRBTC = Contract.from_abi("loanTokenLogicBeaconWRBTC", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+def pauseLoanTokenLogicBeaconWRBTC(batch = None):
+    loanTokenLogicBeaconWRBTC = getContract("loanTokenLogicBeaconWRBTC", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    requireBatchRole(batch, lambda executor: executor in [loanTokenLogicBeaconWRBTC.pauser(), loanTokenLogicBeaconWRBTC.owner()], "pauser of LoanTokenLogicBeaconWrbtc (setBatchExecutorAsLoanTokenLogicBeaconsPauser)")
+    submit = batch.add if batch != None else lambda contractAddress, data: sendWithMultisig(conf.contracts['multisig'], contractAddress, data, conf.acct)
     data = loanTokenLogicBeaconWRBTC.pause.encode_input()
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconWRBTC.address, data, conf.acct)
+    submit(loanTokenLogicBeaconWRBTC.address, data)
 
-def unpauseLoanTokenLogicBeaconWRBTC():
-    loanTokenLogicBeaconWRBTC = Contract.from_abi("loanTokenLogicBeaconWRBTC", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+def unpauseLoanTokenLogicBeaconWRBTC(batch = None):
+    loanTokenLogicBeaconWRBTC = getContract("loanTokenLogicBeaconWRBTC", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    requireBatchRole(batch, lambda executor: executor in [loanTokenLogicBeaconWRBTC.pauser(), loanTokenLogicBeaconWRBTC.owner()], "pauser of LoanTokenLogicBeaconWrbtc (setBatchExecutorAsLoanTokenLogicBeaconsPauser)")
+    submit = batch.add if batch != None else lambda contractAddress, data: sendWithMultisig(conf.contracts['multisig'], contractAddress, data, conf.acct)
     data = loanTokenLogicBeaconWRBTC.unpause.encode_input()
-    sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconWRBTC.address, data, conf.acct)
+    submit(loanTokenLogicBeaconWRBTC.address, data)
 
-def pauseAllLoanTokens():
-    pauseLoanTokenLogicBeaconLM()
-    pauseLoanTokenLogicBeaconWRBTC()
+def setBatchExecutorAsLoanTokenLogicBeaconsPauser():
+    # the BatchExecutor replaces the current pauser (a beacon has only one), so pauseAllLoanTokens/unpauseAllLoanTokens can be batched
+    for beaconName in ['LoanTokenLogicBeaconLM', 'LoanTokenLogicBeaconWrbtc']:
+        loanTokenLogicBeacon = getContract(beaconName, address=conf.contracts[beaconName], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+        print(beaconName, "pauser:", loanTokenLogicBeacon.pauser())
+        data = loanTokenLogicBeacon.setPauser.encode_input(conf.contracts['BatchExecutor'])
+        sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeacon.address, data, conf.acct)
 
-def unpauseAllLoanTokens():
-    unpauseLoanTokenLogicBeaconLM()
-    unpauseLoanTokenLogicBeaconWRBTC()
+def pauseAllLoanTokens(batch = None):
+    pauseLoanTokenLogicBeaconLM(batch)
+    pauseLoanTokenLogicBeaconWRBTC(batch)
+
+def unpauseAllLoanTokens(batch = None):
+    unpauseLoanTokenLogicBeaconLM(batch)
+    unpauseLoanTokenLogicBeaconWRBTC(batch)
 
 def get_estimated_margin_details(collateralToken, loanSize, collateralTokenSent, leverageAmount):
             
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=acct)
     result = loanToken.getEstimatedMarginDetails.call(leverageAmount, 0, collateralTokenSent, collateralToken.address)
     
     assert(result[0] == loanSize * collateralTokenSent * leverageAmount / 1e36)
@@ -901,12 +928,12 @@ def replaceLoanTokenSettingsLowerAdmin():
     loanTokenSettingsLowerAdmin = conf.acct.deploy(LoanTokenSettingsLowerAdmin)
     print("LoanTokenSettingsLowerAdmin for BeaconLM module deployed at: ", loanTokenSettingsLowerAdmin.address)
 
-    loanTokenLogicBeaconLM = Contract.from_abi("LoanTokenLogicBeacon", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconLM = getContract("LoanTokenLogicBeacon", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     print("Registering Loan Protocol Settings Module to LoanTOkenLogicBeaconLM")
     data = loanTokenLogicBeaconLM.registerLoanTokenModule.encode_input(loanTokenSettingsLowerAdmin.address)
     sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconLM.address, data, conf.acct)
 
-    loanTokenLogicBeaconWrbtc = Contract.from_abi("LoanTokenLogicBeacon", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconWrbtc = getContract("LoanTokenLogicBeacon", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     print("Registering Loan Protocol Settings Module to LoanTOkenLogicBeaconWrbtc")
     data = loanTokenLogicBeaconWrbtc.registerLoanTokenModule.encode_input(loanTokenSettingsLowerAdmin.address)
     sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconWrbtc.address, data, conf.acct)
@@ -914,92 +941,92 @@ def replaceLoanTokenSettingsLowerAdmin():
 def transferBeaconOwnershipToGovernance():
     # transfer beacon LM
     print("Transferring beacon LM ownserhip to: ", conf.contracts['TimelockOwner'])
-    loanTokenLogicBeaconLM = Contract.from_abi("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconLM = getContract("loanTokenLogicBeaconLM", address=conf.contracts['LoanTokenLogicBeaconLM'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     data = loanTokenLogicBeaconLM.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconLM.address, data, conf.acct)
 
     # transfer beacon wrbtc
     print("Transferring beacon WRBTC ownserhip to: ", conf.contracts['TimelockOwner'])
-    loanTokenLogicBeaconWrbtc = Contract.from_abi("loanTokenLogicBeaconWrbtc", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
+    loanTokenLogicBeaconWrbtc = getContract("loanTokenLogicBeaconWrbtc", address=conf.contracts['LoanTokenLogicBeaconWrbtc'], abi=LoanTokenLogicBeacon.abi, owner=conf.acct)
     data = loanTokenLogicBeaconWrbtc.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanTokenLogicBeaconWrbtc.address, data, conf.acct)
 
 def transferLoanTokenAdminRoleToGovernance():
     # iDOC
     print("Transferring iDOC admin to: ", conf.contracts['TimelockAdmin'])
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iDOC'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iDOC'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iRBTC
     print("Transferring iRBTC admin to: ", conf.contracts['TimelockAdmin'])
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iXUSD
     print("Transferring iXUSD admin to: ", conf.contracts['TimelockAdmin'])
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iXUSD'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iXUSD'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iUSDT
     print("Transferring iUSDT admin to: ", conf.contracts['TimelockAdmin'])
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iUSDT'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iUSDT'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iBPro
     print("Transferring iBPro admin to: ", conf.contracts['TimelockAdmin'])
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iBPro'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iBPro'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iDLLR
     print("Transferring iDLLR admin to: ", conf.contracts['TimelockAdmin'])
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iDLLR'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iDLLR'], abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     data = loanToken.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def transferLoanTokenOwnershipToGovernance():
     # iDOC
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iDOC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iDOC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print("Transferring iDOC ownserhip to: ", conf.contracts['TimelockOwner'])
     data = loanToken.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iRBTC
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iRBTC'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print("Transferring iRBTC ownserhip to: ", conf.contracts['TimelockOwner'])
     data = loanToken.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iXUSD
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iXUSD'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iXUSD'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print("Transferring iXUSD ownserhip to: ", conf.contracts['TimelockOwner'])
     data = loanToken.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iUSDT
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iUSDT'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iUSDT'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print("Transferring iUSDT ownserhip to: ", conf.contracts['TimelockOwner'])
     data = loanToken.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iBPro
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iBPro'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iBPro'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print("Transferring iBPro ownserhip to: ", conf.contracts['TimelockOwner'])
     data = loanToken.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
     # iDLLR
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts['iDLLR'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=conf.contracts['iDLLR'], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print("Transferring iDLLR ownserhip to: ", conf.contracts['TimelockOwner'])
     data = loanToken.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], loanToken.address, data, conf.acct)
 
 def readLoanTokenStorage(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStorage.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStorage.abi, owner=conf.acct)
     print(loanToken.sovrynContractAddress())
     print(loanToken.wrbtcTokenAddress())
     print(loanToken.target_())
@@ -1009,20 +1036,29 @@ def readLoanTokenStorage(loanTokenAddress):
     #print(loanToken.liquidityMiningAddress())
 
 def getTotalAssetSupply(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenLogicStandard.abi, owner=conf.acct)
     print(loanToken.totalAssetSupply())
     return loanToken.totalAssetSupply()
 
-def readDemandCurve(loanTokenAddress):
-    loanToken = Contract.from_abi("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
-    print('base rate', loanToken.baseRate())
-    print('rate multiplier', loanToken.rateMultiplier())
-    print('lowUtilBaseRate', loanToken.lowUtilBaseRate())
-    print('lowUtilRateMultiplier', loanToken.lowUtilRateMultiplier())
-
-    print('targetLevel',loanToken.targetLevel())
-    print('kinkLevel', loanToken.kinkLevel())
-    print('maxScaleRate', loanToken.maxScaleRate())
+def readDemandCurve(loanTokenAddress, batched=True):
+    loanToken = getContract("loanToken", address=loanTokenAddress, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    baseRate, rateMultiplier, lowUtilBaseRate, lowUtilRateMultiplier, targetLevel, kinkLevel, maxScaleRate = readCalls([
+        (loanToken.baseRate,),
+        (loanToken.rateMultiplier,),
+        (loanToken.lowUtilBaseRate,),
+        (loanToken.lowUtilRateMultiplier,),
+        (loanToken.targetLevel,),
+        (loanToken.kinkLevel,),
+        (loanToken.maxScaleRate,)
+    ], batched)
+    print('base rate', baseRate)
+    print('rate multiplier', rateMultiplier)
+    print('lowUtilBaseRate', lowUtilBaseRate)
+    print('lowUtilRateMultiplier', lowUtilRateMultiplier)
+
+    print('targetLevel', targetLevel)
+    print('kinkLevel', kinkLevel)
+    print('maxScaleRate', maxScaleRate)
 
 '''
 Deploys a single loan token contract and sets it up
@@ -1041,11 +1077,11 @@ def deployLoanToken(loanTokenAddress, loanTokenSymbol, loanTokenName, baseRate,r
     loanToken.initialize(loanTokenAddress, loanTokenName, loanTokenSymbol)#symbol and name might be mixed up
     
     print("setting the beacon at the proxy")
-    loanTokenWithProxyABI = Contract.from_abi("loanTokenWithProxyABI", address=loanToken.address, abi=LoanTokenLogicProxy.abi, owner=conf.acct)
+    loanTokenWithProxyABI = getContract("loanTokenWithProxyABI", address=loanToken.address, abi=LoanTokenLogicProxy.abi, owner=conf.acct)
     loanTokenWithProxyABI.setBeaconAddress(conf.contracts['LoanTokenLogicBeaconLM'])
 
     print("setting the interest curve")
-    loanToken = Contract.from_abi("loanToken", address=loanToken.address, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
+    loanToken = getContract("loanToken", address=loanToken.address, abi=LoanTokenSettingsLowerAdmin.abi, owner=conf.acct)
     targetLevel = 0
     loanToken.setDemandCurve(baseRate,rateMultiplier,baseRate,rateMultiplier, targetLevel, kinkLevel, maxScaleRate)
 
@@ -1094,7 +1130,7 @@ def deployLoanToken(loanTokenAddress, loanTokenSymbol, loanTokenName, baseRate,r
     #configure the token settings, and set the setting contract address at the loan token logic contract
     loanToken.setupLoanParams(params, True)
 
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
 
     
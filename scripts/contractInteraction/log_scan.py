@@ -0,0 +1,41 @@
+'''
+Parallel eth_getLogs over large block ranges.
+
+The range is split into windows fetched concurrently. A window the node refuses (too many results,
+timeout) is split in halves until it goes through, so dense ranges do not fail the whole scan.
+
+usage:
+    logs = getLogsParallel({'address': tokenSender.address, 'topics': [topic]}, fromBlock, toBlock)
+'''
+from brownie import *
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from scripts.contractInteraction.rpc_stats import callingHelper, runAsHelper
+
+# RPC errors after which a window is split, e.g. "query returned more than 10000 results" or a timeout
+RANGE_ERRORS = (ValueError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+def getLogsRange(logFilter, fromBlock, toBlock):
+    '''
+    logs of [fromBlock, toBlock], the range is halved recursively on RANGE_ERRORS
+    '''
+    try:
+        return list(web3.eth.getLogs(dict(logFilter, fromBlock=fromBlock, toBlock=toBlock)))
+    except RANGE_ERRORS:
+        if fromBlock == toBlock:
+            raise
+        middle = (fromBlock + toBlock) // 2
+        return getLogsRange(logFilter, fromBlock, middle) + getLogsRange(logFilter, middle + 1, toBlock)
+
+def getLogsParallel(logFilter, fromBlock, toBlock, step=10000, concurrency=8):
+    '''
+    logFilter - eth_getLogs filter without the block range
+    returns the logs of [fromBlock, toBlock] sorted by block and log index
+    '''
+    windows = [(start, min(start + step - 1, toBlock)) for start in range(fromBlock, toBlock + 1, step)]
+    helper = callingHelper()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda window: runAsHelper(helper, getLogsRange, logFilter, window[0], window[1]), windows))
+    logs = [log for result in results for log in result]
+    logs.sort(key=lambda log: (log['blockNumber'], log['logIndex']))
+    return logs
@@ -6,18 +6,19 @@ import copy
 from scripts.utils import *
 from scripts.contractInteraction.token import * 
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract, loadAbi
 from scripts.contractInteraction.loan_tokens import getTokenPrice, setPauser
 from scripts.contractInteraction.staking_vesting import addStakingPauser, removeStakingPauser
 from scripts.contractInteraction.fastbtc import addFastBTCPauser, removeFastBTCPauser
 
 
 def readClaimBalanceOrigin(address):
-    originClaimContract = Contract.from_abi("originClaim", address=conf.contracts['OriginInvestorsClaim'], abi=OriginInvestorsClaim.abi, owner=conf.acct)
+    originClaimContract = getContract("originClaim", address=conf.contracts['OriginInvestorsClaim'], abi=OriginInvestorsClaim.abi, owner=conf.acct)
     amount = originClaimContract.investorsAmountsList(address)
     print(amount)
 
 def determineFundsAtRisk():
-    sovryn = Contract.from_abi("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    sovryn = getContract("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     borrowedPositions = []
     sum = 0
     possible = 0
@@ -40,10 +41,10 @@ def determineFundsAtRisk():
 
 
 def lookupCurrentPoolReserveBalances(userAddress):
-    wrbtc = Contract.from_abi("TestToken", address = conf.contracts['WRBTC'], abi = TestToken.abi, owner = conf.acct)
-    sov = Contract.from_abi("TestToken", address = conf.contracts['SOV'], abi = TestToken.abi, owner = conf.acct)
-    poolToken = Contract.from_abi("TestToken", address = conf.contracts['(WR)BTC/SOV'], abi = TestToken.abi, owner = conf.acct)
-    liquidityMining = Contract.from_abi("LiquidityMining", address = conf.contracts['LiquidityMiningProxy'], abi = LiquidityMining.abi, owner = conf.acct)
+    wrbtc = getContract("TestToken", address = conf.contracts['WRBTC'], abi = TestToken.abi, owner = conf.acct)
+    sov = getContract("TestToken", address = conf.contracts['SOV'], abi = TestToken.abi, owner = conf.acct)
+    poolToken = getContract("TestToken", address = conf.contracts['(WR)BTC/SOV'], abi = TestToken.abi, owner = conf.acct)
+    liquidityMining = getContract("LiquidityMining", address = conf.contracts['LiquidityMiningProxy'], abi = LiquidityMining.abi, owner = conf.acct)
 
     wrbtcBal = wrbtc.balanceOf(conf.contracts['WRBTCtoSOVConverter']) / 1e18
     sovBal = sov.balanceOf(conf.contracts['WRBTCtoSOVConverter']) / 1e18
@@ -58,17 +59,15 @@ def lookupCurrentPoolReserveBalances(userAddress):
     print('user has in BTC', userBal/poolSupply * wrbtcBal)
 
 def withdrawRBTCFromWatcher(amount, recipient):
-    abiFile =  open('./scripts/contractInteraction/ABIs/Watcher.json')
-    abi = json.load(abiFile)
-    watcher = Contract.from_abi("Watcher", address = conf.contracts['Watcher'], abi = abi, owner = conf.acct)
+    abi = loadAbi('Watcher')
+    watcher = getContract("Watcher", address = conf.contracts['Watcher'], abi = abi, owner = conf.acct)
     data = watcher.withdrawTokens.encode_input('0x0000000000000000000000000000000000000000', amount, recipient)
     print(data)
     sendWithMultisig(conf.contracts['multisig'], watcher.address, data, conf.acct)
 
 def withdrawTokensFromWatcher(token, amount, recipient):
-    abiFile =  open('./scripts/contractInteraction/ABIs/Watcher.json')
-    abi = json.load(abiFile)
-    watcher = Contract.from_abi("Watcher", address = conf.contracts['Watcher'], abi = abi, owner = conf.acct)
+    abi = loadAbi('Watcher')
+    watcher = getContract("Watcher", address = conf.contracts['Watcher'], abi = abi, owner = conf.acct)
     #watcher = Contract.from_abi("Watcher", address = '0x051B89f575fCd540F0a6a5B49c75f9a83BB2Cf07', abi = abi, owner = conf.acct)
     data = watcher.withdrawTokens.encode_input(token, amount, recipient)
     print(data)
@@ -76,11 +75,11 @@ def withdrawTokensFromWatcher(token, amount, recipient):
 
 
 def depositToLockedSOV(amount, recipient):
-    token = Contract.from_abi("Token", address= conf.contracts['SOV'], abi = TestToken.abi, owner=conf.acct)
+    token = getContract("Token", address= conf.contracts['SOV'], abi = TestToken.abi, owner=conf.acct)
     data = token.approve.encode_input(conf.contracts["LockedSOV"], amount)
     sendWithMultisig(conf.contracts['multisig'], token.address, data, conf.acct)
 
-    lockedSOV = Contract.from_abi("LockedSOV", address=conf.contracts["LockedSOV"], abi=LockedSOV.abi, owner=conf.acct)
+    lockedSOV = getContract("LockedSOV", address=conf.contracts["LockedSOV"], abi=LockedSOV.abi, owner=conf.acct)
     data = lockedSOV.depositSOV.encode_input(recipient, amount)
     print(data)
     sendWithMultisig(conf.contracts['multisig'], lockedSOV.address, data, conf.acct)
@@ -90,7 +89,7 @@ def deployFeeSharingCollector():
     feeSharingCollector = conf.acct.deploy(FeeSharingCollector)
     print("Fee sharing collector redeployed at: ", feeSharingCollector.address)
     print("Setting implementation for FeeSharingCollectorProxy")
-    feeSharingCollectorProxy = Contract.from_abi("FeeSharingCollectorProxy", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
+    feeSharingCollectorProxy = getContract("FeeSharingCollectorProxy", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
     data = feeSharingCollectorProxy.setImplementation.encode_input(feeSharingCollector.address)
     sendWithMultisig(conf.contracts['multisig'], feeSharingCollectorProxy.address, data, conf.acct)
 
@@ -100,7 +99,7 @@ def replaceTx(txStr, newGas):
 
 #gets the logic contract for a proxy
 def getImplementation(proxyContract):
-    proxy = Contract.from_abi("FeeSharingCollectorProxy", address=proxyContract, abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
+    proxy = getContract("FeeSharingCollectorProxy", address=proxyContract, abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
     print(proxy.getImplementation())
     
 def setNewContractGuardian():
@@ -132,9 +131,8 @@ def setNewContractGuardian():
 
 
 def openTrove(_maxFeePercentage, _ZUSDAmount, _upperHint, _lowerHint, coll):
-    abiFile =  open('./scripts/contractInteraction/ABIs/BorrowerOperations.json')
-    abi = json.load(abiFile)
-    borrowerOperations = Contract.from_abi("bo", address=conf.contracts['borrowerOperations'], abi=abi, owner=conf.acct)
+    abi = loadAbi('BorrowerOperations')
+    borrowerOperations = getContract("bo", address=conf.contracts['borrowerOperations'], abi=abi, owner=conf.acct)
     borrowerOperations.openTrove(_maxFeePercentage, _ZUSDAmount, _upperHint, _lowerHint, {'value':coll})
 
 def distributeMissedFees():
@@ -146,15 +144,15 @@ def distributeMissedFees():
     Total_RBTC = Total_RBTC_DUMMY + Total_WRBTC + Total_iWRBTC * (getTokenPrice(conf.contracts['iRBTC'])/(10**18))
     print(Total_RBTC)
     
-    feeSharingCollector = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    feeSharingCollector = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
 
-    token = Contract.from_abi("Token", address= conf.contracts['SOV'], abi = TestToken.abi, owner=conf.acct)
+    token = getContract("Token", address= conf.contracts['SOV'], abi = TestToken.abi, owner=conf.acct)
     data = token.approve.encode_input(feeSharingCollector.address, Total_SOV * 10**18)
     sendWithMultisig(conf.contracts['multisig'], conf.contracts['SOV'] , data, conf.acct)
     data = feeSharingCollector.transferTokens.encode_input(conf.contracts['SOV'], Total_SOV * 10**18)
     sendWithMultisig(conf.contracts['multisig'], feeSharingCollector.address , data, conf.acct)
 
-    token = Contract.from_abi("Token", address= conf.contracts['ZUSD'], abi = TestToken.abi, owner=conf.acct)
+    token = getContract("Token", address= conf.contracts['ZUSD'], abi = TestToken.abi, owner=conf.acct)
     data = token.approve.encode_input(feeSharingCollector.address, Total_ZUSD * 10**18)
     sendWithMultisig(conf.contracts['multisig'], conf.contracts['ZUSD'] , data, conf.acct)
     data = feeSharingCollector.transferTokens.encode_input(conf.contracts['ZUSD'], Total_ZUSD * 10**18)
@@ -165,7 +163,7 @@ def distributeMissedFees():
     
 
 def getFeeSharingState(tokenAddress):
-    feeSharingCollector = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    feeSharingCollector = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
     numCheckpoints = feeSharingCollector.numTokenCheckpoints(tokenAddress)
     print("num checkpoints:", numCheckpoints)
     lastCheckpoint = feeSharingCollector.tokenCheckpoints(tokenAddress, numCheckpoints-1)
@@ -174,12 +172,12 @@ def getFeeSharingState(tokenAddress):
     print("unprocessed amount:", unprocessed)
 
 def RBTC_DUMMY_ADDRESS_FOR_CHECKPOINT():
-    feeSharingCollector = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    feeSharingCollector = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
     return feeSharingCollector.RBTC_DUMMY_ADDRESS_FOR_CHECKPOINT()
 
 def transferTokens(tokenAddress, amount):
-    feeSharingCollector = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
-    token = Contract.from_abi("Token", address= tokenAddress, abi = TestToken.abi, owner=conf.acct)
+    feeSharingCollector = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    token = getContract("Token", address= tokenAddress, abi = TestToken.abi, owner=conf.acct)
     data = token.approve.encode_input(feeSharingCollector.address, amount)
     sendWithMultisig(conf.contracts['multisig'], tokenAddress , data, conf.acct)
     data = feeSharingCollector.transferTokens.encode_input(tokenAddress, amount)
@@ -0,0 +1,137 @@
+'''
+Batched on-chain reads through the Multicall contract (contracts/utils/Multicall.sol).
+
+Instead of one eth_call per value, calls are collected and executed in a single eth_call
+pinned to one block, then decoded with the ABI of each called method.
+
+usage:
+    batch = MulticallBatch()
+    batch.add(loanToken.totalAssetSupply)
+    batch.add(token.balanceOf, holder)
+    totalAssetSupply, balance = batch.execute()
+
+    # or, for helpers that can run both ways
+    totalAssetSupply, balance = readCalls([(loanToken.totalAssetSupply,), (token.balanceOf, holder)], batched=True)
+
+    # thousands of calls: split into concurrent Multicall batches pinned to one block
+    balances = readCallsChunked([(token.balanceOf, holder) for holder in holders])
+
+The Multicall address is taken from conf.contracts['Multicall'] (deploy it with deployMulticall()).
+If it is not deployed on the network the batch falls back to JSON-RPC batched eth_calls on the same block.
+'''
+from brownie import *
+from concurrent.futures import ThreadPoolExecutor
+from hexbytes import HexBytes
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract
+from scripts.contractInteraction.rpc_batch import getRpcBatchClient, isHttpEndpoint
+from scripts.contractInteraction.rpc_stats import callingHelper, runAsHelper
+
+class MulticallBatch:
+    '''
+    multicallAddress - defaults to conf.contracts['Multicall']
+    blockIdentifier - block number to pin the reads to, defaults to the latest block
+    allowFailure - if True a failed call returns None instead of reverting the whole batch
+    '''
+    def __init__(self, multicallAddress=None, blockIdentifier=None, allowFailure=False):
+        self.multicallAddress = multicallAddress if multicallAddress != None else conf.contracts.get('Multicall')
+        self.blockIdentifier = blockIdentifier
+        self.allowFailure = allowFailure
+        self.calls = []
+        self.blockNumber = None
+
+    def add(self, method, *args):
+        '''
+        queues a call of a brownie contract method, e.g. batch.add(token.balanceOf, holder)
+        returns the index of the call result
+        '''
+        self.calls.append((method, str(method._address), method.encode_input(*args)))
+        return len(self.calls) - 1
+
+    def __len__(self):
+        return len(self.calls)
+
+    def execute(self):
+        '''
+        executes the queued calls and returns the decoded results in the order they were added
+        '''
+        if len(self.calls) == 0:
+            return []
+        if self.multicallAddress == None:
+            return self._executeWithoutMulticall()
+        multicall = getContract("Multicall", address=self.multicallAddress, abi=Multicall.abi, owner=conf.acct)
+        data = multicall.tryBlockAndAggregate.encode_input(not self.allowFailure, [[target, callData] for (method, target, callData) in self.calls])
+        blockIdentifier = self.blockIdentifier if self.blockIdentifier != None else 'latest'
+        raw = web3.eth.call({'to': multicall.address, 'data': data}, blockIdentifier)
+        blockNumber, results = multicall.tryBlockAndAggregate.decode_output(raw)
+        self.blockNumber = blockNumber
+        decoded = []
+        for i in range(0, len(results)):
+            success, returnData = results[i]
+            decoded.append(self._decode(self.calls[i][0], success, returnData))
+        return decoded
+
+    def _executeWithoutMulticall(self):
+        # no Multicall on this network: send the calls as JSON-RPC batches pinned to one block instead
+        self.blockNumber = self.blockIdentifier if self.blockIdentifier != None else web3.eth.blockNumber
+        useRpcBatch = isHttpEndpoint()
+        if useRpcBatch:
+            client = getRpcBatchClient()
+            futures = [client.ethCall(target, callData, self.blockNumber) for (method, target, callData) in self.calls]
+            client.flush()
+        decoded = []
+        for i in range(0, len(self.calls)):
+            (method, target, callData) = self.calls[i]
+            try:
+                if useRpcBatch:
+                    returnData = futures[i].result()
+                else:
+                    returnData = web3.eth.call({'to': target, 'data': callData}, self.blockNumber)
+                success = True
+            except ValueError:
+                if not self.allowFailure:
+                    raise
+                returnData = None
+                success = False
+            decoded.append(self._decode(method, success, returnData))
+        return decoded
+
+    def _decode(self, method, success, returnData):
+        if not success or len(HexBytes(returnData)) == 0:
+            if self.allowFailure:
+                return None
+            raise Exception("Multicall: call to " + method._name + " failed")
+        return method.decode_output(returnData)
+
+def readCalls(calls, batched=True, blockIdentifier=None, allowFailure=False):
+    '''
+    calls - list of (contract method, arg1, arg2, ...) tuples, e.g. [(loanToken.totalSupply,), (token.balanceOf, holder)]
+    batched - read everything with a single Multicall eth_call, otherwise call the methods one by one
+    returns the values in the order of calls
+    '''
+    if batched:
+        batch = MulticallBatch(blockIdentifier=blockIdentifier, allowFailure=allowFailure)
+        for call in calls:
+            batch.add(call[0], *call[1:])
+        return batch.execute()
+    return [call[0](*call[1:]) for call in calls]
+
+def readCallsChunked(calls, chunkSize=200, concurrency=4, blockIdentifier=None, allowFailure=False):
+    '''
+    readCalls for long call lists: Multicall batches of chunkSize calls, up to concurrency batches in flight
+    all batches are pinned to the same block (defaults to the latest one)
+    '''
+    if len(calls) == 0:
+        return []
+    if blockIdentifier is None:
+        blockIdentifier = web3.eth.blockNumber
+    chunks = [calls[i:i + chunkSize] for i in range(0, len(calls), chunkSize)]
+    helper = callingHelper()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda chunk: runAsHelper(helper, readCalls, chunk, True, blockIdentifier, allowFailure), chunks))
+    return [value for chunkResults in results for value in chunkResults]
+
+def deployMulticall():
+    multicall = conf.acct.deploy(Multicall)
+    print("Multicall deployed at:", multicall.address, "- add it to the network contracts json as 'Multicall'")
+    return multicall
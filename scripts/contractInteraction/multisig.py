@@ -3,29 +3,32 @@ from brownie.network.contract import InterfaceContainer
 import json
 import time;
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from scripts.utils import * 
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract, loadAbi
+from scripts.contractInteraction.multicall import readCallsChunked
 
 def sendFromMultisig(receiver, amount):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     tx = multisig.submitTransaction(receiver,amount,b'')
     txId = tx.events["Submission"]["transactionId"]
     print(txId)
 
 def sendTokensFromMultisig(token, receiver, amount):
-    tokenContract = Contract.from_abi("Token", address=token, abi=TestToken.abi, owner=conf.acct)
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    tokenContract = getContract("Token", address=token, abi=TestToken.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     data = tokenContract.transfer.encode_input(receiver, amount)
     print(data)
     sendWithMultisig(conf.contracts['multisig'], token, data, conf.acct)
 
 def executeOnMultisig(transactionId):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
 
     multisig.executeTransaction(transactionId)
 
 def revokeConfirmation(transactionId):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
 
     multisig.revokeConfirmation(transactionId)
 
@@ -34,63 +37,167 @@ def deployMultisig(owners, requiredConf):
      multisig = conf.acct.deploy(MultiSigWallet, owners, requiredConf)
      print("multisig:", multisig)
 
+def deployBatchExecutor():
+    batchExecutor = conf.acct.deploy(BatchExecutor)
+    batchExecutor.transferOwnership(conf.contracts['multisig'])
+    print("BatchExecutor deployed at:", batchExecutor.address, "owned by the multisig - add it to the network contracts json as 'BatchExecutor'")
+    return batchExecutor
+
     
 def printMultisigOwners():
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     print(multisig.getOwners())
 
 def isMultisigOwner(address):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     print(multisig.isOwner(address))
 
 def printMultisigOwnersOnAny(multisigAddress):
-    multisig = Contract.from_abi("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
     print(multisig.getOwners())
 
 def replaceOwnerOnMultisig(multisig, oldOwner, newOwner):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     data = multisig.replaceOwner.encode_input(oldOwner, newOwner)
     sendWithMultisig(multisig, multisig, data, conf.acct)
 
 def transferOwnershipFromMultisig(contract, newOwner):
-    contract = Contract.from_abi("ownable", address=contract, abi=LoanToken.abi, owner=conf.acct)
-    multisig = Contract.from_abi("MultiSig", address = conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    contract = getContract("ownable", address=contract, abi=LoanToken.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address = conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     data = contract.transferOwnership.encode_input(newOwner)
     sendWithMultisig(multisig, contract, data, conf.acct)
 
 def confirmWithMS(txId):
-    multisig = Contract.from_abi("MultiSig", address = conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address = conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     multisig.confirmTransaction(txId)
 
 def confirmWithBFMS(txId):
-    multisig = Contract.from_abi("MultiSig", address = conf.contracts['BFmultisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address = conf.contracts['BFmultisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     multisig.confirmTransaction(txId)
 
 def confirmWithAnyMS(txId, multisigaddress):
-    multisig = Contract.from_abi("MultiSig", address = multisigaddress, abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address = multisigaddress, abi=MultiSigWallet.abi, owner=conf.acct)
     multisig.confirmTransaction(txId)
 
 def revokeConfirmationMS(txId):
-    multisig = Contract.from_abi("MultiSig", address = conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address = conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     multisig.revokeConfirmation(txId)
 
-def confirmMultipleTxsWithMS(txIdFrom, txIdTo):
-    for i in range(txIdFrom, txIdTo + 1): # the right boundary processed to the value-1, so adding 1
-        confirmWithMS(i)
-        checkTx(i)
+def confirmMultipleTxsWithMS(txIdFrom, txIdTo, multisigAddress = None, maxInFlight = 8, executionGasLimit = None, gasBuffer = 1.2, receiptTimeout = 600):
+    '''
+    confirms the multisig txs txIdFrom..txIdTo (both included) in txId order
+    - the state of the whole range is read in one batch, txs already executed or confirmed by conf.acct are skipped
+    - confirmations that do not execute the tx are sent back to back with local nonces in txId order,
+      up to maxInFlight awaiting their receipts concurrently
+    - a confirmation that executes the tx (the last one missing) is sent once all the previous ones are mined
+      and mined before the next one is sent, so dependent txs (e.g. an upgrade, then calls to the new logic)
+      run in order and their gas is estimated on the state they execute on
+      a failed confirmation or execution stops the confirmations of the rest of the range
+    - a status table of the range is printed at the end, also if the run is interrupted
+      (confirmations whose receipts could not be awaited are reported as unknown)
+    multisigAddress - defaults to conf.contracts['multisig']
+    executionGasLimit - gas limit of the executing confirmations instead of the estimate, MultiSigWallet does not revert
+                        when the executed call fails, so an estimate can succeed with too little gas for the call
+    receiptTimeout - seconds to await the receipts of the sent confirmations
+    '''
+    multisigAddress = multisigAddress if multisigAddress != None else conf.contracts['multisig']
+    multisig = getContract("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
+    txIds = list(range(txIdFrom, txIdTo + 1)) # the right boundary processed to the value-1, so adding 1
+    sender = conf.acct.address
+    calls = [(multisig.transactionCount,), (multisig.required,)]
+    for txId in txIds:
+        calls += [(multisig.transactions, txId), (multisig.confirmations, txId, sender), (multisig.getConfirmationCount, txId)]
+    values = readCallsChunked(calls)
+    transactionCount, required = values[0], values[1]
+    status = {}
+    toConfirm = []
+    for i, txId in enumerate(txIds):
+        transaction, confirmed, confirmations = values[2 + 3 * i], values[3 + 3 * i], values[4 + 3 * i]
+        if txId >= transactionCount:
+            status[txId] = "skipped: not submitted"
+        elif transaction[3]:
+            status[txId] = "skipped: executed"
+        elif confirmed:
+            status[txId] = "skipped: confirmed"
+        else:
+            toConfirm.append((txId, confirmations + 1 >= required))
+    print("txs:", len(txIds), "to confirm:", len(toConfirm), "executing:", len([txId for txId, executes in toConfirm if executes]))
+
+    executionFailure = web3.keccak(text="ExecutionFailure(uint256)")
+    nonce = web3.eth.getTransactionCount(sender, 'pending')
+    pending = []
+
+    def send(txId, gasLimit):
+        # estimate first: a reverting estimate must not consume a nonce
+        nonlocal nonce
+        gasLimit = gasLimit if gasLimit != None else int(multisig.confirmTransaction.estimate_gas(txId, {'from': conf.acct}) * gasBuffer)
+        tx = multisig.confirmTransaction(txId, {'from': conf.acct, 'nonce': nonce, 'gas_limit': gasLimit, 'required_confs': 0})
+        nonce += 1
+        pending.append((txId, tx.txid))
+
+    def settle():
+        # awaits the pending confirmations, returns False if one of them failed
+        with ThreadPoolExecutor(max_workers=maxInFlight) as executor:
+            receipts = list(executor.map(lambda sent: web3.eth.waitForTransactionReceipt(sent[1], timeout=receiptTimeout), pending))
+        ok = True
+        for (txId, txid), receipt in zip(pending, receipts):
+            if receipt.status != 1:
+                status[txId] = "failed: reverted " + txid
+                ok = False
+            elif any(len(log['topics']) > 0 and log['topics'][0] == executionFailure for log in receipt.logs):
+                status[txId] = "confirmed, execution failed"
+                ok = False
+            else:
+                status[txId] = "confirmed"
+        pending.clear()
+        return ok
+
+    try:
+        for txId, executes in toConfirm:
+            try:
+                if executes:
+                    if not settle():
+                        break
+                    send(txId, executionGasLimit)
+                    if not settle():
+                        break
+                else:
+                    send(txId, None)
+                    if len(pending) >= maxInFlight and not settle():
+                        break
+            except Exception as e:
+                status[txId] = "failed: " + str(e)
+                break
+    finally:
+        try:
+            settle()
+        except Exception as e:
+            # the receipts could not be awaited (e.g. a timeout), the confirmations may still be mined
+            for txId, txid in pending:
+                status[txId] = "unknown: " + txid + " " + str(e)
+            pending.clear()
+        for txId, executes in toConfirm:
+            if txId not in status:
+                status[txId] = "skipped: stopped after a failure"
+
+        values = readCallsChunked([call for txId in txIds for call in [(multisig.transactions, txId), (multisig.getConfirmationCount, txId)]])
+        print("TX ID | confirmations | executed | status")
+        for i, txId in enumerate(txIds):
+            executed = values[2 * i][3] if txId < transactionCount else False
+            print(txId, "|", str(values[2 * i + 1]) + "/" + str(required), "|", executed, "|", status[txId])
 
 def checkTx(txId):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     print("TX ID: ",txId,"confirmations: ", multisig.getConfirmationCount(txId), " Executed:", multisig.transactions(txId)[3], " Confirmed by: ", multisig.getConfirmations(txId))
     print("TX:", multisig.transactions(txId))
 
 def checkTxOnBF(txId):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['BFmultisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['BFmultisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     print("TX ID: ",txId,"confirmations: ", multisig.getConfirmationCount(txId), " Executed:", multisig.transactions(txId)[3], " Confirmed by: ", multisig.getConfirmations(txId))
     print(multisig.transactions(txId))
 
 def checkTxOnAny(txId, multisigAddress):
-    multisig = Contract.from_abi("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
     print("TX ID: ",txId,"confirmations: ", multisig.getConfirmationCount(txId), " Executed:", multisig.transactions(txId)[3], " Confirmed by: ", multisig.getConfirmations(txId))
     print(multisig.transactions(txId))
 
@@ -103,7 +210,7 @@ def transferSOVtoTokenSender(amount):
         raise Exception("Invalid amount")
 
     tokenSenderAddress = conf.contracts['GenericTokenSender']
-    SOVtoken = Contract.from_abi("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=conf.acct)
+    SOVtoken = getContract("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=conf.acct)
     data = SOVtoken.transfer.encode_input(tokenSenderAddress, amount)
     print("Transfer",amount, "SOV from Multisig:", conf.contracts['multisig']," to GenericTokenSender:",tokenSenderAddress)
     print(data)
@@ -118,7 +225,7 @@ def transferXUSDtoTokenSender(amount):
     # amount = 4739700 * 10**16
 
     tokenSenderAddress = conf.contracts['GenericTokenSender']
-    token = Contract.from_abi("TestToken", address=conf.contracts['XUSD'], abi=TestToken.abi, owner=conf.acct)
+    token = getContract("TestToken", address=conf.contracts['XUSD'], abi=TestToken.abi, owner=conf.acct)
     data = token.transfer.encode_input(tokenSenderAddress, amount)
     print("Transfer",amount, "xUSD from Multisig:", conf.contracts['multisig']," to GenericTokenSender:",tokenSenderAddress)
     print(data)
@@ -132,7 +239,7 @@ def transferToTokenSender(currency, amount):
     # amount = 4739700 * 10**16
 
     tokenSenderAddress = conf.contracts['GenericTokenSender']
-    token = Contract.from_abi("TestToken", address=conf.contracts[currency], abi=TestToken.abi, owner=conf.acct)
+    token = getContract("TestToken", address=conf.contracts[currency], abi=TestToken.abi, owner=conf.acct)
     data = token.transfer.encode_input(tokenSenderAddress, amount)
     print("Transfer",amount,currency, "from Multisig:", conf.contracts['multisig']," to GenericTokenSender:",tokenSenderAddress)
     print(data)
@@ -149,22 +256,22 @@ def transferSOVtoAccount(receiver, amount):
     if(amount <= 0):
         raise Exception("Invalid amount")
 
-    SOVtoken = Contract.from_abi("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=conf.acct)
+    SOVtoken = getContract("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=conf.acct)
     data = SOVtoken.transfer.encode_input(receiver, amount)
     print("Transferring SOV from multisig to the distribution script runner address:")
     print(data)
     sendWithMultisig(conf.contracts['multisig'], SOVtoken.address, data, conf.acct)
 
 def addOwnerToMultisig(newOwner):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     data = multisig.addOwner.encode_input(newOwner)
     sendWithMultisig(conf.contracts['multisig'], conf.contracts['multisig'], data, conf.acct)
 
 def removeOwnerFromMultisig(newOwner):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     data = multisig.removeOwner.encode_input(newOwner)
     sendWithMultisig(conf.contracts['multisig'], conf.contracts['multisig'], data, conf.acct)
 
 def requiredConfirmations(multisigAddress):
-    multisig = Contract.from_abi("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=conf.acct)
     print(multisig.required())
\ No newline at end of file
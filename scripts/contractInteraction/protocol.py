@@ -5,16 +5,17 @@ import time
 import copy
 from scripts.utils import *
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract, loadAbi
 
 
 def isProtocolPaused():
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     print("isProtocolPaused: ", sovryn.isProtocolPaused())
 
 
 def readLendingFee():
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     lfp = sovryn.lendingFeePercent()
     print(lfp/1e18)
@@ -22,7 +23,7 @@ def readLendingFee():
 
 
 def readLoan(loanId):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     loan = sovryn.getLoan(loanId).dict()
     print('--------------------------------')
@@ -38,7 +39,7 @@ def readLoan(loanId):
 
 
 def liquidate(protocolAddress, loanId):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=protocolAddress, abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     loan = sovryn.getLoan(loanId).dict()
     print(loan)
@@ -47,7 +48,7 @@ def liquidate(protocolAddress, loanId):
         if(loan['loanToken'] == conf.contracts['WRBTC']):
             value = loan['maxLiquidatable']
         else:
-            testToken = Contract.from_abi(
+            testToken = getContract(
                 "TestToken", address=loan['loanToken'], abi=TestToken.abi, owner=conf.acct)
             testToken.approve(sovryn, loan['maxLiquidatable'])
         sovryn.liquidate(loanId, conf.acct,
@@ -57,14 +58,14 @@ def liquidate(protocolAddress, loanId):
 
 
 def rollover(loanId):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     tx = sovryn.rollover(loanId, b'')
     print(tx.info())
 
 
 def replaceLoanClosings():
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
 
     print('replacing loan closings liquidation')
@@ -88,7 +89,7 @@ def replaceLoanClosings():
 
 def replaceSwapsExternal():
     swapsExternal = conf.acct.deploy(SwapsExternal)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(swapsExternal.address)
     sendWithMultisig(conf.contracts['multisig'],
@@ -98,7 +99,7 @@ def replaceSwapsExternal():
 def replaceLoanOpenings():
     print("replacing loan openings")
     loanOpenings = conf.acct.deploy(LoanOpenings)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(loanOpenings.address)
     sendWithMultisig(conf.contracts['multisig'],
@@ -108,7 +109,7 @@ def replaceLoanOpenings():
 def replaceLoanSettings():
     print("replacing loan settigns")
     loanSettings = conf.acct.deploy(LoanSettings)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(loanSettings.address)
     sendWithMultisig(conf.contracts['multisig'],
@@ -118,7 +119,7 @@ def replaceLoanSettings():
 def replaceSwapsImplSovrynSwap():
     print("replacing swaps")
     swaps = conf.acct.deploy(SwapsImplSovrynSwap)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setSwapsImplContract.encode_input(swaps.address)
     sendWithMultisig(conf.contracts['multisig'],
@@ -126,7 +127,7 @@ def replaceSwapsImplSovrynSwap():
 
 
 def setLendingFee(fee):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setLendingFeePercent.encode_input(fee)
     sendWithMultisig(conf.contracts['multisig'],
@@ -134,7 +135,7 @@ def setLendingFee(fee):
 
 
 def setTradingFee(fee):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setTradingFeePercent.encode_input(fee)
     sendWithMultisig(conf.contracts['multisig'],
@@ -142,7 +143,7 @@ def setTradingFee(fee):
 
 
 def setBorrowingFee(fee):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setBorrowingFeePercent.encode_input(fee)
     sendWithMultisig(conf.contracts['multisig'],
@@ -150,7 +151,7 @@ def setBorrowingFee(fee):
 
 
 def setSwapExternalFee(fee):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setSwapExternalFeePercent.encode_input(fee)
     sendWithMultisig(conf.contracts['multisig'],
@@ -158,7 +159,7 @@ def setSwapExternalFee(fee):
 
 
 def setAffiliateFeePercent(fee):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setAffiliateFeePercent.encode_input(fee)
     print('sovryn.setAffiliateFeePercent for', fee, ' tx:')
@@ -167,7 +168,7 @@ def setAffiliateFeePercent(fee):
 
 
 def setAffiliateTradingTokenFeePercent(percentFee):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setAffiliateTradingTokenFeePercent.encode_input(percentFee)
     print('sovryn.setAffiliateTradingTokenFeePercent for ', percentFee, ' tx:')
@@ -176,7 +177,7 @@ def setAffiliateTradingTokenFeePercent(percentFee):
 
 
 def setMinReferralsToPayout(minReferrals):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setMinReferralsToPayoutAffiliates.encode_input(minReferrals)
     print('setMinReferralsToPayoutAffiliates set to ', minReferrals, ' tx:')
@@ -189,7 +190,7 @@ def replaceProtocolSettings():
     settings = conf.acct.deploy(ProtocolSettings)
 
     print("Calling replaceContract.")
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(settings.address)
     print(data)
@@ -203,7 +204,7 @@ def replaceLoanSettings():
     settings = conf.acct.deploy(LoanSettings)
 
     print("Calling replaceContract.")
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(settings.address)
     print(data)
@@ -219,7 +220,7 @@ def deployAffiliate():
 
     # -------------------------------- 2. Deploy the affiliates -----------------------------------------------
     affiliates = conf.acct.deploy(Affiliates)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(affiliates.address)
     print('affiliates deployed. data:')
@@ -296,7 +297,7 @@ def deployAffiliateWithZeroFeesPercent():
     # -------------------------------- 2. Deploy the affiliates -----------------------------------------------
 
     affiliates = conf.acct.deploy(Affiliates)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(affiliates.address)
     print('affiliates deployed. data:')
@@ -368,7 +369,7 @@ def deployAffiliateWithZeroFeesPercent():
 def replaceAffiliates():
     print("replacing Affiliates")
     affiliates = conf.acct.deploy(Affiliates)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(affiliates.address)
     print(data)
@@ -380,7 +381,7 @@ def replaceAffiliates():
 def replaceLoanMaintenance():
     print("replacing loan maintenance")
     loanMaintenance = conf.acct.deploy(LoanMaintenance)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(loanMaintenance.address)
     print(data)
@@ -392,7 +393,7 @@ def replaceLoanMaintenance():
 def redeploySwapsExternal():
     print('replacing swaps external')
     swapsExternal = conf.acct.deploy(SwapsExternal)
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.replaceContract.encode_input(swapsExternal.address)
     print(data)
@@ -405,7 +406,7 @@ def redeploySwapsExternal():
 
 def setFeesController(feesControllerAddress):
     print("Set up new fees controller")
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setFeesController.encode_input(feesControllerAddress)
     print(data)
@@ -414,9 +415,8 @@ def setFeesController(feesControllerAddress):
 
 
 def readMaxAffiliateFee():
-    abiFile = open('./scripts/contractInteraction/ABIs/SovrynSwapNetwork.json')
-    abi = json.load(abiFile)
-    swapNetwork = Contract.from_abi(
+    abi = loadAbi('SovrynSwapNetwork')
+    swapNetwork = getContract(
         "SovrynSwapNetwork", address=conf.contracts['swapNetwork'], abi=abi, owner=conf.acct)
     print(swapNetwork.maxAffiliateFee())
 
@@ -424,7 +424,7 @@ def readMaxAffiliateFee():
 def withdrawFees():
     # Withdraw fees from protocol
     feesController = readFeesController()
-    feeSharingCollectorProxy = Contract.from_abi(
+    feeSharingCollectorProxy = getContract(
         "FeeSharingCollector", address=feesController, abi=FeeSharingCollector.abi, owner=conf.acct)
 
     #  Withdraw fees from protocol
@@ -443,7 +443,7 @@ def withdrawFees():
 def withdrawFeesAMM():
     # Withdraw fees from protocol
     feesController = readFeesController()
-    feeSharingCollectorProxy = Contract.from_abi(
+    feeSharingCollectorProxy = getContract(
         "FeeSharingCollector", address=feesController, abi=FeeSharingCollector.abi, owner=conf.acct)
 
     # Withdraw fees from AMM
@@ -460,7 +460,7 @@ def withdrawFeesAMM():
     ])
 
 def setSupportedToken(tokenAddress):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setSupportedTokens.encode_input([tokenAddress], [True])
     sendWithMultisig(conf.contracts['multisig'],
@@ -477,7 +477,7 @@ def deployConversionFeeSharingToWRBTC():
     print("Fee sharing collector redeployed at: ", feeSharingCollector.address)
 
     print("Set implementation for FeeSharingCollectorProxy")
-    feeSharingCollectorProxy = Contract.from_abi(
+    feeSharingCollectorProxy = getContract(
         "FeeSharingCollectorProxy", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
     data = feeSharingCollectorProxy.setImplementation.encode_input(feeSharingCollector.address)
     sendWithMultisig(conf.contracts['multisig'],
@@ -507,7 +507,7 @@ def deployFeeSharingCollectorProxy():
 
 
 def setSupportedTokens(tokenAddresses, supported):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setSupportedTokens.encode_input(tokenAddresses, supported)
     sendWithMultisig(conf.contracts['multisig'],
@@ -515,7 +515,7 @@ def setSupportedTokens(tokenAddresses, supported):
 
 
 def tokenIsSupported(tokenAddress):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.supportedTokens(tokenAddress)
     print(data)
@@ -524,7 +524,7 @@ def tokenIsSupported(tokenAddress):
 def deployTradingRebatesUsingLockedSOV():
     # loadConfig()
 
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=acct)
 
     # ----------------------------- 1. Replace Protocol Settings ------------------------------
@@ -580,10 +580,10 @@ def deployTradingRebatesUsingLockedSOV():
 
 
 def setDefaultRebatesPercentage(rebatePercent):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setRebatePercent.encode_input(rebatePercent)
-    multisig = Contract.from_abi(
+    multisig = getContract(
         "MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     tx = multisig.submitTransaction(sovryn.address, 0, data)
     txId = tx.events["Submission"]["transactionId"]
@@ -592,10 +592,10 @@ def setDefaultRebatesPercentage(rebatePercent):
 
 def setTradingRebateRewardsBasisPoint(basisPoint):
     # Max basis point is 9999
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setTradingRebateRewardsBasisPoint.encode_input(basisPoint)
-    multisig = Contract.from_abi(
+    multisig = getContract(
         "MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     tx = multisig.submitTransaction(sovryn.address, 0, data)
     txId = tx.events["Submission"]["transactionId"]
@@ -603,7 +603,7 @@ def setTradingRebateRewardsBasisPoint(basisPoint):
 
 def pauseProtocolModules():
     print("Pause Protocol Modules")
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.togglePaused.encode_input(True)
     print(data)
@@ -614,7 +614,7 @@ def pauseProtocolModules():
 
 def unpauseProtocolModules():
     print("Unpause Protocol Modules")
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.togglePaused.encode_input(False)
     print(data)
@@ -624,33 +624,33 @@ def unpauseProtocolModules():
 
 
 def minInitialMargin(loanParamsId):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     print(sovryn.minInitialMargin(loanParamsId))
 
 def addWhitelistConverterFeeSharingCollectorProxy(converterAddress):
-    feeSharingCollectorProxy = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    feeSharingCollectorProxy = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
     data = feeSharingCollectorProxy.addWhitelistedConverterAddress.encode_input(converterAddress)
     print(data)
 
     sendWithMultisig(conf.contracts['multisig'], feeSharingCollectorProxy.address, data, conf.acct)
 
 def removeWhitelistConverterFeeSharingCollectorProxy(converterAddress):
-    feeSharingCollectorProxy = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    feeSharingCollectorProxy = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
     data = feeSharingCollectorProxy.removeWhitelistedConverterAddress.encode_input(converterAddress)
 
     print(data)
     sendWithMultisig(conf.contracts['multisig'], feeSharingCollectorProxy.address, data, conf.acct)
 
 def readRolloverReward():
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     print(sovryn.rolloverBaseReward())
 
 def withdrawWRBTCFromFeeSharingCollectorProxyToProtocol(amount):
     receiver = conf.contracts['sovrynProtocol']
-    feeSharingCollectorProxy = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
-    wrbtc = Contract.from_abi("WRBTC", address=conf.contracts['WRBTC'], abi=ERC20.abi, owner=conf.acct)
+    feeSharingCollectorProxy = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    wrbtc = getContract("WRBTC", address=conf.contracts['WRBTC'], abi=ERC20.abi, owner=conf.acct)
     print("=============================================================")
     print('withdrawWRBTCFromFeeSharingCollectorProxyToProtocol')
     print("FeeSharingCollectorProxy WRBTC balance:  ", wrbtc.balanceOf(conf.contracts['FeeSharingCollectorProxy']))
@@ -660,49 +660,49 @@ def withdrawWRBTCFromFeeSharingCollectorProxyToProtocol(amount):
     withdrawWRBTCFromFeeSharingCollectorProxy(receiver, amount)
 
 def withdrawWRBTCFromFeeSharingCollectorProxy(receiver, amount):
-    feeSharingCollectorProxy = Contract.from_abi("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
+    feeSharingCollectorProxy = getContract("FeeSharingCollector", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollector.abi, owner=conf.acct)
     data = feeSharingCollectorProxy.withdrawWRBTC.encode_input(receiver, amount)
     print(data)
     sendWithMultisig(conf.contracts['multisig'], feeSharingCollectorProxy.address, data, conf.acct)
 
 def setRolloverFlexFeePercent(rolloverFlexFeePercentage):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setRolloverFlexFeePercent.encode_input(rolloverFlexFeePercentage)
     sendWithMultisig(conf.contracts['multisig'],
                      sovryn.address, data, conf.acct)
 
 def setRolloverBaseReward(baseReward):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setRolloverBaseReward.encode_input(baseReward)
     sendWithMultisig(conf.contracts['multisig'],
                      sovryn.address, data, conf.acct)
 
 def depositCollateral(loanId,depositAmount, tokenAddress):
-    token = Contract.from_abi("TestToken", address = tokenAddress, abi = TestToken.abi, owner = conf.acct)
-    sovryn = Contract.from_abi(
+    token = getContract("TestToken", address = tokenAddress, abi = TestToken.abi, owner = conf.acct)
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     if(token.allowance(conf.acct, sovryn.address) < depositAmount):
         token.approve(sovryn.address, depositAmount)
     sovryn.depositCollateral(loanId,depositAmount)
 
 def setDefaultPathConversion(sourceTokenAddress, destTokenAddress, defaultPath):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setDefaultPathConversion.encode_input(defaultPath)
     sendWithMultisig(conf.contracts['multisig'],
                      sovryn.address, data, conf.acct)
 
 def removeDefaultPathConversion(sourceTokenAddress, destTokenAddress):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.removeDefaultPathConversion.encode_input(sourceTokenAddress, destTokenAddress)
     sendWithMultisig(conf.contracts['multisig'],
                      sovryn.address, data, conf.acct)
 
 def readDefaultPathConversion(sourceTokenAddress, destTokenAddress):
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     defaultPathConversion = sovryn.getDefaultPathConversion(sourceTokenAddress, destTokenAddress)
     print(defaultPathConversion)
@@ -711,20 +711,20 @@ def readDefaultPathConversion(sourceTokenAddress, destTokenAddress):
 # Transferring Admin role to GOV
 def transferProtocolAdminRoleToGovernance():
     print("Transferring sovryn protocol Admin role to: ", conf.contracts['TimelockAdmin'])
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], sovryn.address, data, conf.acct)
 
 def transferProtocolOwnershipToGovernance():
     print("Transferring sovryn protocol ownserhip to: ", conf.contracts['TimelockOwner'])
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], sovryn.address, data, conf.acct)
 
 def readFeesController():
-    sovryn = Contract.from_abi(
+    sovryn = getContract(
         "sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     feesController = sovryn.feesController()
     print(feesController)
@@ -732,11 +732,11 @@ def readFeesController():
 
 def setPauser(pauser):
     print("Setting pauser to the protocol: ", pauser)
-    sovryn = Contract.from_abi("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    sovryn = getContract("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setPauser.encode_input(pauser)
     sendWithMultisig(conf.contracts['multisig'], sovryn.address, data, conf.acct)
 
 def setAdmin(admin):
-    sovryn = Contract.from_abi("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
+    sovryn = getContract("sovryn", address=conf.contracts['sovrynProtocol'], abi=interface.ISovrynBrownie.abi, owner=conf.acct)
     data = sovryn.setAdmin.encode_input(admin)
     sendWithMultisig(conf.contracts['multisig'], sovryn.address, data, conf.acct)
\ No newline at end of file
@@ -0,0 +1,170 @@
+'''
+JSON-RPC batching transport for latency bound brownie scripts.
+
+Queued requests (eth_call, eth_getLogs, ...) are coalesced into JSON-RPC batch arrays and posted
+over a pooled keep-alive HTTP session, several batches in flight at once. This replaces thousands
+of strictly sequential single HTTP round-trips with a handful of batch requests.
+
+usage:
+    client = RpcBatchClient(batchSize=100, maxInFlight=4)
+    balance = client.ethCall(token.address, token.balanceOf.encode_input(user))
+    logs = client.getLogs({'address': staking.address, 'fromBlock': hex(a), 'toBlock': hex(b)})
+    client.flush()
+    print(balance.result(), logs.result())
+
+    # or with brownie contract methods, decoded like readCalls() in multicall.py
+    balances = readCallsRpc([(token.balanceOf, user) for user in users])
+
+The endpoint defaults to the one of the active brownie network. Batching needs HTTP: on a websocket or
+IPC network readCallsRpc falls back to single eth_calls pinned to one block.
+'''
+from brownie import *
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from scripts.contractInteraction.rpc_stats import callingHelper, recordRpc
+
+class RpcFuture:
+    def __init__(self, client, method, params):
+        self.client = client
+        self.method = method
+        self.params = params
+        self.done = False
+        self.value = None
+        self.error = None
+
+    def setResult(self, response):
+        self.done = True
+        if 'error' in response:
+            self.error = response['error']
+        else:
+            self.value = response.get('result')
+
+    def result(self):
+        '''
+        returns the result, flushing the queue of the client first if the request was not sent yet
+        raises ValueError with the JSON-RPC error like web3 does
+        '''
+        if not self.done:
+            self.client.flush()
+        if self.error is not None:
+            raise ValueError(self.error)
+        return self.value
+
+class RpcBatchClient:
+    '''
+    endpointUri - HTTP JSON-RPC endpoint, defaults to the active brownie network
+    batchSize - max requests per JSON-RPC batch array (RSK nodes limit the batch size)
+    maxInFlight - max batches posted concurrently, also the size of the keep-alive connection pool
+    '''
+    def __init__(self, endpointUri=None, batchSize=100, maxInFlight=4, timeout=60):
+        self.endpointUri = endpointUri if endpointUri != None else web3.provider.endpoint_uri
+        if not self.endpointUri.startswith("http"):
+            raise Exception("JSON-RPC batching needs an HTTP endpoint, got " + self.endpointUri)
+        self.batchSize = batchSize
+        self.maxInFlight = maxInFlight
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxInFlight)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.ids = itertools.count(1)
+        self.pending = []
+        self.batchesSent = 0
+        self.requestsSent = 0
+
+    def queue(self, method, params):
+        future = RpcFuture(self, method, params)
+        self.pending.append(future)
+        return future
+
+    def ethCall(self, to, data, blockIdentifier='latest'):
+        if isinstance(blockIdentifier, int):
+            blockIdentifier = hex(blockIdentifier)
+        return self.queue('eth_call', [{'to': str(to), 'data': data}, blockIdentifier])
+
+    def getLogs(self, filterParams):
+        return self.queue('eth_getLogs', [filterParams])
+
+    def flush(self):
+        '''
+        sends all queued requests and waits for the responses
+        '''
+        pending = self.pending
+        self.pending = []
+        if len(pending) == 0:
+            return
+        chunks = [pending[i:i + self.batchSize] for i in range(0, len(pending), self.batchSize)]
+        helper = callingHelper()
+        if len(chunks) == 1:
+            self._send(chunks[0], helper)
+            return
+        with ThreadPoolExecutor(max_workers=self.maxInFlight) as executor:
+            # list() re-raises the first transport error, if any
+            list(executor.map(lambda chunk: self._send(chunk, helper), chunks))
+
+    def _send(self, futures, helper):
+        start = time.time()
+        payload = []
+        byId = {}
+        for future in futures:
+            requestId = next(self.ids)
+            byId[requestId] = future
+            payload.append({'jsonrpc': '2.0', 'id': requestId, 'method': future.method, 'params': future.params})
+        response = self.session.post(self.endpointUri, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        recordRpc(helper, "batch[" + futures[0].method + "]", time.time() - start, len(response.request.body), len(response.content))
+        responses = response.json()
+        if isinstance(responses, dict):
+            # some nodes answer a rejected batch with a single error object
+            for future in futures:
+                future.setResult(responses)
+        else:
+            for item in responses:
+                byId[item['id']].setResult(item)
+        for future in futures:
+            if not future.done:
+                future.setResult({'error': {'code': -32603, 'message': 'missing response in batch'}})
+        self.batchesSent += 1
+        self.requestsSent += len(futures)
+
+    def close(self):
+        self.session.close()
+
+_defaultClient = None
+
+def isHttpEndpoint(endpointUri=None):
+    '''
+    True if JSON-RPC batches can be posted to the endpoint (defaults to the active network)
+    '''
+    if endpointUri is None:
+        endpointUri = getattr(web3.provider, 'endpoint_uri', None) or ''
+    return str(endpointUri).startswith("http")
+
+def getRpcBatchClient():
+    '''
+    process-wide client for the active network
+    '''
+    global _defaultClient
+    if _defaultClient is None or _defaultClient.endpointUri != web3.provider.endpoint_uri:
+        _defaultClient = RpcBatchClient()
+    return _defaultClient
+
+def readCallsRpc(calls, blockIdentifier='latest', client=None):
+    '''
+    calls - list of (contract method, arg1, arg2, ...) tuples, e.g. [(token.balanceOf, holder)]
+    returns the decoded values in the order of calls, read with JSON-RPC batches of eth_call
+    on a non-HTTP endpoint the calls are sent one by one instead, all at the same block
+    '''
+    if client is None and not isHttpEndpoint():
+        if blockIdentifier == 'latest':
+            blockIdentifier = web3.eth.blockNumber
+        return [call[0].decode_output(web3.eth.call({'to': call[0]._address, 'data': call[0].encode_input(*call[1:])}, blockIdentifier))
+            for call in calls]
+    if client is None:
+        client = getRpcBatchClient()
+    futures = [client.ethCall(call[0]._address, call[0].encode_input(*call[1:]), blockIdentifier) for call in calls]
+    client.flush()
+    return [calls[i][0].decode_output(futures[i].result()) for i in range(0, len(calls))]
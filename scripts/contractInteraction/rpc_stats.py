@@ -0,0 +1,147 @@
+'''
+RPC call accounting and latency instrumentation.
+
+Wraps the web3 provider of the active network and attributes every JSON-RPC request - its method,
+latency and payload size - to the script helper that triggered it (e.g. printLendingPoolData,
+withdrawFees). A summary is printed at exit and optionally written as JSON, to find the chattiest helpers.
+
+usage:
+    export RPC_STATS=1 (optionally RPC_STATS_JSON=./rpc_stats.json) before running any script that uses
+    scripts.contractInteraction.config - or call enableRpcStats() explicitly
+'''
+from brownie import *
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+SCRIPTS_DIR = os.sep + 'scripts' + os.sep
+# modules of this directory sending RPC on behalf of the helpers, skipped when looking for the calling helper
+INFRASTRUCTURE_DIR = os.path.basename(os.path.dirname(os.path.abspath(__file__)))
+INFRASTRUCTURE_FILES = {'rpc_stats.py', 'rpc_batch.py', 'multicall.py', 'call_cache.py', 'async_reads.py', 'log_scan.py',
+    'tx_pipeline.py', 'gas_chunks.py', 'contract_registry.py', 'config.py'}
+_threadHelper = threading.local()
+
+class RpcStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # helper -> method -> [count, total seconds, max seconds, bytes sent, bytes received]
+        self.byHelper = {}
+        self.started = time.time()
+
+    def record(self, helper, method, elapsed, bytesOut, bytesIn):
+        with self.lock:
+            methods = self.byHelper.setdefault(helper, {})
+            entry = methods.get(method)
+            if entry is None:
+                entry = methods[method] = [0, 0.0, 0.0, 0, 0]
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+            entry[3] += bytesOut
+            entry[4] += bytesIn
+
+    def summary(self):
+        '''
+        returns the per-helper totals sorted by total RPC time, slowest first
+        '''
+        rows = []
+        with self.lock:
+            for helper, methods in self.byHelper.items():
+                row = {"helper": helper, "calls": 0, "seconds": 0.0, "bytesOut": 0, "bytesIn": 0, "methods": {}}
+                for method, entry in methods.items():
+                    row["calls"] += entry[0]
+                    row["seconds"] += entry[1]
+                    row["bytesOut"] += entry[3]
+                    row["bytesIn"] += entry[4]
+                    row["methods"][method] = {"calls": entry[0], "seconds": entry[1], "maxSeconds": entry[2], "bytesOut": entry[3], "bytesIn": entry[4]}
+                rows.append(row)
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows
+
+    def printSummary(self):
+        rows = self.summary()
+        totalCalls = sum(row["calls"] for row in rows)
+        totalSeconds = sum(row["seconds"] for row in rows)
+        print("=====================================================================================")
+        print("RPC stats:", totalCalls, "requests,", round(totalSeconds, 2), "s in RPC,", round(time.time() - self.started, 2), "s wall time")
+        print("helper".ljust(40), "calls".rjust(8), "rpc s".rjust(10), "kB out".rjust(10), "kB in".rjust(10))
+        for row in rows:
+            print(row["helper"][:40].ljust(40), str(row["calls"]).rjust(8), str(round(row["seconds"], 3)).rjust(10),
+                str(round(row["bytesOut"] / 1024, 1)).rjust(10), str(round(row["bytesIn"] / 1024, 1)).rjust(10))
+            for method, entry in sorted(row["methods"].items(), key=lambda item: item[1]["seconds"], reverse=True):
+                print(("    " + method)[:40].ljust(40), str(entry["calls"]).rjust(8), str(round(entry["seconds"], 3)).rjust(10))
+        print("=====================================================================================")
+
+    def writeJson(self, fileName):
+        with open(fileName, 'w') as file:
+            json.dump({"wallSeconds": time.time() - self.started, "helpers": self.summary()}, file, indent=2)
+
+def isInfrastructure(fileName):
+    return os.path.basename(fileName) in INFRASTRUCTURE_FILES and os.path.basename(os.path.dirname(fileName)) == INFRASTRUCTURE_DIR
+
+def callingHelper():
+    '''
+    name of the innermost function of a file under scripts/ on the current call stack (module.function)
+    the INFRASTRUCTURE_FILES are skipped, in their worker threads the helper is the one that started the work (see runAsHelper)
+    '''
+    frame = sys._getframe(1)
+    while frame is not None:
+        fileName = frame.f_code.co_filename
+        if SCRIPTS_DIR in fileName and not isInfrastructure(fileName):
+            moduleName = os.path.splitext(os.path.basename(fileName))[0]
+            return moduleName + "." + frame.f_code.co_name
+        frame = frame.f_back
+    return getattr(_threadHelper, 'helper', None) or "<unknown>"
+
+def runAsHelper(helper, fn, *args):
+    '''
+    runs fn(*args) with the RPC it sends attributed to helper - for the worker threads of the infrastructure modules
+    '''
+    previous = getattr(_threadHelper, 'helper', None)
+    _threadHelper.helper = helper
+    try:
+        return fn(*args)
+    finally:
+        _threadHelper.helper = previous
+
+def rpcStatsMiddleware(stats):
+    def middleware(make_request, w3):
+        def middlewareFn(method, params):
+            helper = callingHelper()
+            start = time.time()
+            response = make_request(method, params)
+            elapsed = time.time() - start
+            if isinstance(response, dict) and response.get('fromCallCache'):
+                return response
+            stats.record(helper, method, elapsed, len(json.dumps(params, default=str)), len(json.dumps(response, default=str)))
+            return response
+        return middlewareFn
+    return middleware
+
+activeStats = None
+
+def enableRpcStats(jsonFile=None):
+    global activeStats
+    if activeStats is not None:
+        return activeStats
+    activeStats = RpcStats()
+    # injected next to the provider, calls served by call_cache.py are not counted as RPC
+    web3.middleware_onion.inject(rpcStatsMiddleware(activeStats), name='rpcStats', layer=0)
+
+    def report():
+        activeStats.printSummary()
+        if jsonFile is not None:
+            activeStats.writeJson(jsonFile)
+            print("RPC stats written to", jsonFile)
+    atexit.register(report)
+    return activeStats
+
+def recordRpc(helper, method, elapsed, bytesOut, bytesIn):
+    '''
+    lets transports bypassing the web3 provider (see rpc_batch.py) report their requests
+    '''
+    if activeStats is not None:
+        activeStats.record(helper, method, elapsed, bytesOut, bytesIn)
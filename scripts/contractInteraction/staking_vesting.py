@@ -6,75 +6,104 @@ import copy
 import math
 from scripts.utils import * 
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract, loadAbi
+from scripts.contractInteraction.gas_chunks import DEFAULT_GAS_LIMIT
+from scripts.contractInteraction.multicall import readCallsChunked
 import eth_abi
 from datetime import datetime, timezone
 
 
 def sendSOVFromVestingRegistry():
     amount = 307470805 * 10**14
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
     data = vestingRegistry.transferSOV.encode_input(conf.contracts['multisig'], amount)
     print(data)
 
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def vestingRegistryAddAdmin(admin, vestingRegistryAddress):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=vestingRegistryAddress, abi=VestingRegistry.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=vestingRegistryAddress, abi=VestingRegistry.abi, owner=conf.acct)
     data = vestingRegistry.addAdmin.encode_input(admin)
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def vestingRegistryProxyAddAdmin(admin):
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
     vestingRegistryAddAdmin(admin, vestingRegistry.address)    
 
 def vestingRegistryRemoveAdmin(admin, vestingRegistryAddress):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=vestingRegistryAddress, abi=VestingRegistry.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=vestingRegistryAddress, abi=VestingRegistry.abi, owner=conf.acct)
     data = vestingRegistry.removeAdmin.encode_input(admin)
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def vestingRegistryProxyRemoveAdmin(admin):
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
     vestingRegistryRemoveAdmin(admin, vestingRegistry.address)    
 
 def isVestingRegistryAdmin(admin, vestingRegistryAddress):
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=vestingRegistryAddress, abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=vestingRegistryAddress, abi=VestingRegistry.abi, owner=conf.acct)
     print(vestingRegistry.admins(admin))
 
 def isVestingRegistryProxyAdmin(admin):
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
     isAdmin = vestingRegistry.admins(admin)
     print(admin, 'is already' if isAdmin else 'is not yet admin - setting as', 'Vesting Registry Admin')
     return isAdmin
 
 def readVestingContractForAddress(userAddress):
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
     address = vestingRegistry.getVesting(userAddress)
     if(address == '0x0000000000000000000000000000000000000000'):
-        vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry2'], abi=VestingRegistry.abi, owner=conf.acct)
+        vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry2'], abi=VestingRegistry.abi, owner=conf.acct)
         address = vestingRegistry.getVesting(userAddress)
 
     print(address)
 
 def readTeamVestingContractForAddress(userAddress):
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
     address = vestingRegistry.getTeamVesting(userAddress)
     print(address)
 
 def cancelTeamVestingsOfAccount(userAddress, startFrom):
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     vestings = vestingRegistry.getVestingsOf(userAddress)
     for vesting in vestings:
-        vestingContract = Contract.from_abi("VestingLogic", address=vesting[2], abi=VestingLogic.abi, owner=conf.acct)
+        vestingContract = getContract("VestingLogic", address=vesting[2], abi=VestingLogic.abi, owner=conf.acct)
         if(vestingContract.owner() == conf.contracts['multisig']):
             print('Cancelling team vesting: ', vesting[2])
             data = staking.cancelTeamVesting.encode_input(vesting[2],conf.contracts['multisig'], startFrom)
             sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
+def cancelTeamVestingsOfAccounts(userAddresses, startFrom, gasLimit=DEFAULT_GAS_LIMIT):
+    '''
+    offboarding of several accounts: the vestings of all accounts and their owners are read in batches
+    and the cancelTeamVesting calls are packed into as few multisig transactions as the gas limit allows,
+    executed by the BatchExecutor (conf.contracts['BatchExecutor'], a Staking admin owned by the multisig)
+    without a BatchExecutor every vesting is submitted separately
+    '''
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    vestingsOf = readCallsChunked([(vestingRegistry.getVestingsOf, userAddress) for userAddress in userAddresses])
+    vestingAddresses = [vesting[2] for vestings in vestingsOf for vesting in vestings]
+    owners = readCallsChunked([(getContract("VestingLogic", address=vesting, abi=VestingLogic.abi, owner=conf.acct).owner,) for vesting in vestingAddresses])
+    toCancel = [vestingAddresses[i] for i in range(0, len(vestingAddresses)) if owners[i] == conf.contracts['multisig']]
+    print('accounts:', len(userAddresses), 'vestings:', len(vestingAddresses), 'team vestings to cancel:', len(toCancel))
+    calls = [(staking.address, staking.cancelTeamVesting.encode_input(vesting, conf.contracts['multisig'], startFrom)) for vesting in toCancel]
+    if 'BatchExecutor' not in conf.contracts:
+        for target, data in calls:
+            sendWithMultisig(conf.contracts['multisig'], target, data, conf.acct)
+        return
+    return sendBatchWithMultisig(conf.contracts['multisig'], conf.contracts['BatchExecutor'], calls, conf.acct, gasLimit)
+
+def addBatchExecutorAsStakingAdmin():
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    data = staking.addAdmin.encode_input(conf.contracts['BatchExecutor'])
+    sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
+
 def readLMVestingContractForAddress(userAddress):
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry3'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry3'], abi=VestingRegistry.abi, owner=conf.acct)
     address = vestingRegistry.getVesting(userAddress)
     print(address)
 
@@ -82,34 +111,34 @@ def readLMVestingContractForAddress(userAddress):
 # vesting type 0 -> team vesting
 # vesting type 1 -> owner vesting
 def readAllVestingContractsForAddress(userAddress):
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     addresses = vestingRegistry.getVestingsOf(userAddress)
     print(addresses)
 
 def addVestingAdmin(admin):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     data = vestingRegistry.addAdmin.encode_input(admin)
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def setMaxVestingWithdrawIterations(num):
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
     data = staking.setMaxVestingWithdrawIterations.encode_input(num)
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
 def removeVestingAdmin(admin):
-    multisig = Contract.from_abi("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    multisig = getContract("MultiSig", address=conf.contracts['multisig'], abi=MultiSigWallet.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     data = vestingRegistry.removeAdmin.encode_input(admin)
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def isVestingAdmin(admin):
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     print(vestingRegistry.admins(admin))
 
 def readStakingKickOff():
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     print(staking.kickoffTS())
 
 def stake80KTokens():
@@ -118,7 +147,7 @@ def stake80KTokens():
     # 80K SOV
     amount = 80000 * 10**18
 
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
     vestingAddress = vestingRegistry.getVesting(tokenOwner)
     print("vestingAddress: " + vestingAddress)
     data = vestingRegistry.stakeTokens.encode_input(vestingAddress, amount)
@@ -146,7 +175,7 @@ def createVesting():
     cliff = 1 * FOUR_WEEKS
     duration = cliff + (10 - 1) * FOUR_WEEKS
 
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistry'], abi=VestingRegistry.abi, owner=conf.acct)
     data = vestingRegistry.createVesting.encode_input(tokenOwner, amount, cliff, duration)
     print(data)
 
@@ -154,7 +183,7 @@ def createVesting():
 
 def transferSOVtoVestingRegistry(vestingRegistryAddress, amount):
 
-    SOVtoken = Contract.from_abi("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=conf.acct)
+    SOVtoken = getContract("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=conf.acct)
     data = SOVtoken.transfer.encode_input(vestingRegistryAddress, amount)
     print(data)
 
@@ -164,13 +193,13 @@ def transferSOVtoVestingRegistry(vestingRegistryAddress, amount):
 
 def getBlockOfStakingInterval(timestamp):
     # Get the contract instance
-    stakingRewards = Contract.from_abi("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
+    stakingRewards = getContract("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
     return stakingRewards.checkpointBlockDetails(timestamp)
 
 # Read last staking timestamp
 
 def readLockDate(timestamp):
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     return staking.timestampToLockDate(timestamp)
 
 # Upgrade StakingRewards
@@ -184,7 +213,7 @@ def upgradeStakingRewards():
     print("New staking rewards logic address:", stakingRewards.address)
     
     # Get the proxy contract instance
-    stakingRewardsProxy = Contract.from_abi("StakingRewardsProxy", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewardsProxy.abi, owner=conf.acct)
+    stakingRewardsProxy = getContract("StakingRewardsProxy", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewardsProxy.abi, owner=conf.acct)
 
     # Register logic in Proxy
     data = stakingRewardsProxy.setImplementation.encode_input(stakingRewards.address)
@@ -194,7 +223,7 @@ def upgradeStakingRewards():
 
 def setAverageBlockTime(blockTime):
     # Get the contract instance
-    stakingRewards = Contract.from_abi("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
+    stakingRewards = getContract("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
 
     # Set average block time
     data = stakingRewards.setAverageBlockTime.encode_input(blockTime)
@@ -204,14 +233,14 @@ def setAverageBlockTime(blockTime):
 
 def setBlockForStakingRewards():
     # Get the staking rewards proxy contract instance
-    stakingRewardsProxy = Contract.from_abi("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
+    stakingRewardsProxy = getContract("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
     stakingRewardsProxy.setBlock()
 
 # Set Historical Block
 
 def setHistoricalBlockForStakingRewards(blockTime):
     # Get the staking rewards proxy contract instance
-    stakingRewards = Contract.from_abi("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
+    stakingRewards = getContract("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
     stakingRewards.setHistoricalBlock(blockTime)
 
 # Upgrade Staking
@@ -251,7 +280,7 @@ def setStakingModulesProxy(stakingModulesProxyAddress):
     print("Setting Staking Modules Proxy address as implementation for StakingProxy")
 
     # Get the proxy contract instance
-    stakingProxy = Contract.from_abi("StakingProxy", address=conf.contracts['Staking'], abi=StakingProxy.abi, owner=conf.acct)
+    stakingProxy = getContract("StakingProxy", address=conf.contracts['Staking'], abi=StakingProxy.abi, owner=conf.acct)
 
     # Register logic in Proxy
     data = stakingProxy.setImplementation.encode_input(stakingModulesProxyAddress)
@@ -274,7 +303,7 @@ def addStakingModule(moduleContract, moduleContractName, moduleAddress = ZERO_AD
     It will fail if the module being added has methods overlapping with registered modules
     Param newModuleAddress is used if the module already deployed
     '''
-    stakingModulesProxy = Contract.from_abi("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
+    stakingModulesProxy = getContract("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
     print('Deploying account:', conf.acct.address)
     print('Upgrading Staking Module:', moduleContractName)
     stakingModule = deployOrGetStakingModule(moduleContract, moduleContractName, moduleAddress)
@@ -292,7 +321,7 @@ def replaceStakingModule(newModuleContract, newModuleContractName, stakingModule
     It will fail if the module being added has methods overlapping with registered modules other than that being replaced
     Param newModuleAddress is used if the new module already deployed
     '''
-    stakingModulesProxy = Contract.from_abi("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
+    stakingModulesProxy = getContract("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
     newStakingModule = deployOrGetStakingModule(newModuleContract, newModuleContractName, newModuleAddress)
     if canReplaceStakingModule(newStakingModule.address, stakingModuleAddressToReplace):
         # Register Module in Proxy
@@ -301,7 +330,7 @@ def replaceStakingModule(newModuleContract, newModuleContractName, stakingModule
         sendWithMultisig(conf.contracts['multisig'], stakingModulesProxy.address, data, conf.acct)
 
 def removeStakingModule(module, moduleName, moduleAddress):
-    stakingModulesProxy = Contract.from_abi("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
+    stakingModulesProxy = getContract("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
     print("Removing Staking Module:", moduleName, "@", moduleAddress)
     data = stakingModulesProxy.removeModule.encode_input(moduleAddress)
     sendWithMultisig(conf.contracts['multisig'], stakingModulesProxy.address, data, conf.acct)
@@ -312,11 +341,11 @@ def deployOrGetStakingModule(moduleContract, moduleContractName, moduleAddress =
         stakingModule = conf.acct.deploy(moduleContract)
         print("New Staking module", moduleContract,"address:", stakingModule.address)
     else:
-         stakingModule = Contract.from_abi(moduleContract, address=moduleAddress, abi=moduleContract.abi, owner=conf.acct)
+         stakingModule = getContract(moduleContract, address=moduleAddress, abi=moduleContract.abi, owner=conf.acct)
     return stakingModule
 
 def canReplaceStakingModule(stakingModuleAddress, stakingModuleAddressToReplace):
-    stakingModulesProxy = Contract.from_abi("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
+    stakingModulesProxy = getContract("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
     canAdd = stakingModulesProxy.canAddModule(stakingModuleAddress)
     hasClashing = False
     if canAdd:
@@ -333,7 +362,7 @@ def canReplaceStakingModule(stakingModuleAddress, stakingModuleAddressToReplace)
         return False
 
 def canAddStakingModule(stakingModuleAddress):
-    stakingModulesProxy = Contract.from_abi("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
+    stakingModulesProxy = getContract("StakingModulesProxy", address=conf.contracts['Staking'], abi=ModulesProxyRegistry.abi, owner=conf.acct)
     canAdd = stakingModulesProxy.canAddModule(stakingModuleAddress)
     if canAdd:
         return True
@@ -358,7 +387,7 @@ def upgradeVestingRegistry():
     print("New vesting registry logic address:", vestingRegistryLogic.address)
     
     # Get the proxy contract instance
-    vestingRegistryProxy = Contract.from_abi("VestingRegistryProxy", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryProxy.abi, owner=conf.acct)
+    vestingRegistryProxy = getContract("VestingRegistryProxy", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryProxy.abi, owner=conf.acct)
 
     # Register logic in Proxy
     data = vestingRegistryProxy.setImplementation.encode_input(vestingRegistryLogic.address)
@@ -369,10 +398,10 @@ def upgradeVestingRegistry():
 def updateVestingRegAddr():
 
     # Get the proxy contract instance
-    stakingProxy = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    stakingProxy = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
 
     # Get the proxy contract instance
-    vestingRegistryProxy = Contract.from_abi("VestingRegistryProxy", address=conf.contracts['VestingRegistryLogic'], abi=VestingRegistryProxy.abi, owner=conf.acct)
+    vestingRegistryProxy = getContract("VestingRegistryProxy", address=conf.contracts['VestingRegistryLogic'], abi=VestingRegistryProxy.abi, owner=conf.acct)
 
     #Send with Multisig
     data = stakingProxy.setVestingRegistry.encode_input(vestingRegistryProxy)
@@ -383,19 +412,19 @@ def updateVestingRegAddr():
 def updateAddresses():
 
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     print(staking)
 
     # Get the proxy contract instance
-    vestingRegistryProxy = Contract.from_abi("VestingRegistryProxy", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryProxy.abi, owner=conf.acct)
+    vestingRegistryProxy = getContract("VestingRegistryProxy", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryProxy.abi, owner=conf.acct)
     print(vestingRegistryProxy)
 
     # Get the staking rewards proxy contract instance
-    stakingRewardsProxy = Contract.from_abi("StakingRewardsProxy", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewardsProxy.abi, owner=conf.acct)
+    stakingRewardsProxy = getContract("StakingRewardsProxy", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewardsProxy.abi, owner=conf.acct)
     print(stakingRewardsProxy)
 
     # Get the fee sharing proxy contract instance
-    feeSharingCollectorProxy = Contract.from_abi("FeeSharingCollectorProxy", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
+    feeSharingCollectorProxy = getContract("FeeSharingCollectorProxy", address=conf.contracts['FeeSharingCollectorProxy'], abi=FeeSharingCollectorProxy.abi, owner=conf.acct)
     print(feeSharingCollectorProxy)
 
     #Link Staking with Vesting
@@ -415,17 +444,17 @@ def updateAddresses():
 
 def getStakes(address):
     # Get the proxy contract instance
-    stakingProxy = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    stakingProxy = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     print(stakingProxy.getStakes(address))
 
 def getStakingLogicAddess():
     # Get the proxy contract instance
-    stakingProxy = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=StakingProxy.abi, owner=conf.acct)
+    stakingProxy = getContract("Staking", address=conf.contracts['Staking'], abi=StakingProxy.abi, owner=conf.acct)
     print("Staking contract logic address:", stakingProxy.getImplementation())
 
 def stakeTokens(sovAmount, stakeTime, acctAddress, delegateeAddress):
-    SOVtoken = Contract.from_abi("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=acctAddress)
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=acctAddress)
+    SOVtoken = getContract("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=acctAddress)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=acctAddress)
 
     until = int(time.time()) + int(stakeTime)
     amount = int(sovAmount) * (10 ** 18)
@@ -435,62 +464,62 @@ def stakeTokens(sovAmount, stakeTime, acctAddress, delegateeAddress):
 
 def withdrawStakes(amount, until, receiver):
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     staking.withdraw(amount, until, receiver)
 
 def pauseOrUnpauseStaking(flag):
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     data = staking.pauseUnpause.encode_input(flag)
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
 def pauseOrUnPauseBFStaking(flag):
-    staking = Contract.from_abi("Staking", address=conf.contracts['StakingBF'], abi=Staking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['StakingBF'], abi=Staking.abi, owner=conf.acct)
     data = staking.pauseUnpause.encode_input(flag)
     sendWithMultisig(conf.contracts['BFmultisig'], staking.address, data, conf.acct)
 
 def isStakingPaused():
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     print("isStakingPaused:", staking.paused())
 
 def isBFStakingPaused():
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['StakingBF'], abi=Staking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['StakingBF'], abi=Staking.abi, owner=conf.acct)
     print("isStakingPaused:", staking.paused())
 
 def isStakingFrozen():
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=Staking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=Staking.abi, owner=conf.acct)
     print("isStakingFrozen:", staking.frozen())    
 
 def freezeOrUnfreezeStakingWithdawal(flag):
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     data = staking.freezeUnfreeze.encode_input(flag)
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
 def addStakingPauser(address):
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     data = staking.addPauser.encode_input(address)
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
 def removeStakingPauser(address):
     # Get the proxy contract instance
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     data = staking.removePauser.encode_input(address)
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
     
     
 def readVestingData(vestingAddress):
-    vesting = Contract.from_abi("VestingLogic", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
+    vesting = getContract("VestingLogic", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
     print(vesting.startDate())
     print(vesting.endDate())
     print(vesting.cliff())
     print(vesting.duration())
 
 def updateLockedSOV():
-    lockedSOV = Contract.from_abi("LockedSOV", address=conf.contracts['LockedSOV'], abi=LockedSOV.abi, owner=conf.acct)
+    lockedSOV = getContract("LockedSOV", address=conf.contracts['LockedSOV'], abi=LockedSOV.abi, owner=conf.acct)
 
     DAY = 24 * 60 * 60
     FOUR_WEEKS = 4 * 7 * DAY
@@ -508,8 +537,8 @@ def updateLockedSOV():
 
 #receiver is usually the multisig
 def governanceDirectWithdrawVesting( vesting,  receiver):
-    stakingProxy = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
-    vesting = Contract.from_abi("VestingLogic", address=vesting, abi=VestingLogic.abi, owner=conf.acct)
+    stakingProxy = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    vesting = getContract("VestingLogic", address=vesting, abi=VestingLogic.abi, owner=conf.acct)
 
     DAY = 24 * 60 * 60
     TWO_WEEKS = 2 * 7 * DAY
@@ -537,26 +566,26 @@ def governanceDirectWithdrawVesting( vesting,  receiver):
 
 def transferStakingOwnershipToGovernance():
     print("Add staking admin for address: ", conf.contracts['TimelockAdmin'])
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     data = staking.addAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
 def transferStakingRewardsOwnershipToGovernance():
     print("Transferring StakingRewards ownership to: ", conf.contracts['TimelockAdmin'])
-    stakingRewards = Contract.from_abi("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
+    stakingRewards = getContract("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
     data = stakingRewards.transferOwnership.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], stakingRewards.address, data, conf.acct)
 
 def addVestingRegistryGovernanceAdmin():
     # add governor admin as admin
     print("Add Vesting Registry admin for address: ", conf.contracts['TimelockAdmin'])
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
     data = vestingRegistry.addAdmin.encode_input(conf.contracts['TimelockAdmin'])
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def transferVestingRegistryOwnershipToGovernance():
     # transfer ownerhip to TimelockOwner
-    vestingRegistry = Contract.from_abi("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistry", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistry.abi, owner=conf.acct)
     data = vestingRegistry.transferOwnership.encode_input(conf.contracts['TimelockOwner'])
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
@@ -568,19 +597,19 @@ def transferVestingRegistryOwnershipToGovernance():
     '''
 
 def getStakedBalance(account):
-    stakingProxy = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    stakingProxy = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     bal = stakingProxy.balanceOf(account)
     print(bal)
     return bal
 
 def stopStakingRewards():
     print("Stop Staking Rewards Program from the stop() func call tx block")
-    stakingRewards = Contract.from_abi("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
+    stakingRewards = getContract("StakingRewards", address=conf.contracts['StakingRewardsProxy'], abi=StakingRewards.abi, owner=conf.acct)
     data = stakingRewards.stop.encode_input()
     sendWithMultisig(conf.contracts['multisig'], stakingRewards.address, data, conf.acct)
 
 def addVestingCodeHash(vestingLogic):
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
     data = staking.addContractCodeHash.encode_input(vestingLogic)
     sendWithMultisig(conf.contracts['multisig'], staking.address, data, conf.acct)
 
@@ -596,16 +625,16 @@ def registerVestingToVestingCreationAndTypes(addresses, vestingCreationAndTypeDe
     if len(addresses) != len(vestingCreationAndTypeDetails):
         raise Exception("umatched length of array between addresses & vestingCreationAndTypeDetails")
 
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     data = vestingRegistry.registerVestingToVestingCreationAndTypes.encode_input(addresses, vestingCreationAndTypeDetails)
     sendWithMultisig(conf.contracts['multisig'], vestingRegistry.address, data, conf.acct)
 
 def getVestingCreationAndTypes(vestingAddress):
-    vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
+    vestingRegistry = getContract("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
     print(vestingRegistry.vestingCreationAndTypes(vestingAddress))
 
 def readTokenOwner(vestingAddress):
-    vesting = Contract.from_abi("VestingLogic", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
+    vesting = getContract("VestingLogic", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
     print(vesting.tokenOwner())
 
 def getReleaseScheduleFromDevelopmentFund():
@@ -615,7 +644,7 @@ def getReleaseScheduleFromAdoptionFund():
     getReleaseScheduleFromFund(conf.contracts['AdoptionFund'])
 
 def getReleaseScheduleFromFund(fundAddress):
-    fund = Contract.from_abi("Fund", address=fundAddress, abi=DevelopmentFund.abi, owner=conf.acct)
+    fund = getContract("Fund", address=fundAddress, abi=DevelopmentFund.abi, owner=conf.acct)
     durations = fund.getReleaseDuration()[::-1]
     amounts = fund.getReleaseTokenAmount()[::-1]
     lastRelease = fund.lastReleaseTime()
@@ -638,15 +667,15 @@ def getReleaseScheduleFromFund(fundAddress):
     printToCSV("releaseSchedule-"+fundAddress+".csv", schedule)
 
 def readTokenOwnerFromFunds():
-    adoptionFund = Contract.from_abi("Fund", address=conf.contracts['AdoptionFund'], abi=DevelopmentFund.abi, owner=conf.acct)
-    developmentFund = Contract.from_abi("Fund", address=conf.contracts['DevelopmentFund'], abi=DevelopmentFund.abi, owner=conf.acct)
+    adoptionFund = getContract("Fund", address=conf.contracts['AdoptionFund'], abi=DevelopmentFund.abi, owner=conf.acct)
+    developmentFund = getContract("Fund", address=conf.contracts['DevelopmentFund'], abi=DevelopmentFund.abi, owner=conf.acct)
     print("adoptionFund.unlockedTokenOwner:", adoptionFund.unlockedTokenOwner())
     print("adoptionFund.lockedTokenOwner:", adoptionFund.lockedTokenOwner())
     print("developmentFund.unlockedTokenOwner:", developmentFund.unlockedTokenOwner())
     print("developmentFund.lockedTokenOwner:", developmentFund.lockedTokenOwner())
 
 def getVoluntaryWeightedStake():
-    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    staking = getContract("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
 
     vestingWeightedStake = staking.getPriorVestingWeightedStake(5138745, 1679073208);
     totalWeightedStake = staking.getPriorTotalVotingPower(5138745, 1679073208);
@@ -654,7 +683,7 @@ def getVoluntaryWeightedStake():
     print(voluntary)
 
 def updateRolesOnDevelopmentFund():
-    developmentFund = Contract.from_abi("DevelopmentFund", address=conf.contracts['DevelopmentFund'], abi=DevelopmentFund.abi, owner=acct)
+    developmentFund = getContract("DevelopmentFund", address=conf.contracts['DevelopmentFund'], abi=DevelopmentFund.abi, owner=acct)
     data = developmentFund.updateUnlockedTokenOwner.encode_input(conf.contracts['multisig'])
     sendWithMultisig(conf.contracts['multisig'], developmentFund.address, data, conf.acct)
     data = developmentFund.updateLockedTokenOwner(conf.contracts['TimelockOwner'])
@@ -663,13 +692,13 @@ def updateRolesOnDevelopmentFund():
     sendWithMultisig(conf.contracts['multisig'], developmentFund.address, data, conf.acct)
 
 def withdrawDevFundTokensByUnlockedTokenOwner():
-    developmentFund = Contract.from_abi("DevelopmentFund", address=conf.contracts['DevelopmentFund'], abi=DevelopmentFund.abi, owner=acct)
+    developmentFund = getContract("DevelopmentFund", address=conf.contracts['DevelopmentFund'], abi=DevelopmentFund.abi, owner=acct)
     #trying to withdraw 100M SOV -> more than available -> should withdraw the max
     data = developmentFund.withdrawTokensByUnlockedTokenOwner.encode_input(100000000e18)
     sendWithMultisig(conf.contracts['multisig'], developmentFund.address, data, conf.acct)
 
 def withdrawAdoptionFundTokensByUnlockedTokenOwner():
-    adoptionFund = Contract.from_abi("DevelopmentFund", address=conf.contracts['AdoptionFund'], abi=DevelopmentFund.abi, owner=acct)
+    adoptionFund = getContract("DevelopmentFund", address=conf.contracts['AdoptionFund'], abi=DevelopmentFund.abi, owner=acct)
     #trying to withdraw 100M SOV -> more than available -> should withdraw the max
     data = adoptionFund.withdrawTokensByUnlockedTokenOwner.encode_input(100000000e18)
     sendWithMultisig(conf.contracts['multisig'], adoptionFund.address, data, conf.acct)
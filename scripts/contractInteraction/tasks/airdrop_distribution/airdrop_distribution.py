@@ -5,6 +5,8 @@ from scripts.contractInteraction.tasks.airdrop_distribution.functions.send_direc
 from scripts.contractInteraction.tasks.airdrop_distribution.functions.send_direct_SOV import *
 from scripts.contractInteraction.tasks.airdrop_distribution.functions.create_vestings import *
 from scripts.contractInteraction.tasks.airdrop_distribution.functions.utils import *
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.simulate import *
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.reconcile import reconcileDistribution
 
 def main():
     '''
@@ -54,6 +56,7 @@ def main():
     # 4. dry-run, the uncomment actual tx
     # 5. try small amount
     # 6. run full distribution 
+    # 7. reconcile against the events: reconcileDistribution('XUSD', xusdDistributionPath, multiplier) (see functions/reconcile.py)
     
     # 
     # - Distribute SOV -
@@ -76,6 +79,7 @@ def main():
     multiplier = 10**16 # usually 10**16 <- amounts must have 2 decimals
     sendDirectSOV(sovDistributionPath, dryRun, multiplier)
     '''
+    # simulateSendDirectSOV(sovDistributionPath, multiplier) # on a mainnet fork: gas per row, total RBTC cost, reverts, balances
 
     #
     # - Distribute XUSD -
@@ -100,6 +104,7 @@ def main():
     multiplier = 10**16 # usually 10**16 <- amounts must with 2 decimals
     sendDirect('XUSD', xusdDistributionPath, dryRun, multiplier)
     '''
+    # simulateSendDirect('XUSD', xusdDistributionPath, multiplier) # on a mainnet fork: gas per row, total RBTC cost, reverts, balances
 
     #
     # - Distribute DLLR -
@@ -149,6 +154,7 @@ def main():
     # TODO:
     # 1. set relevant vestingDistributionPath
     # 2. set dryRun = True, run, verify
+    # 2.1 simulateCreateVestings(vestingDistributionPath, multiplier) on a mainnet fork (see functions/simulate.py) - gas and RBTC budget
     # 3. set dryRun = False, run
     # 4. run full distribution 
     # 
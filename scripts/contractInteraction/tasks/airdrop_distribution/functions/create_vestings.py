@@ -2,13 +2,19 @@
 Implements SOV distribution via vesting contracts
 '''
 from scripts.contractInteraction.contract_interaction_imports  import *
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.distribution_file import parseDistribution
 import csv
+from scripts.contractInteraction.tx_pipeline import TxPipeline
 
-def createVestings(path, dryRun, multiplier):
+def createVestings(path, dryRun, multiplier, maxInFlight=8, journal=None):
     '''
     vested token sender script - takes addresses from the file by path
     dryRun - true to check that the data will be processed correctly, false - execute distribution
     multiplier - usually 10**16 considering the amount format should have 2 decimals
+    maxInFlight - number of vestings processed concurrently, their transactions are pipelined with local nonces
+    journal - JSONL journal of the sent transactions, defaults to <path>.journal.jsonl
+              re-run with the same file after a crash: confirmed steps are not sent again
+              (the journal keys contain the row index, do not edit the file between the runs)
     '''
 
     vestingRegistry = Contract.from_abi("VestingRegistryLogic", address=conf.contracts['VestingRegistryProxy'], abi=VestingRegistryLogic.abi, owner=conf.acct)
@@ -26,73 +32,56 @@ def createVestings(path, dryRun, multiplier):
     data = parseFile(path, multiplier)
     totalAmount += data["totalAmount"]
 
-    for teamVesting in data["teamVestingList"]:
+    def getVestingAddress(tokenOwner, cliff, duration, vestingCreationType, isTeam):
+        if isTeam:
+            return vestingRegistry.getTeamVesting(tokenOwner, cliff, duration, vestingCreationType)
+        return vestingRegistry.getVestingAddr(tokenOwner, cliff, duration, vestingCreationType)
+
+    def processVesting(pipeline, index, teamVesting):
         tokenOwner = teamVesting[0]
         amount = int(teamVesting[1])
         cliff = int(teamVesting[2]) * FOUR_WEEKS
         duration = int(teamVesting[3]) * FOUR_WEEKS
         isTeam = bool(teamVesting[4])
-        print("==============================================================================")
-        print("Processing vesting creation for", tokenOwner,"...")
-        # print('tokenOwner:', tokenOwner)
-        print('isTeam', isTeam)
-        print('amount', amount)
-        print('cliff', cliff)
-        print('duration', duration)
-        print('(duration - cliff) / FOUR_WEEKS + 1', (duration - cliff) / FOUR_WEEKS + 1)
-
-        if teamVesting[3] == 10: 
-            vestingCreationType = 3
-        elif teamVesting[3] == 26: # 2 year vestings
-            vestingCreationType = 1
-        elif teamVesting[3] == 39 or teamVesting[3] == 22: # 3 year vestings. if cliff < 6 use FourYearVesting
-            vestingCreationType = 5 #type 4 is reserved for 4 year vestings - a separate contract
-            print("Make sure 3 year vesting 2 contracts split is really expected!")
-        elif teamVesting[3] == 32 or teamVesting[3] == 16: # 3 year vestings. ad-hoc to reissue a contract with 2 periods unlocked
-            vestingCreationType = 5 #type 4 is reserved for 4 year vestings - a separate contract
-            print("Make sure 3 year vesting 2 contracts split is really expected!")
-        elif teamVesting[3] == 37 or teamVesting[3] == 19: # Strategic investores round may 22
-            vestingCreationType = 6 #type 4 is reserved for 4 year vestings - a separate contract
-            print("Make sure 3 year vesting 2 contracts split is really expected!")
-        else:
-            vestingCreationType = 0
-            print("ALERT!!!! ZERO VESTING CREATION TYPE FALLBACK!!!")
+        vestingCreationType = getVestingCreationType(teamVesting[3])
+        print("Processing vesting creation for", tokenOwner, "isTeam:", isTeam, "amount:", amount, "cliff:", cliff, "duration:", duration,
+            "(duration - cliff) / FOUR_WEEKS + 1:", (duration - cliff) / FOUR_WEEKS + 1)
 
-        if isTeam:
-            vestingAddress = vestingRegistry.getTeamVesting(tokenOwner, cliff, duration, vestingCreationType)
-        else:
-            vestingAddress = vestingRegistry.getVestingAddr(tokenOwner, cliff, duration, vestingCreationType)
-        if (vestingAddress != "0x0000000000000000000000000000000000000000"):
+        vestingAddress = getVestingAddress(tokenOwner, cliff, duration, vestingCreationType, isTeam)
+        if (vestingAddress != ZERO_ADDRESS):
             vestingLogic = Contract.from_abi("VestingLogic", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
             if (cliff != vestingLogic.cliff() or duration != vestingLogic.duration()):
                 raise Exception("Address already has team vesting contract with different schedule")
+        if dryRun:
+            print(tokenOwner, "vesting:", vestingAddress, "stakes:", staking.getStakes(vestingAddress) if vestingAddress != ZERO_ADDRESS else "-")
+            return
+
+        # the journal key identifies the row, the steps of a row depend on each other and run in order
+        key = getVestingJournalKey(teamVesting, index)
         if isTeam:
-            if(not dryRun):
-                print('Create or get Team Vesting...')
-                vestingRegistry.createTeamVesting(tokenOwner, amount, cliff, duration, vestingCreationType)
-            vestingAddress = vestingRegistry.getTeamVesting(tokenOwner, cliff, duration, vestingCreationType)
-            print("TeamVesting: ", vestingAddress)
+            pipeline.execute(key, "create", vestingRegistry.createTeamVesting, tokenOwner, amount, cliff, duration, vestingCreationType)
         else:
-            if(not dryRun):
-                print('Create or get Vesting contract...')
-                vestingRegistry.createVestingAddr(tokenOwner, amount, cliff, duration, vestingCreationType)
-            vestingAddress = vestingRegistry.getVestingAddr(tokenOwner, cliff, duration, vestingCreationType)
-            print("Vesting: ", vestingAddress)
-        
-        if(not dryRun):
-            if(vestingAddress == ZERO_ADDRESS):
-                raise Exception('Vesting address is zero!')
-            if(SOVtoken.allowance(conf.acct, vestingAddress) < amount):
-                print('Approving amount', amount, 'to Vesting contract', vestingAddress)
-                SOVtoken.approve(vestingAddress, amount)
-                print('Approved:', amount)
-            print('Staking ...')
-            vesting = Contract.from_abi("Vesting", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
-            vesting.stakeTokens(amount)
-
-        stakes = staking.getStakes(vestingAddress)
-        print("Stakes:")
-        print(stakes)
+            pipeline.execute(key, "create", vestingRegistry.createVestingAddr, tokenOwner, amount, cliff, duration, vestingCreationType)
+        vestingAddress = getVestingAddress(tokenOwner, cliff, duration, vestingCreationType, isTeam)
+        if(vestingAddress == ZERO_ADDRESS):
+            raise Exception('Vesting address is zero!')
+
+        if pipeline.journal.isDone(key, "stake"):
+            return
+        if(SOVtoken.allowance(conf.acct, vestingAddress) < amount):
+            pipeline.execute(key, "approve", SOVtoken.approve, vestingAddress, amount)
+        vesting = Contract.from_abi("Vesting", address=vestingAddress, abi=VestingLogic.abi, owner=conf.acct)
+        pipeline.execute(key, "stake", vesting.stakeTokens, amount)
+        print(tokenOwner, "vesting:", vestingAddress, "stakes:", staking.getStakes(vestingAddress))
+
+    def processRow(pipeline, row):
+        index, teamVesting = row
+        processVesting(pipeline, index, teamVesting)
+
+    # parseDistribution aggregates the rows of the same owner and schedule: every row is its own vesting contract,
+    # so the rows processed concurrently do not share an allowance
+    pipeline = TxPipeline(conf.acct, maxInFlight=maxInFlight, journal=journal if journal != None else path + ".journal.jsonl")
+    failed = pipeline.run(list(enumerate(data["teamVestingList"])), processRow)
 
     print("=======================================")
     print("SOV amount:")
@@ -101,37 +90,36 @@ def createVestings(path, dryRun, multiplier):
     print("deployment cost:")
     print((balanceBefore - conf.acct.balance()) / 10**18)
 
+    if len(failed) > 0:
+        raise Exception(str(len(failed)) + " vestings failed, fix the cause and re-run to continue from the journal")
+
+def getVestingJournalKey(teamVesting, index):
+    '''
+    journal key of the row at index of teamVestingList
+    '''
+    FOUR_WEEKS = 4 * 7 * 24 * 60 * 60
+    tokenOwner, amount, cliff, duration, isTeam = teamVesting
+    return "-".join([str(index), tokenOwner.lower(), str(int(cliff) * FOUR_WEEKS), str(int(duration) * FOUR_WEEKS),
+        "team" if bool(isTeam) else "owner", str(int(amount))])
+
+def getVestingCreationType(durationPeriods):
+    if durationPeriods == 10:
+        return 3
+    elif durationPeriods == 26: # 2 year vestings
+        return 1
+    elif durationPeriods == 39 or durationPeriods == 22: # 3 year vestings. if cliff < 6 use FourYearVesting
+        print("Make sure 3 year vesting 2 contracts split is really expected!")
+        return 5 #type 4 is reserved for 4 year vestings - a separate contract
+    elif durationPeriods == 32 or durationPeriods == 16: # 3 year vestings. ad-hoc to reissue a contract with 2 periods unlocked
+        print("Make sure 3 year vesting 2 contracts split is really expected!")
+        return 5 #type 4 is reserved for 4 year vestings - a separate contract
+    elif durationPeriods == 37 or durationPeriods == 19: # Strategic investores round may 22
+        print("Make sure 3 year vesting 2 contracts split is really expected!")
+        return 6 #type 4 is reserved for 4 year vestings - a separate contract
+    print("ALERT!!!! ZERO VESTING CREATION TYPE FALLBACK!!!")
+    return 0
+
 
 def parseFile(fileName, multiplier):
-    print(fileName)
-    totalAmount = 0
-    teamVestingList = []
-    errorMsg = ''
-    with open(fileName, 'r') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            tokenOwner = row[3].replace(" ", "")
-            decimals = row[0].split('.')
-            if(len(decimals) != 2 or 18 - len(decimals[1]) != math.log10(multiplier)): 
-                errorMsg+="\n" + tokenOwner + ' amount: ' + row[0]
-            amount = row[0].replace(",", "").replace(".", "")
-            amount = int(amount) * multiplier
-            cliff = int(row[5])
-            duration = int(row[6])
-            isTeam = True
-            if (row[7] == "OwnerVesting"):
-                isTeam = False
-            totalAmount += amount
-
-            teamVestingList.append([tokenOwner, amount, cliff, duration, isTeam])
-
-            print("=======================================")
-            print("'" + tokenOwner + "', ")
-            print(amount)
-
-    if(errorMsg != ''):
-        raise Exception('Formatting error: ' + errorMsg)
-    return {
-               "totalAmount": totalAmount,
-               "teamVestingList": teamVestingList,
-            }
+    # teamVestingList rows: [tokenOwner, amount, cliff, duration, isTeam]
+    return parseDistribution(fileName, 'vestings', multiplier)
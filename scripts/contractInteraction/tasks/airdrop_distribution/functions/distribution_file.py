@@ -0,0 +1,191 @@
+'''
+Streaming validator/parser of the distribution CSV files.
+
+The file is read row by row without printing it. Every row is validated and the errors are reported
+together with their line numbers:
+- amounts are converted to wei with exact integer arithmetic, with exactly as many decimals as the
+  multiplier implies (multiplier 10**16 -> 2 decimals) or as given (decimals=0 for amounts in wei)
+- addresses are checked against their EIP-55 checksum or the EIP-1191 checksum of RSK mainnet/testnet (all
+  lower/upper case addresses are accepted unchecksummed and counted), the keccak of every distinct address is
+  computed once
+- duplicate receivers (with the same vesting schedule for vestings) are aggregated into one row
+
+The result is stored next to the CSV as a columnar artifact (<path>.npz: 20 byte receivers, 32 byte big
+endian amounts, the vesting schedule columns and the metadata), which is reused as long as the CSV is
+unchanged, so the sender scripts do not parse the file again.
+
+usage:
+    data = parseDistribution(path, 'direct', 10**16) # {'receivers', 'amounts', 'totalAmount', ...}
+'''
+from eth_utils import keccak
+from functools import lru_cache
+import csv
+import hashlib
+import json
+import numpy as np
+from os import path as osPath
+import re
+
+# format -> column of each field
+FORMATS = {
+    'direct': {'address': 0, 'amount': 1},
+    'directSOV': {'address': 3, 'amount': 0},
+    'vestings': {'address': 3, 'amount': 0, 'cliff': 5, 'duration': 6, 'type': 7},
+}
+MAX_ERRORS = 100
+# digits with optional thousands commas, optional decimals: no sign, exponent, underscores, nan or infinity
+AMOUNT = re.compile(r'(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d+))?', re.ASCII)
+# EIP-1191 checksums shown by the RSK tooling
+RSK_CHAIN_IDS = (30, 31)
+
+@lru_cache(maxsize=None)
+def checksumAddress(lowerHex, chainId=None):
+    '''
+    EIP-55 checksum of a lower case address without 0x, the EIP-1191 checksum of chainId if given
+    '''
+    hashHex = keccak(text=(str(chainId) + "0x" if chainId != None else "") + lowerHex).hex()
+    return "0x" + "".join(char.upper() if int(hashHex[i], 16) >= 8 else char for i, char in enumerate(lowerHex))
+
+def multiplierDecimals(multiplier, tokenDecimals=18):
+    decimals = len(str(multiplier)) - 1
+    if multiplier != 10**decimals or decimals > tokenDecimals:
+        raise Exception("multiplier must be a power of 10 up to 10**" + str(tokenDecimals) + ": " + str(multiplier))
+    return tokenDecimals - decimals
+
+def toWei(text, decimals, multiplier):
+    '''
+    "1,000.01" -> 1000010000000000000000 with 2 decimals and multiplier 10**16
+    the amount must be digits with optional thousands commas and exactly `decimals` decimals
+    '''
+    text = text.replace(" ", "").replace('"', "")
+    match = AMOUNT.fullmatch(text)
+    if match is None:
+        raise ValueError("not an amount")
+    fraction = match.group(2) if match.group(2) != None else ""
+    if len(fraction) != decimals:
+        raise ValueError("expected " + str(decimals) + " decimals")
+    amount = int(match.group(1).replace(",", "") + fraction)
+    if amount <= 0:
+        raise ValueError("amount must be positive")
+    return amount * multiplier
+
+def validateAddress(text, chainIds=RSK_CHAIN_IDS):
+    '''
+    returns (lower case hex without 0x, whether it carried a checksum)
+    a mixed case address must match its EIP-55 checksum or the EIP-1191 checksum of one of chainIds
+    '''
+    text = text.strip()
+    if len(text) != 42 or not text.startswith("0x"):
+        raise ValueError("invalid address")
+    body = text[2:]
+    try:
+        int(body, 16)
+    except ValueError:
+        raise ValueError("invalid address")
+    lower = body.lower()
+    if body == lower or body == body.upper():
+        return lower, False
+    if checksumAddress(lower) != text and all(checksumAddress(lower, chainId) != text for chainId in chainIds):
+        raise ValueError("checksum mismatch, expected " + checksumAddress(lower) + " (EIP-55) or " +
+            " / ".join(checksumAddress(lower, chainId) + " (chain " + str(chainId) + ")" for chainId in chainIds))
+    return lower, True
+
+def fileHash(fileName):
+    sha = hashlib.sha256()
+    with open(fileName, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+def parseRows(fileName, fileFormat, multiplier, decimals):
+    '''
+    streams and validates the CSV, returns (rows {key: [address, amount, cliff, duration, isTeam]}, stats)
+    raises with all the errors found (up to MAX_ERRORS)
+    '''
+    columns = FORMATS[fileFormat]
+    rows = {}
+    errors = []
+    stats = {"rows": 0, "duplicates": 0, "unchecksummed": 0}
+    with open(fileName, 'r', newline='') as file:
+        for line, row in enumerate(csv.reader(file), start=1):
+            if len(row) == 0 or all(value.strip() == "" for value in row):
+                continue
+            try:
+                address, checksummed = validateAddress(row[columns['address']])
+                amount = toWei(row[columns['amount']], decimals, multiplier)
+                if fileFormat == 'vestings':
+                    cliff, duration = int(row[columns['cliff']]), int(row[columns['duration']])
+                    isTeam = row[columns['type']].strip() != "OwnerVesting"
+                else:
+                    cliff, duration, isTeam = 0, 0, False
+            except (ValueError, IndexError, ArithmeticError) as e:
+                errors.append("line " + str(line) + ": " + str(e) + " - " + ",".join(row))
+                if len(errors) >= MAX_ERRORS:
+                    break
+                continue
+            stats["rows"] += 1
+            if not checksummed:
+                stats["unchecksummed"] += 1
+            # hash index of the receivers, the vesting schedule is part of the key
+            key = (address, cliff, duration, isTeam)
+            if key in rows:
+                stats["duplicates"] += 1
+                rows[key][1] += amount
+            else:
+                rows[key] = [address, amount, cliff, duration, isTeam]
+    if len(errors) > 0:
+        raise Exception('Formatting error:\n' + "\n".join(errors))
+    return rows, stats
+
+def writeArtifact(artifact, rows, meta):
+    values = list(rows.values())
+    np.savez_compressed(artifact,
+        receivers=np.array([list(bytes.fromhex(row[0])) for row in values], dtype=np.uint8).reshape(len(values), 20),
+        amounts=np.array([list(row[1].to_bytes(32, 'big')) for row in values], dtype=np.uint8).reshape(len(values), 32),
+        cliffs=np.array([row[2] for row in values], dtype=np.int64),
+        durations=np.array([row[3] for row in values], dtype=np.int64),
+        isTeam=np.array([row[4] for row in values], dtype=bool),
+        meta=np.array(json.dumps(meta)))
+
+def loadArtifact(artifact):
+    '''
+    returns the parsed distribution: receivers (checksummed), amounts, totalAmount, teamVestingList and the metadata
+    '''
+    with np.load(artifact) as data:
+        meta = json.loads(str(data['meta']))
+        receivers = [checksumAddress(bytes(row).hex()) for row in data['receivers']]
+        amounts = [int.from_bytes(bytes(row), 'big') for row in data['amounts']]
+        cliffs = data['cliffs'].tolist()
+        durations = data['durations'].tolist()
+        isTeam = data['isTeam'].tolist()
+    return {
+        "meta": meta,
+        "totalAmount": sum(amounts),
+        "receivers": receivers,
+        "amounts": amounts,
+        "teamVestingList": [list(row) for row in zip(receivers, amounts, cliffs, durations, isTeam)]
+    }
+
+def parseDistribution(fileName, fileFormat, multiplier, decimals=None, artifact=None):
+    '''
+    fileFormat - 'direct' (address, amount), 'directSOV' (amount, -, -, address) or 'vestings'
+    multiplier - wei = amount without the decimal point * multiplier, usually 10**16
+    decimals - decimals of the amounts in the file, defaults to 18 - log10(multiplier), 0 with multiplier 1 for wei amounts
+    artifact - defaults to <fileName>.npz, reused if it was built from the same file content and settings
+    '''
+    decimals = decimals if decimals != None else multiplierDecimals(multiplier)
+    artifact = artifact if artifact != None else fileName + ".npz"
+    sourceHash = fileHash(fileName)
+    if osPath.exists(artifact):
+        data = loadArtifact(artifact)
+        meta = data["meta"]
+        if meta["source"] == sourceHash and meta["format"] == fileFormat and meta["multiplier"] == str(multiplier) and meta["decimals"] == decimals:
+            print(fileName, "- using", artifact, "-", len(data["receivers"]), "receivers, total:", data["totalAmount"] / 10**18)
+            return data
+    rows, stats = parseRows(fileName, fileFormat, multiplier, decimals)
+    meta = dict(stats, source=sourceHash, format=fileFormat, multiplier=str(multiplier), decimals=decimals)
+    writeArtifact(artifact, rows, meta)
+    data = loadArtifact(artifact)
+    print(fileName, "- rows:", stats["rows"], "duplicates aggregated:", stats["duplicates"], "without checksum:", stats["unchecksummed"],
+        "receivers:", len(data["receivers"]), "total:", data["totalAmount"] / 10**18)
+    return data
@@ -0,0 +1,114 @@
+'''
+Reconciliation of a direct distribution against the TokensTransferred events of GenericTokenSender.
+
+The events of the token are fetched over the block range of the distribution (parallel windows, split
+when the node refuses them), joined in memory with the parsed distribution file and every receiver is
+classified:
+    ok          paid exactly once with the expected amount
+    missing     not paid
+    duplicate   paid more than once, the payments add up to a multiple of the expected amount
+    mismatch    paid a different total amount
+Payments to addresses not in the file are counted as unexpected (other distributions in the same range).
+
+run from CLI (TO_BLOCK defaults to the latest block, FROM_BLOCK to the first block of the file's ledger):
+export RECONCILE_FILE=./scripts/contractInteraction/tasks/airdrop_distribution/data/direct-XUSD-23-09.csv CURRENCY=XUSD FROM_BLOCK=5600000 && \
+brownie run scripts/contractInteraction/tasks/airdrop_distribution/functions/reconcile.py --network rsk-mainnet
+optional: FORMAT=directSOV for the SOV file layout, MULTIPLIER (default 10**16, 1 with CURRENCY=RBTC)
+
+usage from other scripts:
+    report = reconcileDistribution('XUSD', path, 10**16, fromBlock)
+'''
+from brownie import *
+from collections import defaultdict
+from hexbytes import HexBytes
+from os import environ
+import csv
+import time
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.log_scan import getLogsParallel
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.distribution_file import parseDistribution
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.transfer_ledger import TransferLedger, TOKENS_TRANSFERRED
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+def fetchPayments(tokenSenderAddress, tokenAddress, fromBlock, toBlock, step=10000, concurrency=8):
+    '''
+    returns {receiver: [(amount, txHash)]} of the TokensTransferred events of the token in [fromBlock, toBlock]
+    '''
+    logs = getLogsParallel({
+        'address': tokenSenderAddress,
+        'topics': [web3.toHex(web3.keccak(text=TOKENS_TRANSFERRED)), "0x" + str(tokenAddress).lower()[2:].rjust(64, "0")]
+    }, fromBlock, toBlock, step, concurrency)
+    payments = defaultdict(list)
+    for log in logs:
+        receiver = "0x" + HexBytes(log['topics'][2]).hex()[-40:].lower()
+        payments[receiver].append((int.from_bytes(HexBytes(log['data']), 'big'), web3.toHex(log['transactionHash'])))
+    return payments
+
+def joinPayments(receivers, amounts, payments):
+    '''
+    returns (rows [(receiver, expected, paid, number of payments, status)], unexpected payments count)
+    '''
+    rows = []
+    expectedReceivers = set()
+    for receiver, expected in zip(receivers, amounts):
+        received = payments.get(receiver.lower(), [])
+        expectedReceivers.add(receiver.lower())
+        paid = sum(amount for amount, txHash in received)
+        if len(received) == 0:
+            status = "missing"
+        elif len(received) == 1 and paid == expected:
+            status = "ok"
+        elif len(received) > 1 and paid % expected == 0 and all(amount == expected for amount, txHash in received):
+            status = "duplicate"
+        else:
+            status = "mismatch"
+        rows.append((receiver, expected, paid, len(received), status))
+    unexpected = sum(len(received) for receiver, received in payments.items() if receiver not in expectedReceivers)
+    return rows, unexpected
+
+def reconcileDistribution(currency, path, multiplier, fromBlock=None, toBlock=None, fileFormat='direct', decimals=None, reportFile=None):
+    '''
+    fromBlock - defaults to the first block in the ledger of the file (<path>.ledger.jsonl)
+    reportFile - CSV of the receivers not ok, defaults to <path>.reconcile.csv
+    returns the rows of the join (see joinPayments)
+    '''
+    tokenAddress = conf.contracts[currency] if currency != "RBTC" else ZERO_ADDRESS
+    if fromBlock is None:
+        blocks = [entry["block"] for entry in TransferLedger(path + ".ledger.jsonl").entries.values()
+            if entry["token"].lower() == tokenAddress.lower() and "block" in entry]
+        if len(blocks) == 0:
+            raise Exception("no ledger for " + path + ", set fromBlock")
+        fromBlock = min(blocks)
+    toBlock = toBlock if toBlock != None else web3.eth.blockNumber
+
+    data = parseDistribution(path, fileFormat, multiplier, decimals)
+    start = time.time()
+    payments = fetchPayments(conf.contracts['GenericTokenSender'], tokenAddress, fromBlock, toBlock)
+    print("fetched", sum(len(received) for received in payments.values()), "payments of blocks", fromBlock, "-", toBlock,
+        "in", round(time.time() - start, 2), "s")
+
+    rows, unexpected = joinPayments(data["receivers"], data["amounts"], payments)
+    counts = defaultdict(int)
+    for row in rows:
+        counts[row[4]] += 1
+    print("receivers:", len(rows), "-", ", ".join(status + ": " + str(count) for status, count in sorted(counts.items())),
+        "- payments to addresses not in the file:", unexpected)
+    issues = [row for row in rows if row[4] != "ok"]
+    reportFile = reportFile if reportFile != None else path + ".reconcile.csv"
+    with open(reportFile, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["receiver", "expected", "paid", "payments", "status"])
+        writer.writerows(issues)
+    print(len(issues), "issues written to", reportFile)
+    return rows
+
+def main():
+    conf.setReadOnly(True)
+    currency = environ.get('CURRENCY', 'SOV')
+    multiplier = int(environ.get('MULTIPLIER', 1 if currency == "RBTC" else 10**16))
+    reconcileDistribution(currency, environ['RECONCILE_FILE'], multiplier,
+        int(environ['FROM_BLOCK']) if 'FROM_BLOCK' in environ else None,
+        int(environ['TO_BLOCK']) if 'TO_BLOCK' in environ else None,
+        environ.get('FORMAT', 'direct'),
+        0 if currency == "RBTC" else None)
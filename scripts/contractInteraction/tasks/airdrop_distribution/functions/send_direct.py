@@ -3,13 +3,18 @@ running sovryn distribution from GenericTokenSender
 '''
 import csv
 from scripts.contractInteraction.contract_interaction_imports  import *
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.distribution_file import parseDistribution
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.transfer_ledger import sendTransferList
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
-def sendDirect(currency, path, dryRun, multiplier):
+def sendDirect(currency, path, dryRun, multiplier, gasLimit=DEFAULT_GAS_LIMIT, ledger=None):
     '''
     direct token sender script - takes addresses from the file by path
     dryRun - to check that the data will be processed correctly
+    gasLimit - the list is sent in chunks of transferTokensUsingList under this gas
+    ledger - JSONL ledger of the sent chunks, defaults to <path>.ledger.jsonl
+             re-run with the same file after a failure: paid chunks are skipped
     '''
     tokenSender = Contract.from_abi("GenericTokenSender", address=conf.contracts['GenericTokenSender'], abi=GenericTokenSender.abi, owner=conf.acct)
 
@@ -22,7 +27,8 @@ def sendDirect(currency, path, dryRun, multiplier):
     totalAmount += data["totalAmount"]
     # first do a dry run to check the amount then uncomment the next line to do actual distribution
     if(not dryRun):
-        tokenSender.transferTokensUsingList(conf.contracts[currency] if currency != "RBTC" else ZERO_ADDRESS, data["receivers"], data["amounts"])
+        sendTransferList(tokenSender, conf.contracts[currency] if currency != "RBTC" else ZERO_ADDRESS, data["receivers"], data["amounts"],
+            gasLimit, ledger if ledger != None else path + ".ledger.jsonl")
 
     # 282.05, 564.10, 641.03
     print("=======================================")
@@ -34,68 +40,9 @@ def sendDirect(currency, path, dryRun, multiplier):
 
 
 def parseFile(fileName, multiplier):
-    print(fileName)
-    totalAmount = 0
-    receivers = []
-    amounts = []
-    errorMsg = ''
-    with open(fileName, 'r') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            tokenOwner = row[0].replace(" ", "")
-            decimals = row[1].split('.')
-            if(len(decimals) != 2 or len(decimals[1]) != 2):
-                errorMsg+="\n" + tokenOwner + ' amount: ' + row[1]
-            amount = row[1].replace(",", "").replace(".", "")
-            amount = int(amount) * multiplier
-            totalAmount += amount
-
-            receivers.append(tokenOwner)
-            amounts.append(amount)
-
-            print("=======================================")
-            print("'" + tokenOwner + "', ")
-            print(amount)
-
-    print(receivers)
-    print(amounts)
-    if(errorMsg != ''):
-        raise Exception('Formatting error: ' + errorMsg)
-    return {
-               "totalAmount": totalAmount,
-               "receivers": receivers,
-                "amounts": amounts
-            }
+    # amounts with 2 decimals: multiplier 10**16, see distribution_file.py
+    return parseDistribution(fileName, 'direct', multiplier)
 
 def parseFileRBTC(fileName):
-    print(fileName)
-    totalAmount = 0
-    receivers = []
-    amounts = []
-    errorMsg = ''
-    with open(fileName, 'r') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            tokenOwner = row[0].replace(" ", "")
-            amount = row[1].replace(",", "").replace(".", "").replace(" ","")
-            if int(amount) != int(row[1]):
-                errorMsg+="\n" + tokenOwner + ' amount: ' + row[1]
-            amount = int(amount)
-            totalAmount += amount
-
-            receivers.append(tokenOwner)
-            amounts.append(amount)
-
-            print("=======================================")
-            print("'" + tokenOwner + "', ")
-            print(amount)
-
-    print(receivers)
-    print(amounts)
-    if(errorMsg != ''):
-        raise Exception('Formatting error: ' + errorMsg)
-    return {
-               "totalAmount": totalAmount,
-               "receivers": receivers,
-                "amounts": amounts
-            }
+    # amounts in wei
+    return parseDistribution(fileName, 'direct', 1, decimals=0)
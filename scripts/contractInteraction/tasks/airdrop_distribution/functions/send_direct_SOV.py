@@ -3,11 +3,14 @@ running sovryn distribution from GenericTokenSender
 '''
 import csv
 from scripts.contractInteraction.contract_interaction_imports  import *
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.distribution_file import parseDistribution
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.transfer_ledger import sendTransferList
 
-def sendDirectSOV(path, dryRun, multiplier):
+def sendDirectSOV(path, dryRun, multiplier, gasLimit=DEFAULT_GAS_LIMIT, ledger=None):
     '''
     direct token sender script - takes addresses from the file by path
     dryRun - to check that the data will be processed correctly
+    gasLimit, ledger - see sendDirect
     '''
 
     tokenSender = Contract.from_abi("GenericTokenSender", address=conf.contracts['GenericTokenSender'], abi=GenericTokenSender.abi, owner=conf.acct)
@@ -21,7 +24,8 @@ def sendDirectSOV(path, dryRun, multiplier):
     totalAmount += data["totalAmount"]
     # first do a dry run to check the amount then uncomment the next line to do actual distribution
     if(not dryRun):
-        tokenSender.transferTokensUsingList(conf.contracts['SOV'], data["receivers"], data["amounts"])
+        sendTransferList(tokenSender, conf.contracts['SOV'], data["receivers"], data["amounts"],
+            gasLimit, ledger if ledger != None else path + ".ledger.jsonl")
 
     #
     print("=======================================")
@@ -33,36 +37,4 @@ def sendDirectSOV(path, dryRun, multiplier):
 
 
 def parseFile(fileName, multiplier):
-    print(fileName)
-    totalAmount = 0
-    receivers = []
-    amounts = []
-    errorMsg = ''
-    with open(fileName, 'r') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            tokenOwner = row[3].replace(" ", "")
-            decimals = row[0].split('.')
-            if(len(decimals) != 2 or len(decimals[1]) != 2):
-                errorMsg+="\n" + tokenOwner + ' amount: ' + row[0]
-            amount = row[0].replace(",", "").replace(".", "")
-            amount = int(amount) * multiplier
-            totalAmount += amount
-
-            receivers.append(tokenOwner)
-            amounts.append(amount)
-
-            print("=======================================")
-            print("'" + tokenOwner + "', ")
-            print(amount)
-
-    print(receivers)
-    print(amounts)
-    if(errorMsg != ''):
-        raise Exception('Formatting error: ' + errorMsg)
-
-    return {
-               "totalAmount": totalAmount,
-               "receivers": receivers,
-                "amounts": amounts
-            }
+    return parseDistribution(fileName, 'directSOV', multiplier)
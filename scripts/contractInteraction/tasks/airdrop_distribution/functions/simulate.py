@@ -0,0 +1,206 @@
+'''
+Fork simulation of the distribution batches.
+
+dryRun of sendDirect, sendDirectSOV and createVestings only parses the file. The simulations run the whole
+batch against a local hardhat (or ganache) fork of the network from the real executing account and report
+the gas of every row, the total cost in RBTC, the reverts and the balances after the run, so that the
+chunks and the RBTC budget can be sized before the mainnet run.
+
+start a fork of mainnet (see HARDHAT_FORKING.md):
+npm run fork:rsk-mainnet
+run against it with the mainnet contracts, ACC_NAME is the keystore of the executing account (only its address is used):
+export DEV_NET_NAME="mainnet" && brownie run scripts/contractInteraction/tasks/airdrop_distribution/airdrop_distribution.py --network development
+
+usage:
+    simulateSendDirect('XUSD', xusdDistributionPath, 10**16)
+    simulateSendDirectSOV(sovDistributionPath, 10**16)
+    simulateCreateVestings(vestingDistributionPath, 10**16)
+'''
+from brownie import *
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import os
+import tempfile
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract
+from scripts.contractInteraction.gas_chunks import DEFAULT_GAS_LIMIT
+from scripts.contractInteraction.multicall import readCallsChunked
+from scripts.contractInteraction.tx_pipeline import TxJournal
+import scripts.contractInteraction.tasks.airdrop_distribution.functions.send_direct as send_direct
+import scripts.contractInteraction.tasks.airdrop_distribution.functions.send_direct_SOV as send_direct_SOV
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.transfer_ledger import packTransferList
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.create_vestings import createVestings, getVestingJournalKey, parseFile as parseVestingsFile
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+# rsk-mainnet gas_price of brownie-config.yaml, the fork node reports its own price
+DEFAULT_GAS_PRICE = 66000010
+
+def forkAccount(address):
+    '''
+    returns a brownie account sending as address on the fork, no keystore needed
+    hardhat impersonates it, ganache must be started with --unlock address
+    '''
+    if network.show_active() != "development":
+        raise Exception("simulations only run on a local fork (--network development)")
+    try:
+        web3.provider.make_request("hardhat_impersonateAccount", [str(address)])
+    except Exception as e:
+        print("hardhat_impersonateAccount failed, the account must be unlocked on the node:", e)
+    return accounts.at(str(address), force=True)
+
+def useForkAccount():
+    '''
+    replaces conf.acct by the impersonated executing account, so the distribution functions run unchanged
+    '''
+    conf.acct = forkAccount(conf.acct.address)
+    return conf.acct
+
+def readBalances(tokenAddress, holders, concurrency=8):
+    if tokenAddress == ZERO_ADDRESS:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(web3.eth.getBalance, [str(holder) for holder in holders]))
+    token = getContract("ERC20", address=tokenAddress, abi=ERC20.abi)
+    return readCallsChunked([(token.balanceOf, holder) for holder in holders])
+
+def printSimulationReport(rows, totalGas, gasPrice, reportFile=None):
+    '''
+    rows - [{'row', 'gas', 'status', ...}] printed as a table, written to the CSV reportFile if given
+    '''
+    reverts = [row for row in rows if row["status"] != "ok"]
+    print("=======================================")
+    for row in rows:
+        print(" | ".join(str(value) for value in row.values()))
+    print("=======================================")
+    print("rows:", len(rows), "reverts:", len(reverts))
+    for row in reverts:
+        print("revert:", row["row"], row["status"])
+    print("total gas:", totalGas, "gas price:", gasPrice)
+    print("total cost (RBTC):", totalGas * gasPrice / 10**18)
+    if reportFile is not None and len(rows) > 0:
+        with open(reportFile, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+        print("report written to", reportFile)
+
+def simulateTransferList(currency, receivers, amounts, gasPrice=DEFAULT_GAS_PRICE, concurrency=8, reportFile=None, gasLimit=DEFAULT_GAS_LIMIT):
+    '''
+    runs tokenSender.transferTokensUsingList on the fork in the chunks sendTransferList sends (packByGas under gasLimit)
+    per row gas - transferTokensUsingList of the single row, estimated in parallel (the estimates are independent),
+                  a reverting estimate is reported as the revert of the row
+    the chunks are then executed one after the other and the balance of every receiver is checked against its amount
+    returns the report rows
+    '''
+    sender = useForkAccount()
+    tokenAddress = conf.contracts[currency] if currency != "RBTC" else ZERO_ADDRESS
+    tokenSender = Contract.from_abi("GenericTokenSender", address=conf.contracts['GenericTokenSender'], abi=GenericTokenSender.abi, owner=sender)
+
+    def estimateRow(i):
+        try:
+            return tokenSender.transferTokensUsingList.estimate_gas(tokenAddress, [receivers[i]], [amounts[i]], {'from': sender}), "ok"
+        except Exception as e:
+            return 0, "revert: " + str(e).split("\n")[0]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        estimates = list(executor.map(estimateRow, range(0, len(receivers))))
+
+    before = readBalances(tokenAddress, receivers)
+    # chunk number and status of every row
+    chunkOfRow = []
+    chunkStatus = []
+    totalGas = 0
+    for chunk, data, gas in packTransferList(tokenSender, tokenAddress, list(zip(receivers, amounts)), sender, gasLimit):
+        tx = tokenSender.transferTokensUsingList(tokenAddress, [row[0] for row in chunk], [row[1] for row in chunk],
+            {'from': sender, 'allow_revert': True, 'gas_limit': int(gas * 1.2)})
+        totalGas += tx.gas_used
+        if tx.status != 1:
+            print("chunk", len(chunkStatus) + 1, "reverted:", tx.revert_msg, "gas used:", tx.gas_used, "estimated:", gas)
+        print("chunk", len(chunkStatus) + 1, "of", len(chunk), "rows, gas used:", tx.gas_used, "per row:", tx.gas_used // len(chunk))
+        chunkOfRow += [len(chunkStatus) + 1] * len(chunk)
+        chunkStatus.append(tx.status == 1)
+    after = readBalances(tokenAddress, receivers)
+
+    # a receiver listed twice gets its amounts summed
+    expected = {}
+    for receiver, amount in zip(receivers, amounts):
+        expected[receiver.lower()] = expected.get(receiver.lower(), 0) + amount
+
+    rows = []
+    for i in range(0, len(receivers)):
+        received = after[i] - before[i]
+        status = estimates[i][1]
+        if status == "ok" and not chunkStatus[chunkOfRow[i] - 1]:
+            status = "revert: chunk " + str(chunkOfRow[i])
+        elif status == "ok" and all(chunkStatus) and received != expected[receivers[i].lower()]:
+            status = "balance mismatch"
+        rows.append({"row": i + 1, "receiver": receivers[i], "amount": amounts[i], "chunk": chunkOfRow[i], "gas": estimates[i][0],
+            "status": status, "balanceAfter": after[i], "received": received})
+    printSimulationReport(rows, totalGas, gasPrice, reportFile)
+    print("chunks:", len(chunkStatus), "gas used:", totalGas, "per row:", totalGas // max(1, len(receivers)),
+        "sum of single row estimates:", sum(estimate[0] for estimate in estimates))
+    print("GenericTokenSender balance after:", readBalances(tokenAddress, [tokenSender.address])[0] / 10**18)
+    return rows
+
+def simulateSendDirect(currency, path, multiplier, gasPrice=DEFAULT_GAS_PRICE, reportFile=None):
+    '''
+    simulation of sendDirect(currency, path, dryRun, multiplier)
+    '''
+    data = send_direct.parseFileRBTC(path) if currency == "RBTC" else send_direct.parseFile(path, multiplier)
+    return simulateTransferList(currency, data["receivers"], data["amounts"], gasPrice, reportFile=reportFile)
+
+def simulateSendDirectSOV(path, multiplier, gasPrice=DEFAULT_GAS_PRICE, reportFile=None):
+    '''
+    simulation of sendDirectSOV(path, dryRun, multiplier)
+    '''
+    data = send_direct_SOV.parseFile(path, multiplier)
+    return simulateTransferList('SOV', data["receivers"], data["amounts"], gasPrice, reportFile=reportFile)
+
+def simulateCreateVestings(path, multiplier, maxInFlight=8, gasPrice=DEFAULT_GAS_PRICE, reportFile=None):
+    '''
+    simulation of createVestings(path, dryRun, multiplier)
+    the rows are run concurrently by the transaction pipeline like on mainnet, with a throwaway journal, and the gas
+    of every row is the sum of its create/approve/stake receipts
+    '''
+    sender = useForkAccount()
+    SOVtoken = Contract.from_abi("SOV", address=conf.contracts['SOV'], abi=SOV.abi, owner=sender)
+    stakingAddress = conf.contracts['Staking']
+    vestingList = parseVestingsFile(path, multiplier)["teamVestingList"]
+
+    before = readBalances(SOVtoken.address, [sender, stakingAddress])
+    descriptor, journalFile = tempfile.mkstemp(suffix=".journal.jsonl")
+    os.close(descriptor)
+    try:
+        createVestings(path, False, multiplier, maxInFlight, journalFile)
+    except Exception as e:
+        print(e)
+    journal = TxJournal(journalFile)
+    os.remove(journalFile)
+    after = readBalances(SOVtoken.address, [sender, stakingAddress])
+
+    # journal key of a row -> its steps
+    steps = {}
+    for (key, step), entry in journal.entries.items():
+        steps.setdefault(key, []).append((step, entry))
+    txids = [entry["txid"] for rowSteps in steps.values() for step, entry in rowSteps if entry["txid"] is not None]
+    with ThreadPoolExecutor(max_workers=maxInFlight) as executor:
+        receipts = dict(zip(txids, executor.map(web3.eth.getTransactionReceipt, txids)))
+
+    rows = []
+    totalGas = 0
+    for i, vesting in enumerate(vestingList):
+        rowSteps = steps.get(getVestingJournalKey(vesting, i), [])
+        gas = sum(receipts[entry["txid"]].gasUsed for step, entry in rowSteps if entry["txid"] is not None)
+        failed = [step for step, entry in rowSteps if entry["status"] != "confirmed"]
+        stepNames = [step for step, entry in rowSteps]
+        if len(failed) > 0:
+            status = "revert: " + ",".join(failed)
+        elif "stake" not in stepNames:
+            status = "revert: not staked"
+        else:
+            status = "ok"
+        totalGas += gas
+        rows.append({"row": i + 1, "tokenOwner": vesting[0], "amount": vesting[1], "gas": gas, "status": status, "steps": "+".join(stepNames)})
+    printSimulationReport(rows, totalGas, gasPrice, reportFile)
+    print("executing account SOV balance:", before[0] / 10**18, "->", after[0] / 10**18)
+    print("staked SOV:", (after[1] - before[1]) / 10**18, "expected:", sum(vesting[1] for vesting in vestingList) / 10**18)
+    return rows
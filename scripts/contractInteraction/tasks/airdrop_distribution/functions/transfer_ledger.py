@@ -0,0 +1,187 @@
+'''
+Gas-chunked GenericTokenSender distribution with a ledger of the sent chunks.
+
+The receivers/amounts lists are split into transferTokensUsingList calls that fit under the gas limit
+(grown from the estimated gas per receiver, see gas_chunks.py). Every chunk is written to a JSONL ledger,
+keyed by the hash of its content: as pending with its start block and nonce before it is broadcast, as sent
+with its txid, then confirmed or failed.
+
+On restart with the same ledger:
+- the rows of the confirmed chunks are taken out of the distribution (a receiver listed twice with the same
+  amount is paid twice), the rest is chunked again
+- chunks left as sent are looked up by txid, and if the transaction is not known anymore they are reconciled
+  against the TokensTransferred events of GenericTokenSender since the block they were sent at
+- chunks left as pending (a crash around the broadcast) are dropped if their nonce was never used, otherwise
+  they are reconciled against the events once the transaction of the nonce is mined
+
+usage:
+    sendTransferList(tokenSender, tokenAddress, receivers, amounts, ledger=path + ".ledger.jsonl")
+'''
+from brownie import *
+from collections import Counter
+from eth_abi import decode_abi
+from hexbytes import HexBytes
+import hashlib
+import json
+from os import path
+import time
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.gas_chunks import packByGas, DEFAULT_GAS_LIMIT
+from scripts.contractInteraction.log_scan import getLogsParallel
+
+TOKENS_TRANSFERRED = "TokensTransferred(address,address,uint256)"
+RECEIPT_TIMEOUT = 600
+
+def chunkHash(tokenAddress, receivers, amounts):
+    content = json.dumps([str(tokenAddress).lower(), [receiver.lower() for receiver in receivers], [str(amount) for amount in amounts]])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+def rowsOf(entry):
+    return list(zip([receiver.lower() for receiver in entry["receivers"]], [int(amount) for amount in entry["amounts"]]))
+
+class TransferLedger:
+    def __init__(self, fileName):
+        self.fileName = fileName
+        # chunk hash -> latest entry
+        self.entries = {}
+        if fileName != None and path.exists(fileName):
+            with open(fileName) as file:
+                for line in file:
+                    if line.strip() != "":
+                        entry = json.loads(line)
+                        self.entries[entry["hash"]] = entry
+
+    def record(self, entry, status, **fields):
+        entry = dict(entry, status=status, **fields)
+        self.entries[entry["hash"]] = entry
+        if self.fileName != None:
+            with open(self.fileName, 'a') as file:
+                file.write(json.dumps(entry) + "\n")
+        return entry
+
+    def withStatus(self, status, tokenAddress):
+        return [entry for entry in self.entries.values() if entry["status"] == status and entry["token"].lower() == str(tokenAddress).lower()]
+
+    def paidRows(self, tokenAddress):
+        paid = Counter()
+        for entry in self.withStatus("confirmed", tokenAddress):
+            paid.update(rowsOf(entry))
+        return paid
+
+def transferredSince(tokenSender, tokenAddress, fromBlock):
+    '''
+    returns the Counter of (receiver, amount) of the TokensTransferred events of token since fromBlock
+    '''
+    logs = getLogsParallel({
+        'address': tokenSender.address,
+        'topics': [web3.toHex(web3.keccak(text=TOKENS_TRANSFERRED)), "0x" + str(tokenAddress).lower()[2:].rjust(64, "0")]
+    }, fromBlock, web3.eth.blockNumber)
+    return Counter(("0x" + HexBytes(log['topics'][2]).hex()[-40:].lower(), decode_abi(['uint256'], HexBytes(log['data']))[0]) for log in logs)
+
+def reconcileFromEvents(ledger, tokenSender, tokenAddress, entry):
+    '''
+    the chunk is paid only if the events show it, net of the confirmed chunks sent since
+    '''
+    transferred = transferredSince(tokenSender, tokenAddress, entry["block"])
+    for confirmed in ledger.withStatus("confirmed", tokenAddress):
+        if confirmed["block"] >= entry["block"]:
+            transferred.subtract(rowsOf(confirmed))
+    missing = Counter(rowsOf(entry)) - transferred
+    ledger.record(entry, "confirmed" if len(missing) == 0 else "dropped")
+    print("chunk", entry["hash"][:10], "of tx", entry.get("txid"), "reconciled from the events:", "paid" if len(missing) == 0 else "not paid")
+
+def isNonceUsed(sender, nonce):
+    '''
+    False if no transaction of sender with nonce was mined or is waiting in the pool
+    otherwise waits until the transaction of the nonce is mined and returns True
+    '''
+    if web3.eth.getTransactionCount(str(sender), 'pending') <= nonce:
+        return False
+    deadline = time.time() + RECEIPT_TIMEOUT
+    while web3.eth.getTransactionCount(str(sender)) <= nonce:
+        if time.time() > deadline:
+            raise Exception("the transaction of nonce " + str(nonce) + " is not mined after " + str(RECEIPT_TIMEOUT) + " s, re-run later")
+        time.sleep(5)
+    return True
+
+def resolveSentChunks(ledger, tokenSender, tokenAddress):
+    '''
+    settles the chunks sent before a crash: by their receipt, or by the events if the transaction was dropped
+    or its txid was never recorded
+    '''
+    for entry in ledger.withStatus("pending", tokenAddress):
+        if not isNonceUsed(conf.acct, entry["nonce"]):
+            ledger.record(entry, "dropped")
+            print("chunk", entry["hash"][:10], "was not broadcast")
+            continue
+        reconcileFromEvents(ledger, tokenSender, tokenAddress, entry)
+    for entry in ledger.withStatus("sent", tokenAddress):
+        try:
+            receipt = web3.eth.getTransactionReceipt(entry["txid"])
+        except Exception:
+            receipt = None
+        if receipt is None:
+            try:
+                if web3.eth.getTransaction(entry["txid"]) is not None:
+                    receipt = web3.eth.waitForTransactionReceipt(entry["txid"], timeout=RECEIPT_TIMEOUT)
+            except Exception:
+                receipt = None
+        if receipt is not None:
+            ledger.record(entry, "confirmed" if receipt.status == 1 else "failed")
+            continue
+        reconcileFromEvents(ledger, tokenSender, tokenAddress, entry)
+
+def packTransferList(tokenSender, tokenAddress, rows, sender, gasLimit=DEFAULT_GAS_LIMIT):
+    '''
+    rows - [(receiver, amount)]
+    returns the transferTokensUsingList chunks of packByGas, (chunk, data, estimated gas) tuples
+    '''
+    buildData = lambda chunk: tokenSender.transferTokensUsingList.encode_input(tokenAddress, [row[0] for row in chunk], [row[1] for row in chunk])
+    chunks = packByGas(rows, buildData, tokenSender.address, sender, gasLimit)
+    print("transferTokensUsingList packed into", len(chunks), "transactions")
+    return chunks
+
+def sendTransferList(tokenSender, tokenAddress, receivers, amounts, gasLimit=DEFAULT_GAS_LIMIT, ledger=None, dryRun=False):
+    '''
+    tokenAddress - the token, ZERO_ADDRESS for RBTC
+    ledger - JSONL ledger file, re-run with the same file to continue an interrupted distribution
+    returns the list of the chunk hashes sent
+    '''
+    ledger = TransferLedger(ledger)
+    resolveSentChunks(ledger, tokenSender, tokenAddress)
+
+    paid = ledger.paidRows(tokenAddress)
+    rows = []
+    for receiver, amount in zip(receivers, amounts):
+        if paid[(receiver.lower(), amount)] > 0:
+            paid[(receiver.lower(), amount)] -= 1
+        else:
+            rows.append((receiver, amount))
+    if len(rows) < len(receivers):
+        print("skipping", len(receivers) - len(rows), "rows already paid according to", ledger.fileName)
+    if len(rows) == 0:
+        return []
+
+    chunks = packTransferList(tokenSender, tokenAddress, rows, conf.acct, gasLimit)
+    sent = []
+    for chunk, data, gas in chunks:
+        chunkReceivers = [row[0] for row in chunk]
+        chunkAmounts = [row[1] for row in chunk]
+        print("chunk of", len(chunk), "receivers, amount:", sum(chunkAmounts) / 10**18, "estimated gas:", gas)
+        if dryRun:
+            continue
+        entry = {"hash": chunkHash(tokenAddress, chunkReceivers, chunkAmounts), "token": str(tokenAddress),
+            "receivers": chunkReceivers, "amounts": [str(amount) for amount in chunkAmounts]}
+        # recorded before the broadcast, a crash before the txid is written is reconciled by the nonce and the events
+        nonce = web3.eth.getTransactionCount(str(conf.acct), 'pending')
+        entry = ledger.record(entry, "pending", block=web3.eth.blockNumber, nonce=nonce)
+        tx = tokenSender.transferTokensUsingList(tokenAddress, chunkReceivers, chunkAmounts,
+            {'from': conf.acct, 'gas_limit': int(gas * 1.2), 'nonce': nonce, 'required_confs': 0})
+        entry = ledger.record(entry, "sent", txid=tx.txid)
+        receipt = web3.eth.waitForTransactionReceipt(tx.txid, timeout=RECEIPT_TIMEOUT)
+        if receipt.status != 1:
+            ledger.record(entry, "failed")
+            raise Exception("chunk " + entry["hash"] + " reverted: " + tx.txid + " - fix the cause and re-run with the same ledger")
+        ledger.record(entry, "confirmed")
+        sent.append(entry["hash"])
+    return sent
@@ -1,4 +1,6 @@
-from scripts.contractInteraction.contract_interaction_imports  import *
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.aggregator import redeemFromAggregatorWithMS
+from scripts.contractInteraction.multisig import sendTokensFromMultisig
 
 def main():
     '''
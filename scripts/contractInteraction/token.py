@@ -2,6 +2,8 @@ from brownie import *
 import json
 from scripts.utils import * 
 import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.contract_registry import getContract
+from scripts.contractInteraction.multicall import readCalls
 
 def getBalance(contractAddress, acct):
     contract = Contract.from_abi("Token", address=contractAddress, abi=LoanToken.abi, owner=conf.acct)
@@ -91,19 +93,40 @@ def getTotalSupply(contractAddress):
 def deployTestTokenLimited(name, symbol):
     token = conf.acct.deploy(TestTokenLimited, name, symbol, 18, 100000e18)
 
-def printLendingPoolData(iTokenName, tokenName):
-    loanToken = Contract.from_abi("loanToken", address=conf.contracts[iTokenName], abi=LoanTokenLogicStandard.abi, owner=conf.acct)    
+LENDING_POOLS = [["iRBTC", "WRBTC"], ["iUSDT", "USDT"], ["iXUSD", "XUSD"], ["iBPro", "BPro"], ["iDOC", "DoC"], ["iDLLR", "DLLR"]]
+
+def lendingPoolDataCalls(iTokenName, tokenName):
+    loanToken = getContract("loanToken", address=conf.contracts[iTokenName], abi=LoanTokenLogicStandard.abi, owner=conf.acct)
+    token = getContract("Token", address=conf.contracts[tokenName], abi=TestToken.abi, owner=conf.acct)
+    return [
+        (loanToken.totalSupply,),
+        (loanToken.marketLiquidity,),
+        (loanToken.tokenPrice,),
+        (token.balanceOf, loanToken.address)
+    ]
+
+def printLendingPoolValues(iTokenName, tokenName, values):
+    totalSupply, marketLiquidity, tokenPrice, balance = values
     print(iTokenName)
-    print("    - totalSupply():","   ", loanToken.totalSupply()/1e18)
-    print("    - marketLiquidity():", loanToken.marketLiquidity()/1e18)
-    print("    - tokenPrice():","    ", loanToken.tokenPrice()/1e18)
-    print("    - balance:","         ", getBalanceNoPrintOf(conf.contracts[tokenName], loanToken.address)/1e18, tokenName)
-
-
-def printLendingPoolsData():
-    printLendingPoolData("iRBTC", "WRBTC")
-    printLendingPoolData("iUSDT", "USDT")
-    printLendingPoolData("iXUSD", "XUSD")
-    printLendingPoolData("iBPro", "BPro")
-    printLendingPoolData("iDOC", "DoC")
-    printLendingPoolData("iDLLR", "DLLR")
+    print("    - totalSupply():","   ", totalSupply/1e18)
+    print("    - marketLiquidity():", marketLiquidity/1e18)
+    print("    - tokenPrice():","    ", tokenPrice/1e18)
+    print("    - balance:","         ", balance/1e18, tokenName)
+
+def printLendingPoolData(iTokenName, tokenName, batched=True):
+    values = readCalls(lendingPoolDataCalls(iTokenName, tokenName), batched)
+    printLendingPoolValues(iTokenName, tokenName, values)
+
+
+def printLendingPoolsData(batched=True):
+    if not batched:
+        for (iTokenName, tokenName) in LENDING_POOLS:
+            printLendingPoolData(iTokenName, tokenName, False)
+        return
+    # all pools are read with a single Multicall eth_call
+    calls = []
+    for (iTokenName, tokenName) in LENDING_POOLS:
+        calls += lendingPoolDataCalls(iTokenName, tokenName)
+    values = readCalls(calls)
+    for i in range(0, len(LENDING_POOLS)):
+        printLendingPoolValues(LENDING_POOLS[i][0], LENDING_POOLS[i][1], values[i * 4:(i + 1) * 4])
@@ -0,0 +1,138 @@
+'''
+Pipelined transaction submitter with local nonce management and a crash-safe journal.
+
+Rows of a batch (e.g. one vesting per CSV row) are processed concurrently, up to maxInFlight rows at
+once. Inside a row the steps stay sequential (create -> approve -> stake): every step waits for the
+receipt of the previous one, so dependent calls can be estimated against the updated state.
+Nonces are assigned locally under a lock right before broadcasting, so the transactions of all rows
+go out back to back without waiting for each other's confirmations.
+
+Every step is journaled (JSONL): sent with its txid and nonce, then confirmed or failed.
+After a crash the same batch can be restarted with the same journal: confirmed steps are skipped,
+steps sent but not confirmed are looked up by txid and only re-sent if the transaction was dropped.
+
+usage:
+    def processRow(pipeline, row):
+        pipeline.execute(row.key, 'approve', token.approve, spender, amount)
+        pipeline.execute(row.key, 'stake', vesting.stakeTokens, amount)
+
+    pipeline = TxPipeline(conf.acct, maxInFlight=8, journal='./batch.journal.jsonl')
+    pipeline.run(rows, processRow)
+'''
+from brownie import *
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+import time
+from os import path
+
+class TxJournal:
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.lock = threading.Lock()
+        # (key, step) -> latest entry
+        self.entries = {}
+        if fileName != None and path.exists(fileName):
+            with open(fileName) as file:
+                for line in file:
+                    if line.strip() != "":
+                        entry = json.loads(line)
+                        self.entries[(entry["key"], entry["step"])] = entry
+
+    def get(self, key, step):
+        return self.entries.get((key, step))
+
+    def record(self, key, step, status, txid=None, nonce=None):
+        entry = {"key": key, "step": step, "status": status, "txid": txid, "nonce": nonce, "time": int(time.time())}
+        with self.lock:
+            self.entries[(key, step)] = entry
+            if self.fileName != None:
+                with open(self.fileName, 'a') as file:
+                    file.write(json.dumps(entry) + "\n")
+        return entry
+
+    def isDone(self, key, step):
+        entry = self.get(key, step)
+        return entry is not None and entry["status"] == "confirmed"
+
+class TxPipeline:
+    '''
+    sender - the brownie account sending the transactions
+    maxInFlight - max number of rows processed (and so transactions pending) at once
+    journal - JSONL journal file, None to run without one
+    gasBuffer - multiplier of the gas estimate used as gas limit
+    timeout - seconds to wait for a receipt
+    '''
+    def __init__(self, sender, maxInFlight=8, journal=None, gasBuffer=1.2, timeout=600):
+        self.sender = sender
+        self.maxInFlight = maxInFlight
+        self.journal = TxJournal(journal)
+        self.gasBuffer = gasBuffer
+        self.timeout = timeout
+        self.nonceLock = threading.Lock()
+        self.nonce = None
+        self.sent = 0
+        self.skipped = 0
+
+    def _send(self, method, args):
+        # estimate first: a reverting estimate must not consume a nonce
+        gasLimit = int(method.estimate_gas(*args, {'from': self.sender}) * self.gasBuffer)
+        with self.nonceLock:
+            if self.nonce is None:
+                self.nonce = web3.eth.getTransactionCount(str(self.sender), 'pending')
+            tx = method(*args, {'from': self.sender, 'nonce': self.nonce, 'gas_limit': gasLimit, 'required_confs': 0})
+            self.nonce += 1
+            self.sent += 1
+            return tx.txid, self.nonce - 1
+
+    def _waitForReceipt(self, txid):
+        return web3.eth.waitForTransactionReceipt(txid, timeout=self.timeout)
+
+    def _isKnown(self, txid):
+        try:
+            return web3.eth.getTransaction(txid) is not None
+        except Exception:
+            return False
+
+    def execute(self, key, step, method, *args):
+        '''
+        sends method(*args) as the step of the row key and waits for its receipt
+        returns the receipt, None if the step was already confirmed in the journal
+        '''
+        entry = self.journal.get(key, step)
+        if entry is not None and entry["status"] == "confirmed":
+            self.skipped += 1
+            return None
+        if entry is not None and entry["status"] == "sent" and self._isKnown(entry["txid"]):
+            # sent before a crash and still known to the node: wait for it instead of sending it twice
+            txid = entry["txid"]
+        else:
+            txid, nonce = self._send(method, args)
+            self.journal.record(key, step, "sent", txid, nonce)
+        receipt = self._waitForReceipt(txid)
+        if receipt.status != 1:
+            self.journal.record(key, step, "failed", txid)
+            raise Exception(key + " - " + step + " reverted: " + txid)
+        self.journal.record(key, step, "confirmed", txid)
+        return receipt
+
+    def run(self, rows, rowFn):
+        '''
+        runs rowFn(pipeline, row) for all rows, up to maxInFlight rows concurrently
+        returns the list of (row, exception) of the failed rows
+        '''
+        failed = []
+        start = time.time()
+
+        def runRow(row):
+            try:
+                rowFn(self, row)
+            except Exception as e:
+                print("row failed:", row, e)
+                failed.append((row, e))
+
+        with ThreadPoolExecutor(max_workers=self.maxInFlight) as executor:
+            list(executor.map(runRow, rows))
+        print("rows:", len(rows), "failed:", len(failed), "transactions sent:", self.sent, "steps skipped (journal):", self.skipped,
+            "time:", round(time.time() - start, 2), "s")
+        return failed
@@ -5,72 +5,84 @@ import json
 import csv
 import math
 import os
+from scripts.contractInteraction.gas_chunks import packByGas
+from scripts.contractInteraction.multicall import readCallsChunked
+from scripts.contractInteraction.tx_pipeline import TxPipeline
 
-totalAmountSatoshi = 0
-totalAmountSOV = 0
-totalCount = 0
-chunkSize = 250
-rowNumber = 0
-chunksProcessed = 0
-appendAddresses = []
-appendAmounts = []
 # https://github.com/DistributedCollective/SIPS/blob/main/SIP-0006(A1).md
 EX_RATE = 9736
 MULTIPLIER = 10**18
+# share of the block gas limit a chunk may use
+BLOCK_GAS_SHARE = 0.9
+# the chunks (row ranges) planned on the first run, reused by the re-runs so they match the journal
+PLAN_FILE = './scripts/deployment/orig_claim_plan.json'
+JOURNAL_FILE = './scripts/deployment/orig_claim.journal.jsonl'
 
 
 def main():
-    
+    '''
+    appends the investors of dataFile to OriginInvestorsClaim
+    - an investor listed several times gets one entry with the sum of the amounts
+    - the chunks are sized from estimate_gas to fit the block gas limit, the plan is kept in PLAN_FILE
+    - the chunks are sent pipelined with local nonces (MAX_IN_FLIGHT, default 4) and journaled in JOURNAL_FILE,
+      re-run to continue after a failure: confirmed chunks are skipped, sent ones are awaited instead of re-sent
+    - the on-chain amounts and totals are verified with batched investorsAmountsList reads
+    dry run by default: only prints the totals and the chunks, SEND=1 sends the transactions
     '''
     thisNetwork = network.show_active()
     if thisNetwork == "development":
         acct = accounts[0]
         configFile = open(
             './scripts/contractInteraction/testnet_contracts.json')
-        ownerDelay = 3*60*60
-        adminDelay = 3*60*60
     elif thisNetwork == "testnet":
         acct = accounts.load("rskdeployer")
         configFile = open(
             './scripts/contractInteraction/testnet_contracts.json')
-        ownerDelay = 2*24*60*60
-        adminDelay = 1*24*60*60
     elif thisNetwork == "rsk-mainnet":
         acct = accounts.load("rskdeployer")
         configFile = open(
             './scripts/contractInteraction/mainnet_contracts.json')
-        ownerDelay = 2*24*60*60
-        adminDelay = 1*24*60*60
     else:
         raise Exception("network not supported")
-    '''
-    global rowNumber, chunkSize
+
+    contracts = json.load(configFile)
+    claimContract = Contract.from_abi(
+        "OriginInvestorsClaim", address=contracts['OriginInvestorsClaim'], abi=OriginInvestorsClaim.abi, owner=acct)
+
     #dataFile = './scripts/deployment/origin_claim_list.csv' if thisNetwork == 'rsk-mainnet' else './scripts/deployment/origin_claim_test_list_3238.csv'
     dataFile = './scripts/deployment/origin_claim_list.csv'
-    with open(dataFile, 'r') as file:
-        # reader = csv.reader(file)
-        reader = csv.DictReader(file)
-        rowNumber = 0
-        for row in reader:
-            rowNumber += 1
-            processRow(row)
-            if (rowNumber % chunkSize == 0):
-                appendInvestorsList()
-
-        if (rowNumber % chunkSize != 0):
-            appendInvestorsList()
-        totalCount = rowNumber
-
-    print(f'totalCount: {totalCount}')
-    print(f'chunkSize: {chunkSize}')
-    print(f'chunksProcessed: {chunksProcessed}')
+    investors, amounts, totalAmountSatoshi = readInvestors(dataFile)
+    totalAmountSOV = sum(amounts)
+    print(f'totalCount: {len(investors)}')
     print(f'totalAmountSatoshi: {totalAmountSatoshi}')
     print(f'totalAmountSOV: {totalAmountSOV}')
 
+    send = os.environ.get('SEND') == "1"
+    rows = list(zip(investors, amounts))
+    chunks = readPlan(claimContract.address, dataFile, len(rows))
+    if chunks == None:
+        gasLimit = int(web3.eth.getBlock('latest').gasLimit * BLOCK_GAS_SHARE)
+        buildData = lambda chunk: claimContract.appendInvestorsAmountsList.encode_input([row[0] for row in chunk], [row[1] for row in chunk])
+        chunks = []
+        start = 0
+        for chunk, data, gas in packByGas(rows, buildData, claimContract.address, acct, gasLimit):
+            chunks.append((start, start + len(chunk)))
+            start += len(chunk)
+        print(f'gas limit per chunk: {gasLimit}')
+        if send:
+            writePlan(claimContract.address, dataFile, len(rows), chunks)
+    else:
+        print(f'chunks planned in {PLAN_FILE}')
+    print(f'chunks: {len(chunks)} (sizes: {[end - start for start, end in chunks]})')
+    if send:
+        appendInvestorsList(claimContract, acct, rows, chunks)
+    else:
+        print('dry run, set SEND=1 to append the investors')
+
+    verifyInvestorsList(claimContract, investors, amounts)
+
     totals = f'''
-    totalCount: {totalCount}
-    chunkSize: {chunkSize}
-    chunksProcessed: {chunksProcessed}
+    totalCount: {len(investors)}
     totalAmountSatoshi: {totalAmountSatoshi}
     totalAmountSOV: {totalAmountSOV}
     Notify origin investors that they can claim their tokens with the cliff == duration == Mar 26 2021
@@ -78,27 +90,72 @@ def main():
     print(totals)
 
 
-def appendInvestorsList():
-    global chunksProcessed, rowNumber, chunksProcessed
-    global appendAddresses, appendAmounts
-    # claimContract.appendInvestorsAmountsList(
-    #    appendAddresses, appendAmounts)
-    chunksProcessed += 1
-    print(f'appending at row: {rowNumber}, chunk: {chunksProcessed}')
-    #print(f'appendAddresses: {appendAddresses}')
-    #print(f'appendAmounts: {appendAmounts}')
-    appendAddresses = []
-    appendAmounts = []
-
-
-def processRow(row):
-    global satoshiAmount
-    global appendAddresses, appendAmounts, totalAmountSatoshi, totalAmountSOV
-    satoshiAmount = int(row['value'])
-    SOVAmount = satoshiAmount * MULTIPLIER / EX_RATE
-    appendAddresses.append(row['web3 address'])
-    appendAmounts.append(SOVAmount)
-    totalAmountSatoshi += satoshiAmount
-    totalAmountSOV += SOVAmount
+def readInvestors(dataFile):
+    '''
+    returns the investors in the order of their first row, the amounts in wei and the total in satoshi
+    the satoshi amounts of an investor listed several times are added up (the contract would keep only the first one)
+    '''
+    satoshiAmounts = {}
+    investors = {}
+    totalAmountSatoshi = 0
+    with open(dataFile, 'r') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            satoshiAmount = int(row['value'])
+            investor = row['web3 address'].strip()
+            investors.setdefault(investor.lower(), investor)
+            satoshiAmounts[investor.lower()] = satoshiAmounts.get(investor.lower(), 0) + satoshiAmount
+            totalAmountSatoshi += satoshiAmount
+    # integer arithmetic, a float would round the wei amounts
+    amounts = [satoshiAmounts[key] * MULTIPLIER // EX_RATE for key in investors]
+    return list(investors.values()), amounts, totalAmountSatoshi
+
+
+def readPlan(claimAddress, dataFile, rowCount):
+    if not os.path.exists(PLAN_FILE):
+        return None
+    with open(PLAN_FILE) as file:
+        plan = json.load(file)
+    if plan['claimContract'] != claimAddress or plan['dataFile'] != dataFile or plan['rows'] != rowCount:
+        raise Exception(PLAN_FILE + ' belongs to another contract or file, remove it and ' + JOURNAL_FILE + ' to start over')
+    return [tuple(chunk) for chunk in plan['chunks']]
+
+
+def writePlan(claimAddress, dataFile, rowCount, chunks):
+    with open(PLAN_FILE, 'w') as file:
+        json.dump({'claimContract': claimAddress, 'dataFile': dataFile, 'rows': rowCount, 'chunks': chunks}, file)
+
+
+def appendInvestorsList(claimContract, acct, rows, chunks):
+    '''
+    sends the chunks pipelined, each chunk is a journal entry keyed by its row range
+    '''
+    def appendChunk(pipeline, chunk):
+        start, end = chunk
+        print(f'appending rows: {start}-{end}')
+        pipeline.execute(str(start) + '-' + str(end), 'append', claimContract.appendInvestorsAmountsList,
+            [row[0] for row in rows[start:end]], [row[1] for row in rows[start:end]])
+
+    pipeline = TxPipeline(acct, maxInFlight=int(os.environ.get('MAX_IN_FLIGHT', 4)), journal=JOURNAL_FILE)
+    failed = pipeline.run(chunks, appendChunk)
+    if len(failed) > 0:
+        raise Exception(f'{len(failed)} chunks failed, re-run to continue from {JOURNAL_FILE}')
+
+
+def verifyInvestorsList(claimContract, investors, amounts):
+    '''
+    compares investorsAmountsList, investorsQty and totalAmount with the file
+    '''
+    expected = {investor.lower(): (investor, amount) for investor, amount in zip(investors, amounts)}
+    onChain = readCallsChunked([(claimContract.investorsAmountsList, investor) for investor, amount in expected.values()])
+    mismatches = [(investor, amount, onChain[i]) for i, (investor, amount) in enumerate(expected.values()) if onChain[i] != amount]
+    for investor, amount, actual in mismatches[:20]:
+        print(f'mismatch: {investor} expected: {amount} on chain: {actual}')
+    investorsQty, totalAmount = readCallsChunked([(claimContract.investorsQty,), (claimContract.totalAmount,)])
+    expectedTotal = sum(amount for investor, amount in expected.values())
+    print(f'investors: {len(expected)} mismatches: {len(mismatches)}')
+    print(f'investorsQty: {investorsQty} expected: {len(expected)}')
+    print(f'totalAmount: {totalAmount} expected: {expectedTotal}')
+    return len(mismatches) == 0 and investorsQty == len(expected) and totalAmount == expectedTotal
 
 # brownie run /d/Projects/sovryn/Sovryn-smart-contracts/scripts/deployment/deploy_orig_claim_read_file.py --network testnet
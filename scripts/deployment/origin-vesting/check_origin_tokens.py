@@ -5,6 +5,10 @@ import json
 import csv
 import math
 from datetime import date
+import asyncio
+from scripts.contractInteraction.async_reads import AsyncReadEngine
+
+OUTPUT_FILE = './scripts/deployment/origin-vesting/origin_tokens_check.csv'
 
 def main():
     thisNetwork = network.show_active()
@@ -29,34 +33,37 @@ def main():
     staking = Contract.from_abi("Staking", address=contracts['Staking'], abi=interface.IStaking.abi, owner=acct)
     vestingRegistry = Contract.from_abi("VestingRegistry2", address=contracts['VestingRegistry2'], abi=VestingRegistry2.abi, owner=acct)
 
-    totalBalance = 0
-    totalStaked = 0
-    totalVested = 0
-    # parse data
-    print("account,balance,staked,vested(Origin))")
+    totals = {"balance": 0, "staked": 0, "vested": 0}
+
+    async def readRow(engine, row):
+        user = row[1]
+        balance, stakedTokens, vestingAddress = await asyncio.gather(
+            engine.call(SOVtoken.balanceOf, user),
+            engine.call(staking.balanceOf, user),
+            engine.call(vestingRegistry.getVesting, user)
+        )
+        # the staked balance of the vesting depends on the vesting address
+        if stakedTokens > 0:
+            vestedTokens, stakes = await asyncio.gather(engine.call(staking.balanceOf, vestingAddress), engine.call(staking.getStakes, user))
+        else:
+            vestedTokens = await engine.call(staking.balanceOf, vestingAddress)
+        totals["balance"] += balance
+        totals["staked"] += stakedTokens
+        totals["vested"] += vestedTokens
+
+        data = [user, balance / 10**18, stakedTokens / 10**18, vestedTokens / 10**18]
+        if (stakedTokens > 0):
+            ts = stakes[0][0]
+            data += [str(date.fromtimestamp(ts)), str(stakes[0])]
+        return data
+
+    # parse data - rows are read concurrently and written to the output file in input order
     with open('./scripts/deployment/origin-vesting/origin_claim_list.csv', 'r') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            user = row[1]
-
-            balance = SOVtoken.balanceOf(user)
-            totalBalance += balance
-
-            stakedTokens = staking.balanceOf(user)
-            totalStaked += stakedTokens
-
-            vestingAddress = vestingRegistry.getVesting(user)
-            vestedTokens = staking.balanceOf(vestingAddress)
-            totalVested += vestedTokens
-
-            data = user + "," + str(balance / 10**18) + "," + str(stakedTokens / 10**18) + "," + str(vestedTokens / 10**18)
-            if (stakedTokens > 0):
-                stakes = staking.getStakes(user)
-                ts = stakes[0][0]
-                # data += "," + time.strftime("%Y-%m-%d %H:%M:%S", ts) +  "," + str(stakes[0])
-                data += "," + str(date.fromtimestamp(ts)) +  "," + str(stakes[0])
-            print(data)
-
-    print("totalBalance: " + str(totalBalance / 10**18))
-    print("totalStaked: " + str(totalStaked / 10**18))
-    print("totalVested: " + str(totalVested / 10**18))
+        rows = list(csv.reader(file))
+    engine = AsyncReadEngine(concurrency=16)
+    engine.streamToCsv(rows, readRow, OUTPUT_FILE, header=["account", "balance", "staked", "vested(Origin)"])
+    print("written to", OUTPUT_FILE)
+
+    print("totalBalance: " + str(totals["balance"] / 10**18))
+    print("totalStaked: " + str(totals["staked"] / 10**18))
+    print("totalVested: " + str(totals["vested"] / 10**18))
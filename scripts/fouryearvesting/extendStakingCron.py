@@ -4,8 +4,11 @@ from brownie.network.contract import InterfaceContainer
 import json
 import csv
 import time
-import math
 from os import environ
+from scripts.contractInteraction.tx_pipeline import TxPipeline
+from scripts.fouryearvesting.extension_schedule import ExtensionSchedule
+
+JOURNAL_FILE = './scripts/fouryearvesting/extend_staking_journal.jsonl'
 
 def main():
     global contracts, acct
@@ -33,10 +36,7 @@ def main():
     # load deployed contracts addresses
     contracts = json.load(configFile)
 
-    # Read last staking timestamp
-    def readLockDate(timestamp):
-        staking = Contract.from_abi("Staking", address=contracts['Staking'], abi=interface.IStaking.abi, owner=acct)
-        return staking.timestampToLockDate(timestamp)
+    staking = Contract.from_abi("Staking", address=contracts['Staking'], abi=interface.IStaking.abi, owner=acct)
 
     # open the file in universal line ending mode 
     with open('./scripts/fouryearvesting/addfouryearvestingstoregistry.csv', 'rU') as infile:
@@ -54,30 +54,26 @@ def main():
     tokenOwners = data['tokenOwner']
     vestingAddresses = data['vestingAddress']
 
-    for i in vestingAddresses:
-        print('vestingAddress:', i)
+    # only the vestings new to the schedule are read (REFRESH_ALL=1 re-reads all of them)
+    datenow = time.time()
+    schedule = ExtensionSchedule(staking)
+    read = schedule.refresh(vestingAddresses, datenow, environ.get('REFRESH_ALL') == "1")
+    due = schedule.due(datenow)
+    print('vestings:', len(vestingAddresses), 'read:', read, 'with extensions left:', schedule.pending(), 'due:', len(due))
+
+    def extend(pipeline, entry):
+        vestingAddress, nextDate = entry
+        print('vestingAddress:', vestingAddress, 'extension date:', nextDate)
         fourYearVestingLogic = Contract.from_abi(
             "FourYearVestingLogic",
-            address=i,
+            address=vestingAddress,
             abi=FourYearVestingLogic.abi,
             owner=acct)
-        startDate = fourYearVestingLogic.startDate()
-        print('startDate:', startDate)
-        datenow = time.time()
-        timeLockDate = readLockDate(datenow)
-        print('timeLockDate:', timeLockDate)
-        extendDurationFor = fourYearVestingLogic.extendDurationFor()
-        print('extendDurationFor:', extendDurationFor)
-        DAY = 24 * 60 * 60
-        FOUR_WEEKS = 4 * 7 * DAY
-        maxIterations = extendDurationFor / FOUR_WEEKS 
-        print('maxIterations:', maxIterations)
-        result = ((timeLockDate - startDate) % FOUR_WEEKS) # the cron should run every four weeks from start date
-        newResult = ((timeLockDate - startDate) / FOUR_WEEKS) # the cron should run for maxIterations only
-        timediff = datenow - timeLockDate # To avoid execution on consecutive weeks
-        print('result:', result)
-        print('newResult:', math.floor(newResult))
-        print('timediff:', timediff)
-        print('-----------------------------------------------------')
-        if ((result == 0) and (math.floor(newResult) >= 1) and (math.floor(newResult) <= maxIterations) and (timediff < 86400) ):
-            fourYearVestingLogic.extendStaking()
\ No newline at end of file
+        pipeline.execute(vestingAddress + "-" + str(nextDate), "extendStaking", fourYearVestingLogic.extendStaking)
+        schedule.extended(vestingAddress, datenow)
+
+    # the extensions are independent: sent concurrently with local nonces, the journal prevents double sends after a crash
+    pipeline = TxPipeline(acct, maxInFlight=int(environ.get('MAX_IN_FLIGHT', 8)), journal=JOURNAL_FILE)
+    failed = pipeline.run(due, extend)
+    if len(failed) > 0:
+        raise Exception(str(len(failed)) + " extensions failed, they stay due for the next run")
@@ -0,0 +1,110 @@
+'''
+Persistent schedule of the FourYearVesting staking extensions.
+
+extendStaking of a FourYearVesting is due every four weeks from its startDate, for extendDurationFor.
+The schedule stores the next extension date of every vesting in SQLite, indexed by date, so the cron only
+reads the vestings of the CSV it has not seen yet (in one batch) and selects the due ones with an index range
+query instead of calling startDate/extendDurationFor/timestampToLockDate for every vesting on every run.
+
+Vestings not staked yet (startDate 0) are kept without a date and read again on the next refresh.
+A vesting missing a run stays due until it is extended: extendStaking extends all the past lock dates at once.
+
+usage:
+    schedule = ExtensionSchedule(staking)
+    schedule.refresh(vestingAddresses, time.time())
+    for vesting, nextDate in schedule.due(time.time()):
+        ...
+        schedule.extended(vesting, time.time())
+'''
+from brownie import *
+import sqlite3
+import threading
+from scripts.contractInteraction.multicall import readCallsChunked
+from scripts.staking.weight_math import timestampToLockDate
+
+DEFAULT_PATH = './scripts/fouryearvesting/extension_schedule.sqlite'
+DAY = 24 * 60 * 60
+FOUR_WEEKS = 4 * 7 * DAY
+
+def nextExtensionDate(startDate, extendDurationFor, lockDate):
+    '''
+    returns the first extension date (startDate + k * FOUR_WEEKS, 1 <= k <= extendDurationFor / FOUR_WEEKS) at or after
+    lockDate, None if the extensions are over
+    '''
+    periods = max(1, -(-(lockDate - startDate) // FOUR_WEEKS))
+    if periods > extendDurationFor // FOUR_WEEKS:
+        return None
+    return startDate + periods * FOUR_WEEKS
+
+class ExtensionSchedule:
+    '''
+    staking - the Staking contract, its kickoffTS defines the lock dates
+    path - SQLite file of the schedule
+    '''
+    def __init__(self, staking, path=DEFAULT_PATH):
+        self.path = path
+        # extended() is called from the threads of the transaction pipeline
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS schedule (vesting TEXT PRIMARY KEY, startDate INTEGER NOT NULL, extendDurationFor INTEGER NOT NULL,
+                nextDate INTEGER);
+            CREATE INDEX IF NOT EXISTS schedule_next_date ON schedule (nextDate);
+        ''')
+        row = self.db.execute("SELECT value FROM meta WHERE key='kickoffTS'").fetchone()
+        if row is None:
+            self.kickoffTS = staking.kickoffTS()
+            with self.db:
+                self.db.execute("INSERT INTO meta VALUES ('kickoffTS', ?)", (str(self.kickoffTS),))
+        else:
+            self.kickoffTS = int(row[0])
+
+    def lockDate(self, timestamp):
+        return timestampToLockDate(int(timestamp), self.kickoffTS)
+
+    def refresh(self, vestingAddresses, timestamp, refreshAll=False):
+        '''
+        reads startDate and extendDurationFor of the vestings not in the schedule yet and of the ones not staked yet
+        (all of them with refreshAll) in one batch and stores their next extension date
+        returns the number of vestings read
+        '''
+        known = {row[0]: row[1] for row in self.db.execute('SELECT vesting, startDate FROM schedule')}
+        toRead = [address for address in vestingAddresses if refreshAll or known.get(address.lower(), 0) == 0]
+        if len(toRead) == 0:
+            return 0
+        vestings = [Contract.from_abi("FourYearVestingLogic", address=address, abi=FourYearVestingLogic.abi) for address in toRead]
+        values = readCallsChunked([(vesting.startDate,) for vesting in vestings] + [(vesting.extendDurationFor,) for vesting in vestings])
+        lockDate = self.lockDate(timestamp)
+        with self.db:
+            for i in range(0, len(toRead)):
+                startDate = values[i]
+                extendDurationFor = values[len(toRead) + i]
+                nextDate = nextExtensionDate(startDate, extendDurationFor, lockDate) if startDate != 0 else None
+                self.db.execute('INSERT OR REPLACE INTO schedule VALUES (?, ?, ?, ?)', (toRead[i].lower(), startDate, extendDurationFor, nextDate))
+        return len(toRead)
+
+    def due(self, timestamp):
+        '''
+        returns [(vesting, nextDate)] of the vestings with an extension date at or before the lock date of timestamp
+        '''
+        return self.db.execute('SELECT vesting, nextDate FROM schedule WHERE nextDate IS NOT NULL AND nextDate <= ? ORDER BY nextDate',
+            (self.lockDate(timestamp),)).fetchall()
+
+    def extended(self, vesting, timestamp):
+        '''
+        moves the vesting to its next extension date after the lock date of timestamp
+        '''
+        with self.lock:
+            startDate, extendDurationFor = self.db.execute('SELECT startDate, extendDurationFor FROM schedule WHERE vesting=?',
+                (vesting.lower(),)).fetchone()
+            nextDate = nextExtensionDate(startDate, extendDurationFor, self.lockDate(timestamp) + 1)
+            with self.db:
+                self.db.execute('UPDATE schedule SET nextDate=? WHERE vesting=?', (nextDate, vesting.lower()))
+        return nextDate
+
+    def pending(self):
+        '''
+        returns the number of vestings with extensions left
+        '''
+        return self.db.execute('SELECT COUNT(*) FROM schedule WHERE nextDate IS NOT NULL').fetchone()[0]
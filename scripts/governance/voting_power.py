@@ -0,0 +1,126 @@
+'''
+Offline historical voting power engine.
+
+Rebuilds the voting power of every delegatee, and the total voting power, at any indexed block
+from the staking index (scripts/staking/staking_index.py) and the local weight math
+(scripts/staking/weight_math.py), without getPriorVotes/getPriorTotalVotingPower calls.
+The contract arithmetic is followed exactly: power = stake * weight / WEIGHT_FACTOR per lock date,
+summed over the lock dates from the lock date of the vote timestamp to MAX_DURATION later.
+
+run from CLI - syncs the index, writes the voting power of all delegatees at BLOCK (defaults to the
+last indexed block) and validates the result against the contract:
+export BLOCK=5000000 && brownie run scripts/governance/voting_power.py --network rsk-mainnet
+
+usage from other scripts:
+    engine = VotingPowerEngine(index, staking.kickoffTS())
+    votes = engine.allVotesAt(proposal.startBlock, proposal.startTime)
+'''
+from brownie import *
+from os import environ
+import csv
+import random
+import time
+import scripts.contractInteraction.config as conf
+from scripts.staking.staking_index import StakingIndex
+from scripts.staking.weight_math import timestampToLockDate, weightTable, power
+
+OUTPUT_FILE = './scripts/governance/voting_power.csv'
+
+class VotingPowerEngine:
+    '''
+    index - a synced StakingIndex
+    kickoffTS - staking.kickoffTS(), the first lock date
+    '''
+    def __init__(self, index, kickoffTS):
+        self.index = index
+        self.kickoffTS = kickoffTS
+        self.weightTables = {}
+
+    def weights(self, timestamp):
+        '''
+        returns {lockDate: weight} of the lock dates counted for a vote at timestamp
+        '''
+        startDate = timestampToLockDate(int(timestamp), self.kickoffTS)
+        if startDate not in self.weightTables:
+            dates, weights = weightTable(startDate)
+            self.weightTables[startDate] = dict(zip(dates.tolist(), weights.tolist()))
+        return self.weightTables[startDate]
+
+    def _sumPower(self, stakes, weights):
+        # (account, lockDate, stake) -> {account: power}, floored per lock date like the contract
+        powers = {}
+        for account, lockDate, stake in stakes:
+            weight = weights.get(lockDate)
+            if weight is not None:
+                powers[account] = powers.get(account, 0) + power(stake, weight)
+        return powers
+
+    def votesAt(self, account, blockNumber, timestamp):
+        '''
+        staking.getPriorVotes(account, blockNumber, timestamp)
+        '''
+        weights = self.weights(timestamp)
+        account = str(account).lower()
+        return sum(power(self.index.delegateStakeOf(account, lockDate, blockNumber), weight) for lockDate, weight in weights.items())
+
+    def allVotesAt(self, blockNumber, timestamp):
+        '''
+        returns {delegatee: votes} of all delegatees with voting power at blockNumber
+        '''
+        return self._sumPower(self.index.delegateStakesAt(blockNumber), self.weights(timestamp))
+
+    def weightedStakesAt(self, blockNumber, timestamp):
+        '''
+        returns {staker: weighted stake} of all stakers (staking.getPriorWeightedStake, used by the fee sharing)
+        '''
+        return self._sumPower(self.index.userStakesAt(blockNumber), self.weights(timestamp))
+
+    def totalVotingPowerAt(self, blockNumber, timestamp):
+        '''
+        staking.getPriorTotalVotingPower(blockNumber, timestamp)
+        '''
+        weights = self.weights(timestamp)
+        totals = self.index.totalStakesAt(blockNumber)
+        return sum(power(stake, weights[lockDate]) for lockDate, stake in totals.items() if lockDate in weights)
+
+def validate(engine, staking, blockNumber, timestamp, votes, samples=50):
+    '''
+    compares the engine with the contract: the total voting power and the votes of a sample of delegatees
+    returns the list of mismatches
+    '''
+    mismatches = []
+    expected = staking.getPriorTotalVotingPower(blockNumber, timestamp)
+    computed = engine.totalVotingPowerAt(blockNumber, timestamp)
+    if computed != expected:
+        mismatches.append(("total", computed, expected))
+    delegatees = list(votes.keys())
+    for delegatee in random.sample(delegatees, min(samples, len(delegatees))):
+        expected = staking.getPriorVotes(delegatee, blockNumber, timestamp)
+        if votes[delegatee] != expected:
+            mismatches.append((delegatee, votes[delegatee], expected))
+    return mismatches
+
+def main():
+    conf.setReadOnly(True)
+    staking = Contract.from_abi("Staking", address=conf.contracts['Staking'], abi=interface.IStaking.abi, owner=conf.acct)
+    index = StakingIndex(conf.contracts['Staking'], startBlock=int(environ.get('START_BLOCK', 0)))
+    index.sync()
+
+    blockNumber = int(environ.get('BLOCK', index.lastSyncedBlock()))
+    blockTime = web3.eth.getBlock(blockNumber).timestamp
+    engine = VotingPowerEngine(index, staking.kickoffTS())
+
+    start = time.time()
+    votes = engine.allVotesAt(blockNumber, blockTime)
+    print("voting power of", len(votes), "delegatees at block", blockNumber, "computed in", round(time.time() - start, 3), "s")
+
+    with open(OUTPUT_FILE, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["delegatee", "votes"])
+        for delegatee, votingPower in sorted(votes.items(), key=lambda item: item[1], reverse=True):
+            writer.writerow([delegatee, votingPower])
+
+    mismatches = validate(engine, staking, blockNumber, blockTime, votes)
+    for mismatch in mismatches:
+        print("mismatch:", mismatch[0], "computed:", mismatch[1], "contract:", mismatch[2])
+    print("validation against the contract:", "OK" if len(mismatches) == 0 else str(len(mismatches)) + " mismatches")
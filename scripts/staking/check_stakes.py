@@ -3,12 +3,25 @@ from brownie import *
 import calendar
 import time
 import json
+import numpy as np
+from os import environ, path
+from scripts.contractInteraction.async_reads import AsyncReadEngine
+from scripts.contractInteraction.multicall import readCalls
+from scripts.contractInteraction.rpc_batch import readCallsRpc
+from scripts.staking.weight_math import timestampToLockDate, TWO_WEEKS
+
+HISTORY_FILE = './scripts/staking/stake_schedule.npz'
+LOCK_DATES = 78
 
 def main():
-    thisNetwork = network.show_active()
+    '''
+    prints the total stake per lock date (the stake schedule) for the next 78 lock dates
+    brownie run scripts/staking/check_stakes.py --network rsk-mainnet
 
-    DAY = 24 * 60 * 60
-    TWO_WEEKS = 2 * 7 * DAY
+    optionally backfills the schedule at past blocks into HISTORY_FILE (fromBlock,toBlock,step):
+    export BACKFILL=4000000,5000000,2880 && brownie run scripts/staking/check_stakes.py --network rsk-mainnet
+    '''
+    thisNetwork = network.show_active()
 
     # == Load config =======================================================================================================================
     if thisNetwork == "development":
@@ -31,11 +44,82 @@ def main():
     ts = calendar.timegm(time.gmtime())
     lockedTS = staking.timestampToLockDate(ts)
 
-    totalAmount = 0
-    for i in range(1, 79):
-        lockedTS += TWO_WEEKS
-        amount = staking.getCurrentStakedUntil(lockedTS)
-        totalAmount += amount
+    lockDates, amounts = readStakeSchedule(staking, lockedTS)
+    for amount in amounts:
         print(amount / 10**18)
 
-    print("totalAmount: ", totalAmount / 10**18)
+    print("totalAmount: ", sum(amounts) / 10**18)
+
+    backfill = environ.get('BACKFILL')
+    if backfill != None:
+        fromBlock, toBlock, step = [int(value) for value in backfill.split(',')]
+        backfillStakeSchedule(staking, range(fromBlock, toBlock + 1, step))
+
+def readStakeSchedule(staking, lockedTS, blockIdentifier=None):
+    '''
+    returns (lockDates, amounts) of the 78 lock dates after lockedTS, read with one batched call
+    blockIdentifier - block to read the schedule at (JSON-RPC batch, single calls on a websocket network; works before the Multicall deployment too)
+    '''
+    lockDates = [lockedTS + i * TWO_WEEKS for i in range(1, LOCK_DATES + 1)]
+    calls = [(staking.getCurrentStakedUntil, lockDate) for lockDate in lockDates]
+    if blockIdentifier is None:
+        return lockDates, readCalls(calls)
+    return lockDates, readCallsRpc(calls, blockIdentifier)
+
+def backfillStakeSchedule(staking, blocks, concurrency=8):
+    '''
+    reads the stake schedule at each of the blocks in parallel and merges it into HISTORY_FILE:
+        blocks, timestamps - the sampled blocks
+        lockDates - all lock dates seen in the samples
+        stakes - float64 [lockDate, block] matrix of the total stake in SOV, 0 outside of the schedule of a block
+    blocks already in the file are skipped, so a daily run only reads the new blocks
+    '''
+    history = loadStakeSchedule()
+    known = set(history['blocks'].tolist())
+    blocks = [block for block in blocks if block not in known]
+    kickoffTS = staking.kickoffTS()
+
+    def readAt(block):
+        timestamp = web3.eth.getBlock(block).timestamp
+        lockDates, amounts = readStakeSchedule(staking, timestampToLockDate(timestamp, kickoffTS), block)
+        return block, timestamp, lockDates, amounts
+
+    async def readRow(engine, block):
+        return await engine.call(readAt, block)
+
+    start = time.time()
+    engine = AsyncReadEngine(concurrency=concurrency)
+    samples = engine.mapRows(blocks, readRow)
+    engine.close()
+
+    schedules = {}
+    for i in range(0, len(history['blocks'])):
+        column = history['stakes'][:, i]
+        schedules[int(history['blocks'][i])] = (int(history['timestamps'][i]), dict(zip(history['lockDates'].tolist(), column.tolist())))
+    for block, timestamp, lockDates, amounts in samples:
+        schedules[block] = (timestamp, {lockDate: amount / 10**18 for lockDate, amount in zip(lockDates, amounts)})
+
+    sortedBlocks = sorted(schedules.keys())
+    allLockDates = sorted(set(lockDate for block in sortedBlocks for lockDate, amount in schedules[block][1].items() if amount != 0))
+    row = {lockDate: i for i, lockDate in enumerate(allLockDates)}
+    stakes = np.zeros((len(allLockDates), len(sortedBlocks)), dtype=np.float64)
+    for j, block in enumerate(sortedBlocks):
+        for lockDate, amount in schedules[block][1].items():
+            if amount != 0:
+                stakes[row[lockDate], j] = amount
+    np.savez_compressed(HISTORY_FILE,
+        blocks=np.array(sortedBlocks, dtype=np.int64),
+        timestamps=np.array([schedules[block][0] for block in sortedBlocks], dtype=np.int64),
+        lockDates=np.array(allLockDates, dtype=np.int64),
+        stakes=stakes)
+    print("backfilled", len(samples), "blocks in", round(time.time() - start, 2), "s -", len(sortedBlocks), "blocks in", HISTORY_FILE)
+
+def loadStakeSchedule(fileName=HISTORY_FILE):
+    '''
+    returns the stored schedule history (see backfillStakeSchedule), empty arrays if there is none yet
+    '''
+    if not path.exists(fileName):
+        return {'blocks': np.zeros(0, dtype=np.int64), 'timestamps': np.zeros(0, dtype=np.int64),
+            'lockDates': np.zeros(0, dtype=np.int64), 'stakes': np.zeros((0, 0), dtype=np.float64)}
+    with np.load(fileName) as data:
+        return {key: data[key] for key in data.files}
@@ -2,10 +2,12 @@ from brownie import *
 
 import json
 import csv
+import os
+from scripts.contractInteraction.multicall import readCallsChunked
 
-def main():
-    ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+def main():
     thisNetwork = network.show_active()
     if thisNetwork == "development":
         acct = accounts[0]
@@ -35,84 +37,83 @@ def main():
 
     INPUT_FILE = "./scripts/staking/users.csv"
     OUTPUT_FILE = "./scripts/staking/vestings.json"
+    BATCH_SIZE = 500
 
+    # users already in the output file are skipped, a set keeps the lookups O(1) on 100k users crawls
     users = getUsers(OUTPUT_FILE)
 
-    usersSet = set()
-
     currentTS = chain.time() #or literal 1661730293
 
     jsonFile = open(OUTPUT_FILE, "a")
     with open(INPUT_FILE, 'r') as file:
         reader = csv.reader(file)
+        batch = []
         for row in reader:
             user = row[0]
-            usersSet.add(user)
-            print(user)
             if user in users:
                 continue
-            vestings = getUserVestings(vestingRegistry, user)
-            vestingDataList = []
-            if (len(vestings) == 0):
-                vestingData = {
-                    "user": user,
-                    "vesting": ZERO_ADDRESS,
-                    "dates": [],
-                    "amounts": []
-                }
-                vestingDataList.append(vestingData)
-            for vesting in vestings:
-                stakes = staking.getStakes(vesting)
-                amount = 0
-                dates = stakes[0]
-                amounts = stakes[1]
-                if (len(dates) > 0):
-                    for idx, lockDate in enumerate(dates):
-                        if (currentTS > lockDate):
-                            amount += amounts[idx]
-                            print(lockDate)
-                    amount /= 10**18
-                    vestingData = {
-                        "user": user,
-                        "vesting": vesting,
-                        "amount": amount,
-                        "dates": stakes[0],
-                        "amounts": stakes[1]
-                    }
-                    vestingDataList.append(vestingData)
-            for data in vestingDataList:
-                jsonFile.write(json.dumps(data) + "\n")
-
-    # usersSetFile = open("./scripts/staking/users2.csv", "a")
-    # for user in usersSet:
-    #     usersSetFile.write(user + "\n")
-    # print("len(usersSet) =", len(usersSet))
+            users.add(user)
+            batch.append(user)
+            if len(batch) == BATCH_SIZE:
+                writeVestingData(jsonFile, crawlVestings(vestingRegistry, staking, batch, currentTS))
+                batch = []
+        writeVestingData(jsonFile, crawlVestings(vestingRegistry, staking, batch, currentTS))
+    jsonFile.close()
 
 def getUsers(fileName):
+    users = set()
+    if not os.path.exists(fileName):
+        return users
     with open(fileName) as file:
-        lines = file.readlines()
-    users = []
-    for line in lines:
-        vestingData = json.loads(line)
-        users.append(vestingData["user"])
+        for line in file:
+            if line.strip() != "":
+                users.add(json.loads(line)["user"])
     return users
 
-def getUserVestings(vestingRegistry, user):
-    DAY = 24 * 60 * 60
-    FOUR_WEEKS = 4 * 7 * DAY
-    MONTHS_10 = 10 * FOUR_WEEKS
-    MONTHS_26 = 26 * FOUR_WEEKS # 2 year: 4 weeks * 10 * 2 = 
-    WEEKS_156 = 156 * 7 * DAY # 4 year: 4 weeks * 10 (10 months - 1 year) * 4 == 160, 160 - 4 (cliff) = 156
-    LOCKEDSOV_DURATION = 24192000 # 10 months
-    cliff = FOUR_WEEKS
-    vestings = []
-    durationTypes = [[LOCKEDSOV_DURATION, 0], [MONTHS_10, 3], [MONTHS_26, 1], [WEEKS_156, 4]]
-    for durationType in durationTypes:
-        vesting = vestingRegistry.getVestingAddr(user, cliff, durationType[0], durationType[1]) 
-        if (vesting != ZERO_ADDRESS):
-            vestings.append(vesting)
-        vesting = vestingRegistry.getTeamVesting(user, cliff, durationType[0], durationType[1]) 
-        if (vesting != ZERO_ADDRESS):
-            vestings.append(vesting)
-    
-    return vestings
+def writeVestingData(jsonFile, vestingDataList):
+    for data in vestingDataList:
+        jsonFile.write(json.dumps(data) + "\n")
+    # a batch is written completely or not at all before the next one starts, a restart continues after it
+    jsonFile.flush()
+
+def crawlVestings(vestingRegistry, staking, users, currentTS):
+    '''
+    returns the vestings.json entries of the users: the vestings of every user (VestingRegistryLogic.getVestingsOf)
+    and their stakes, each read with concurrent Multicall batches
+    '''
+    if len(users) == 0:
+        return []
+    vestingsOfUsers = readCallsChunked([(vestingRegistry.getVestingsOf, user) for user in users])
+    vestings = [(user, vesting[2]) for user, userVestings in zip(users, vestingsOfUsers) for vesting in userVestings]
+    stakesOfVestings = readCallsChunked([(staking.getStakes, vesting) for user, vesting in vestings], chunkSize=50)
+
+    vestingDataByUser = {user: [] for user in users}
+    for (user, vesting), stakes in zip(vestings, stakesOfVestings):
+        dates = list(stakes[0])
+        amounts = list(stakes[1])
+        if len(dates) == 0:
+            continue
+        amount = 0
+        for idx, lockDate in enumerate(dates):
+            if currentTS > lockDate:
+                amount += amounts[idx]
+        vestingDataByUser[user].append({
+            "user": user,
+            "vesting": vesting,
+            "amount": amount / 10**18,
+            "dates": dates,
+            "amounts": amounts
+        })
+
+    vestingDataList = []
+    for user in users:
+        if len(vestingDataByUser[user]) == 0:
+            vestingDataByUser[user].append({
+                "user": user,
+                "vesting": ZERO_ADDRESS,
+                "dates": [],
+                "amounts": []
+            })
+        vestingDataList += vestingDataByUser[user]
+    print("users:", len(users), "vestings:", len(vestings))
+    return vestingDataList
@@ -4,6 +4,8 @@ import calendar
 import time
 import json
 from datetime import datetime
+import numpy as np
+from scripts.staking.weight_math import computeWeightsByDate, TWO_WEEKS, WEIGHT_FACTOR
 
 def main():
     thisNetwork = network.show_active()
@@ -27,12 +29,10 @@ def main():
     ts = calendar.timegm(time.gmtime())
     lockedTS = staking.timestampToLockDate(ts)
 
-    DAY = 24 * 60 * 60
-    TWO_WEEKS = 2 * 7 * DAY
-    WEIGHT_FACTOR = staking.WEIGHT_FACTOR()
+    # the weights are computed locally (scripts/staking/weight_math.py) instead of 78 computeWeightByDate calls
+    lockedDates = lockedTS + TWO_WEEKS * np.arange(1, 79, dtype=np.int64)
+    weights = computeWeightsByDate(lockedDates, ts) / WEIGHT_FACTOR
 
-    for i in range(1, 79):
-        lockedDate = lockedTS + i*TWO_WEEKS
-        weight = staking.computeWeightByDate(lockedDate, ts) / WEIGHT_FACTOR
-        lockedDate = datetime.utcfromtimestamp(lockedDate).strftime('%Y-%m-%d')
-        print(lockedDate, "-", weight)
+    for i in range(0, len(lockedDates)):
+        lockedDate = datetime.utcfromtimestamp(int(lockedDates[i])).strftime('%Y-%m-%d')
+        print(lockedDate, "-", weights[i])
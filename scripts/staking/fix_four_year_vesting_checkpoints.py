@@ -6,6 +6,7 @@ import csv
 import time
 import math
 from os import environ
+from scripts.staking.vesting_stakes import collectFourYearVestingStakes, vestingStakesDiff, printVestingStakesDiff, submitVestingStakes
 
 def main():
     global contracts, acct
@@ -33,11 +34,6 @@ def main():
     # load deployed contracts addresses
     contracts = json.load(configFile)
 
-    # Read last staking timestamp
-    def readLockDate(timestamp):
-        staking = Contract.from_abi("Staking", address=contracts['Staking'], abi=interface.IStaking.abi, owner=acct)
-        return staking.timestampToLockDate(timestamp)
-
     # open the file in universal line ending mode 
     with open('./scripts/fouryearvesting/addfouryearvestingstoregistry.csv', 'rU') as infile:
         #read the file as a dictionary for each row ({header : value})
@@ -53,56 +49,17 @@ def main():
     # extract the variables you want
     tokenOwners = data['tokenOwner']
     vestingAddresses = data['vestingAddress']
-    totalStakeByLockDates = {}
-    DAY = 24 * 60 * 60
-    FOUR_WEEKS = 4 * 7 * DAY
-
-    for i in vestingAddresses:
-        staking = Contract.from_abi("Staking", address=contracts['Staking'], abi=interface.IStaking.abi, owner=acct)
+    staking = Contract.from_abi("Staking", address=contracts['Staking'], abi=interface.IStaking.abi, owner=acct)
 
-        print('vestingAddress:', i)
-        fourYearVestingLogic = Contract.from_abi(
-            "FourYearVestingLogic",
-            address=i,
-            abi=FourYearVestingLogic.abi,
-            owner=acct)
-        startDate = fourYearVestingLogic.startDate()
-        endDate = fourYearVestingLogic.endDate()
-        for lockDate in range(startDate, endDate+1, FOUR_WEEKS):
-          numVestingStakeCheckpoints = staking.numUserStakingCheckpoints(i,lockDate)
-          if numVestingStakeCheckpoints > 0:
-            vestingStakeCheckpoints = staking.userStakingCheckpoints(i,lockDate,0)
-            totalStake = vestingStakeCheckpoints[1]
-            # print(totalStake)
-            if lockDate not in totalStakeByLockDates:
-              totalStakeByLockDates[lockDate] = totalStake
-            else:
-              totalStakeByLockDates[lockDate] += totalStake
-    
+    totalStakeByLockDates = collectFourYearVestingStakes(staking, vestingAddresses)
     print('list total stake by lock dates')
     print(json.dumps(totalStakeByLockDates, indent=2))
-    for lockDate in totalStakeByLockDates:
-      # we only need to fix the old staking date which is only until 1748600895.
-      # locked date greater than this number can be considered as the extended staking one, and we don't want to process it.
-      if lockDate > 1748600895:
-        continue
-
-      currentTotalVestingStake = 0;
-      print(lockDate, ' -> ', totalStakeByLockDates[lockDate])
-      print('set to vesting stake...')
-      currentNumVestingStakeCheckpoints = staking.numVestingCheckpoints(lockDate)
-
-      # If vesting stake for this lock date exist, we need to add it.
-      if currentNumVestingStakeCheckpoints > 0:
-        currentVestingStakeCheckpoints = staking.vestingCheckpoints(lockDate, currentNumVestingStakeCheckpoints-1)
-        currentTotalVestingStake = currentVestingStakeCheckpoints[1]
 
-      print('current total vesting stake for date: ', lockDate, ':', currentTotalVestingStake)
+    # we only need to fix the old staking date which is only until 1748600895.
+    # locked date greater than this number can be considered as the extended staking one, and we don't want to process it.
+    # the four year vesting stakes are added to the current vesting stake of each lock date
+    diff = vestingStakesDiff(staking, totalStakeByLockDates, addCurrent=True, maxLockDate=1748600895)
+    printVestingStakesDiff(diff)
 
-      vestingStakeAmount = totalStakeByLockDates[lockDate]+currentTotalVestingStake
-      print('new vesting stake amount: ', vestingStakeAmount)
-      data = staking.setVestingStakes.encode_input([lockDate], [vestingStakeAmount])
-      multisig = Contract.from_abi("MultiSig", address=contracts['multisig'], abi=MultiSigWallet.abi, owner=acct)
-      tx = multisig.submitTransaction(staking.address,0,data)
-      txId = tx.events["Submission"]["transactionId"]
-      print("txid",txId);
+    # DRY_RUN=1 only prints the diff and the packed multisig transactions
+    submitVestingStakes(staking, diff, contracts['multisig'], acct, dryRun=environ.get('DRY_RUN') == "1")
@@ -1,10 +1,10 @@
 from brownie import *
 
 import json
+from os import environ
+from scripts.staking.vesting_stakes import readVestingStakes, aggregateStakes, vestingStakesDiff, printVestingStakesDiff, submitVestingStakes, LEDGER_FILE
 
 def main():
-    ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
-
     thisNetwork = network.show_active()
     if thisNetwork == "development":
         acct = accounts[0]
@@ -25,37 +25,16 @@ def main():
 
     INPUT_FILE = "./scripts/staking/vestings.json"
 
-    vestingStakes = {}
-    with open(INPUT_FILE) as file:
-        lines = file.readlines()
-    for line in lines:
-        vestingData = json.loads(line)
-        if (vestingData["vesting"]) != ZERO_ADDRESS:
-            dates = vestingData["dates"]
-            amounts = vestingData["amounts"]
-            for id, date in enumerate(dates):
-                amount = amounts[id]
-                oldAmount = 0
-                if date in vestingStakes:
-                    oldAmount = int(vestingStakes[date])
-                vestingStakes[date] = oldAmount + int(amount)
+    # the file is streamed, the stakes are summed per lock date as integers
+    vestingStakes = aggregateStakes(readVestingStakes(INPUT_FILE))
 
     print(vestingStakes)
     print("=====================================")
 
-    dates = []
-    amounts = []
-    for key in vestingStakes:
-        dates.append(key)
-        amounts.append(vestingStakes[key])
-
-    print(dates)
-    print(amounts)
-
-    # staking.setVestingStakes(dates, amounts, {'allow_revert':True})
+    # the totals replace the current vesting stakes, unchanged lock dates are not sent
+    diff = vestingStakesDiff(staking, vestingStakes, addCurrent=False)
+    printVestingStakesDiff(diff)
 
-    # data = staking.setVestingStakes.encode_input(dates, amounts)
-    # multisig = Contract.from_abi("MultiSig", address=contracts['multisig'], abi=MultiSigWallet.abi, owner=acct)
-    # tx = multisig.submitTransaction(staking.address,0,data)
-    # txId = tx.events["Submission"]["transactionId"]
-    # print("txid",txId);
+    # split into multisig transactions under the gas limit, the ledger lets an interrupted run continue
+    # DRY_RUN=1 only prints the packed transactions
+    submitVestingStakes(staking, diff, contracts['multisig'], acct, dryRun=environ.get('DRY_RUN') == "1", ledger=LEDGER_FILE)
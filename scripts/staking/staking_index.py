@@ -0,0 +1,285 @@
+'''
+Event sourced index of the staking state (user stakes, delegates and delegate stakes per lock date).
+
+The Staking events are ingested into SQLite, so audit scripts can read "stakes/delegates of X at
+block B" locally instead of calling getStakes/userStakingCheckpoints/delegates per user and lock date.
+Logs are fetched in block ranges adapted to the log density (halved on RPC errors, grown while the
+ranges stay sparse) and every range is committed together with the last synced block, so an
+interrupted sync resumes where it stopped.
+
+How the state is derived from the events (mirrors StakingStakeModule/StakingWithdrawModule):
+    TokensStaked             user stake at lockedUntil = totalStaked
+    ExtendedStakingDuration  amountStaked moves from previousDate to newDate, the delegate moves along
+                             unless newDate already has one
+    StakingWithdrawn         user stake at until decreases by the withdrawn amount - the event carries the
+                             amount after the early unstaking penalty, the full amount is taken from the
+                             delegate stake decrease emitted in the same transaction
+    DelegateChanged          delegate of (delegator, lockedUntil) = toDelegate
+    DelegateStakeChanged     delegate stake at lockedUntil = newBalance
+
+run from CLI (START_BLOCK - first block to index, ideally the Staking deployment block):
+export START_BLOCK=2800000 && brownie run scripts/staking/staking_index.py --network rsk-mainnet
+
+usage from other scripts:
+    index = StakingIndex(conf.contracts['Staking'])
+    index.sync()
+    dates, amounts = index.stakesAt(vesting, blockNumber)
+'''
+from brownie import *
+from eth_abi import decode_abi
+from hexbytes import HexBytes
+from os import environ
+import requests
+import sqlite3
+import time
+import scripts.contractInteraction.config as conf
+
+DEFAULT_PATH = './scripts/staking/staking_index.sqlite'
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+CONFIRMATIONS = 12
+
+# event name -> (signature, non indexed data types)
+EVENTS = {
+    "TokensStaked": ("TokensStaked(address,uint256,uint256,uint256)", ['uint256', 'uint256', 'uint256']),
+    "ExtendedStakingDuration": ("ExtendedStakingDuration(address,uint256,uint256,uint256)", ['uint256', 'uint256', 'uint256']),
+    "StakingWithdrawn": ("StakingWithdrawn(address,uint256,uint256,address,bool)", ['uint256', 'uint256', 'bool']),
+    "DelegateChanged": ("DelegateChanged(address,uint256,address,address)", ['uint256']),
+    "DelegateStakeChanged": ("DelegateStakeChanged(address,uint256,uint256,uint256)", ['uint256', 'uint256', 'uint256'])
+}
+
+# table -> (account column, value column)
+TABLE_COLUMNS = {
+    'user_stakes': ('staker', 'stake'),
+    'delegates': ('delegator', 'delegatee'),
+    'delegate_stakes': ('delegatee', 'stake')
+}
+
+# RPC errors after which the block range is halved, e.g. "query returned more than 10000 results" or a timeout
+RANGE_ERRORS = (ValueError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+def position(blockNumber, logIndex):
+    # orders the checkpoints of a block by log index, several updates in a block keep the last one like the contract
+    return (blockNumber << 20) | logIndex
+
+def topicAddress(topic):
+    return "0x" + HexBytes(topic).hex()[-40:].lower()
+
+class StakingIndex:
+    '''
+    stakingAddress - the Staking proxy, the modules emit their events from it
+    path - SQLite file of the index
+    minStep/maxStep - bounds of the adaptive getLogs block range
+    targetLogs - the range grows while a response has less logs than this and shrinks above twice as many
+    '''
+    def __init__(self, stakingAddress, path=DEFAULT_PATH, startBlock=0, minStep=100, maxStep=100000, targetLogs=2000):
+        self.stakingAddress = str(stakingAddress).lower()
+        self.path = path
+        self.startBlock = startBlock
+        self.minStep = minStep
+        self.maxStep = maxStep
+        self.targetLogs = targetLogs
+        self.step = maxStep
+        self.topics = {web3.toHex(web3.keccak(text=EVENTS[name][0])): name for name in EVENTS}
+        self.db = sqlite3.connect(path)
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS user_stakes (staker TEXT NOT NULL, lockDate INTEGER NOT NULL, position INTEGER NOT NULL, stake TEXT NOT NULL,
+                PRIMARY KEY (staker, lockDate, position));
+            CREATE TABLE IF NOT EXISTS delegates (delegator TEXT NOT NULL, lockDate INTEGER NOT NULL, position INTEGER NOT NULL, delegatee TEXT NOT NULL,
+                PRIMARY KEY (delegator, lockDate, position));
+            CREATE TABLE IF NOT EXISTS delegate_stakes (delegatee TEXT NOT NULL, lockDate INTEGER NOT NULL, position INTEGER NOT NULL, stake TEXT NOT NULL,
+                PRIMARY KEY (delegatee, lockDate, position));
+            CREATE INDEX IF NOT EXISTS delegate_stakes_position ON delegate_stakes (position);
+        ''')
+        indexed = self._getMeta('stakingAddress')
+        if indexed is None:
+            self._setMeta('stakingAddress', self.stakingAddress)
+            self.db.commit()
+        elif indexed != self.stakingAddress:
+            raise Exception("the index at " + path + " is of the staking contract " + indexed)
+
+    def _getMeta(self, key):
+        row = self.db.execute('SELECT value FROM meta WHERE key=?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _setMeta(self, key, value):
+        self.db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, str(value)))
+
+    def lastSyncedBlock(self):
+        value = self._getMeta('lastBlock')
+        return self.startBlock - 1 if value is None else int(value)
+
+    # == Sync ==============================================================================================================================
+
+    def sync(self, toBlock=None):
+        '''
+        ingests the events from the last synced block up to toBlock (defaults to the latest block minus CONFIRMATIONS)
+        returns the number of ingested logs
+        '''
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber - CONFIRMATIONS
+        start = self.lastSyncedBlock() + 1
+        ingested = 0
+        startTime = time.time()
+        while start <= toBlock:
+            end = min(start + self.step - 1, toBlock)
+            try:
+                logs = self._getLogs(start, end)
+            except RANGE_ERRORS:
+                if end == start:
+                    raise
+                self.step = max(1, (end - start + 1) // 2)
+                continue
+            logs.sort(key=lambda log: (log['blockNumber'], log['logIndex']))
+            with self.db:
+                self._ingest(logs)
+                self._setMeta('lastBlock', end)
+            ingested += len(logs)
+            if len(logs) < self.targetLogs:
+                self.step = min(self.step * 2, self.maxStep)
+            elif len(logs) > self.targetLogs * 2:
+                self.step = max(self.minStep, self.step // 2)
+            print("synced blocks", start, "-", end, "logs:", len(logs), "next range:", self.step)
+            start = end + 1
+        print("staking index synced up to block", self.lastSyncedBlock(), "- logs:", ingested, "time:", round(time.time() - startTime, 2), "s")
+        return ingested
+
+    def _getLogs(self, fromBlock, toBlock):
+        return list(web3.eth.getLogs({
+            'address': web3.toChecksumAddress(self.stakingAddress),
+            'fromBlock': fromBlock,
+            'toBlock': toBlock,
+            'topics': [list(self.topics.keys())]
+        }))
+
+    def _ingest(self, logs):
+        # the state a log applies to is read up to the position of the log: the rows written for the earlier
+        # logs of the same range are not committed as synced yet, but they are already in the tables
+        # delegate stake decreases of the current transaction, to recover the withdrawn amount before the penalty
+        txHash = None
+        decreases = {}
+        for log in logs:
+            name = self.topics.get(web3.toHex(log['topics'][0]))
+            if name is None:
+                continue
+            if log['transactionHash'] != txHash:
+                txHash = log['transactionHash']
+                decreases = {}
+            pos = position(log['blockNumber'], log['logIndex'])
+            account = topicAddress(log['topics'][1])
+            data = decode_abi(EVENTS[name][1], HexBytes(log['data']))
+            if name == "TokensStaked":
+                amount, lockDate, totalStaked = data
+                self._write('user_stakes', account, lockDate, pos, totalStaked)
+            elif name == "ExtendedStakingDuration":
+                previousDate, newDate, amount = data
+                self._write('user_stakes', account, previousDate, pos, max(self._stakeBefore(account, previousDate, pos) - amount, 0))
+                self._write('user_stakes', account, newDate, pos, self._stakeBefore(account, newDate, pos) + amount)
+                delegateFrom = self._delegateBefore(account, previousDate, pos)
+                self._write('delegates', account, previousDate, pos, ZERO_ADDRESS)
+                if self._delegateBefore(account, newDate, pos) == ZERO_ADDRESS:
+                    self._write('delegates', account, newDate, pos, delegateFrom)
+            elif name == "StakingWithdrawn":
+                amount, until, isGovernance = data
+                amount = max(amount, decreases.pop(until, 0))
+                self._write('user_stakes', account, until, pos, max(self._stakeBefore(account, until, pos) - amount, 0))
+            elif name == "DelegateChanged":
+                lockDate = data[0]
+                self._write('delegates', account, lockDate, pos, topicAddress(log['topics'][3]))
+            elif name == "DelegateStakeChanged":
+                lockDate, previousBalance, newBalance = data
+                self._write('delegate_stakes', account, lockDate, pos, newBalance)
+                if newBalance < previousBalance:
+                    decreases[lockDate] = previousBalance - newBalance
+
+    def _write(self, table, account, lockDate, pos, value):
+        self.db.execute('INSERT OR REPLACE INTO ' + table + ' VALUES (?, ?, ?, ?)', (account, lockDate, pos, str(value)))
+
+    def _stakeBefore(self, staker, lockDate, pos):
+        row = self._latestBefore('user_stakes', staker, lockDate, pos)
+        return 0 if row is None else int(row[0])
+
+    def _delegateBefore(self, delegator, lockDate, pos):
+        row = self._latestBefore('delegates', delegator, lockDate, pos)
+        return ZERO_ADDRESS if row is None else row[0]
+
+    # == Queries ===========================================================================================================================
+    # blockNumber None reads the latest indexed state
+
+    def _bound(self, blockNumber):
+        return position((blockNumber if blockNumber != None else self.lastSyncedBlock()) + 1, 0)
+
+    def _latest(self, table, account, lockDate, blockNumber):
+        return self._latestBefore(table, account, lockDate, self._bound(blockNumber))
+
+    def _latestBefore(self, table, account, lockDate, bound):
+        keyColumn, valueColumn = TABLE_COLUMNS[table]
+        return self.db.execute('SELECT ' + valueColumn + ' FROM ' + table + ' WHERE ' + keyColumn + '=? AND lockDate=? AND position<? ORDER BY position DESC LIMIT 1',
+            (account, lockDate, bound)).fetchone()
+
+    def stakeOf(self, staker, lockDate, blockNumber=None):
+        row = self._latest('user_stakes', str(staker).lower(), lockDate, blockNumber)
+        return 0 if row is None else int(row[0])
+
+    def delegateOf(self, delegator, lockDate, blockNumber=None):
+        row = self._latest('delegates', str(delegator).lower(), lockDate, blockNumber)
+        return ZERO_ADDRESS if row is None else row[0]
+
+    def delegateStakeOf(self, delegatee, lockDate, blockNumber=None):
+        row = self._latest('delegate_stakes', str(delegatee).lower(), lockDate, blockNumber)
+        return 0 if row is None else int(row[0])
+
+    def stakesAt(self, staker, blockNumber=None):
+        '''
+        returns (dates, amounts) of the non zero stakes of staker at blockNumber, sorted by date like staking.getStakes
+        '''
+        # SQLite returns the bare columns of the row holding MAX(position)
+        rows = self.db.execute('SELECT lockDate, stake, MAX(position) FROM user_stakes WHERE staker=? AND position<? GROUP BY lockDate ORDER BY lockDate',
+            (str(staker).lower(), self._bound(blockNumber))).fetchall()
+        rows = [(row[0], int(row[1])) for row in rows if row[1] != '0']
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def delegatesAt(self, delegator, blockNumber=None):
+        '''
+        returns {lockDate: delegatee} of delegator at blockNumber
+        '''
+        rows = self.db.execute('SELECT lockDate, delegatee, MAX(position) FROM delegates WHERE delegator=? AND position<? GROUP BY lockDate',
+            (str(delegator).lower(), self._bound(blockNumber))).fetchall()
+        return {row[0]: row[1] for row in rows if row[1] != ZERO_ADDRESS}
+
+    def delegateStakesAt(self, blockNumber=None):
+        '''
+        returns the non zero delegate stakes of all delegatees at blockNumber as (delegatee, lockDate, stake) tuples
+        '''
+        rows = self.db.execute('SELECT delegatee, lockDate, stake, MAX(position) FROM delegate_stakes WHERE position<? GROUP BY delegatee, lockDate',
+            (self._bound(blockNumber),)).fetchall()
+        return [(row[0], row[1], int(row[2])) for row in rows if row[2] != '0']
+
+    def userStakesAt(self, blockNumber=None):
+        '''
+        returns the non zero stakes of all stakers at blockNumber as (staker, lockDate, stake) tuples
+        '''
+        rows = self.db.execute('SELECT staker, lockDate, stake, MAX(position) FROM user_stakes WHERE position<? GROUP BY staker, lockDate',
+            (self._bound(blockNumber),)).fetchall()
+        return [(row[0], row[1], int(row[2])) for row in rows if row[2] != '0']
+
+    def totalStakesAt(self, blockNumber=None):
+        '''
+        returns {lockDate: total stake} at blockNumber, the sum of the user stakes (totalStakingCheckpoints of the contract)
+        '''
+        totals = {}
+        for staker, lockDate, stake in self.userStakesAt(blockNumber):
+            totals[lockDate] = totals.get(lockDate, 0) + stake
+        return totals
+
+    def stakers(self):
+        return [row[0] for row in self.db.execute('SELECT DISTINCT staker FROM user_stakes')]
+
+    def close(self):
+        self.db.close()
+
+def main():
+    conf.setReadOnly(True)
+    index = StakingIndex(conf.contracts['Staking'], startBlock=int(environ.get('START_BLOCK', 0)))
+    index.sync()
+    print("stakers indexed:", len(index.stakers()))
@@ -0,0 +1,152 @@
+'''
+Pipeline for rebuilding the vesting stake checkpoints of the Staking contract (staking.setVestingStakes).
+
+1. collect - the user staking checkpoints of the vesting contracts, read in concurrent Multicall batches
+2. aggregate - the stakes summed per lock date in memory
+3. diff - the new values against the current vestingCheckpoints (dry run)
+4. pack - setVestingStakes split into the fewest multisig transactions under the gas limit
+5. submit - one multisig submission per chunk
+
+usage:
+    totals = collectFourYearVestingStakes(staking, vestingAddresses)
+    diff = vestingStakesDiff(staking, totals)
+    printVestingStakesDiff(diff)
+    submitVestingStakes(staking, diff, multisigAddress, acct) # dryRun=True only prints the chunks
+
+    # from a vestings.json like file (one JSON object per line), resumable with a ledger of the submitted chunks
+    totals = aggregateStakes(readVestingStakes('./scripts/staking/vestings.json'))
+    submitVestingStakes(staking, vestingStakesDiff(staking, totals, addCurrent=False), multisigAddress, acct, ledger=LEDGER_FILE)
+'''
+from brownie import *
+import json
+from os import path
+from scripts.contractInteraction.contract_registry import getContract
+from scripts.contractInteraction.gas_chunks import packByGas, DEFAULT_GAS_LIMIT
+from scripts.utils import sendWithMultisig
+from scripts.contractInteraction.multicall import readCallsChunked
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+LEDGER_FILE = './scripts/staking/vesting_stakes_ledger.jsonl'
+DAY = 24 * 60 * 60
+FOUR_WEEKS = 4 * 7 * DAY
+
+def collectFourYearVestingStakes(staking, vestingAddresses, interval=FOUR_WEEKS):
+    '''
+    returns {lockDate: stake} - the first staking checkpoint of every FourYearVesting contract at each of its
+    lock dates (startDate to endDate), summed per lock date and sorted by lock date
+    '''
+    vestings = [getContract("FourYearVestingLogic", address=address, abi=FourYearVestingLogic.abi) for address in vestingAddresses]
+    dates = readCallsChunked([(vesting.startDate,) for vesting in vestings] + [(vesting.endDate,) for vesting in vestings])
+    pairs = []
+    for i in range(0, len(vestings)):
+        startDate = dates[i]
+        endDate = dates[len(vestings) + i]
+        pairs += [(vestingAddresses[i], lockDate) for lockDate in range(startDate, endDate + 1, interval)]
+
+    numCheckpoints = readCallsChunked([(staking.numUserStakingCheckpoints, vesting, lockDate) for vesting, lockDate in pairs])
+    staked = [pairs[i] for i in range(0, len(pairs)) if numCheckpoints[i] > 0]
+    checkpoints = readCallsChunked([(staking.userStakingCheckpoints, vesting, lockDate, 0) for vesting, lockDate in staked])
+    print("vestings:", len(vestings), "lock dates read:", len(pairs), "staked lock dates:", len(staked))
+    return aggregateStakes((staked[i][1], checkpoints[i][1]) for i in range(0, len(staked)))
+
+def readVestingStakes(fileName):
+    '''
+    streams the (lockDate, amount) pairs of a vestings.json file (check_user_vestings.py output, one JSON object per line)
+    lines without a vesting contract are skipped
+    '''
+    with open(fileName) as file:
+        for line in file:
+            if line.strip() == "":
+                continue
+            vestingData = json.loads(line)
+            if vestingData["vesting"] == ZERO_ADDRESS:
+                continue
+            for lockDate, amount in zip(vestingData["dates"], vestingData["amounts"]):
+                yield lockDate, amount
+
+def aggregateStakes(stakes):
+    '''
+    (lockDate, amount) pairs -> {lockDate: total amount} sorted by lock date, with integer arithmetic
+    '''
+    totals = {}
+    for lockDate, amount in stakes:
+        lockDate = int(lockDate)
+        totals[lockDate] = totals.get(lockDate, 0) + int(amount)
+    return dict(sorted(totals.items()))
+
+def currentVestingStakes(staking, lockDates):
+    '''
+    returns {lockDate: stake} of the latest vestingCheckpoints of the lock dates
+    '''
+    lockDates = list(lockDates)
+    numCheckpoints = readCallsChunked([(staking.numVestingCheckpoints, lockDate) for lockDate in lockDates])
+    withCheckpoints = [i for i in range(0, len(lockDates)) if numCheckpoints[i] > 0]
+    checkpoints = readCallsChunked([(staking.vestingCheckpoints, lockDates[i], numCheckpoints[i] - 1) for i in withCheckpoints])
+    current = {lockDate: 0 for lockDate in lockDates}
+    for i in range(0, len(withCheckpoints)):
+        current[lockDates[withCheckpoints[i]]] = checkpoints[i][1]
+    return current
+
+def vestingStakesDiff(staking, totals, addCurrent=True, maxLockDate=None):
+    '''
+    returns [(lockDate, current vesting stake, new vesting stake)] sorted by lock date
+    addCurrent - the new value is the current vesting stake plus the total (the missing stakes are added),
+                 otherwise the total replaces it
+    maxLockDate - lock dates after it are left out
+    '''
+    lockDates = [lockDate for lockDate in totals if maxLockDate is None or lockDate <= maxLockDate]
+    current = currentVestingStakes(staking, lockDates)
+    return [(lockDate, current[lockDate], totals[lockDate] + current[lockDate] if addCurrent else totals[lockDate]) for lockDate in lockDates]
+
+def printVestingStakesDiff(diff):
+    changed = 0
+    for lockDate, current, new in diff:
+        if current != new:
+            changed += 1
+        print(lockDate, ":", current / 10**18, "->", new / 10**18, "" if current != new else "(unchanged)")
+    print("lock dates:", len(diff), "changed:", changed)
+
+def packVestingStakes(staking, diff, multisigAddress, gasLimit=DEFAULT_GAS_LIMIT):
+    '''
+    splits the changed lock dates of the diff into setVestingStakes calls of at most gasLimit gas (estimated from the multisig)
+    returns the list of (chunk, data, gas) tuples
+    '''
+    items = [(lockDate, new) for lockDate, current, new in diff if current != new]
+    buildData = lambda chunk: staking.setVestingStakes.encode_input([item[0] for item in chunk], [item[1] for item in chunk])
+    return packByGas(items, buildData, staking.address, multisigAddress, gasLimit)
+
+def readLedger(ledger):
+    '''
+    returns {lockDate: value} of the lock dates already submitted according to the ledger file
+    '''
+    submitted = {}
+    if ledger is None or not path.exists(ledger):
+        return submitted
+    with open(ledger) as file:
+        for line in file:
+            if line.strip() == "":
+                continue
+            entry = json.loads(line)
+            submitted.update(zip(entry["dates"], [int(value) for value in entry["values"]]))
+    return submitted
+
+def submitVestingStakes(staking, diff, multisigAddress, sender, gasLimit=DEFAULT_GAS_LIMIT, dryRun=False, ledger=None):
+    '''
+    ledger - JSONL file the submitted chunks are appended to; lock dates already submitted with the same value are
+             skipped, so an interrupted run can be restarted with the same arguments
+    '''
+    submitted = readLedger(ledger)
+    pending = [entry for entry in diff if submitted.get(entry[0]) != entry[2]]
+    if len(pending) < len(diff):
+        print("skipping", len(diff) - len(pending), "lock dates already submitted according to", ledger)
+    chunks = packVestingStakes(staking, pending, multisigAddress, gasLimit)
+    print("setVestingStakes packed into", len(chunks), "multisig transactions")
+    for chunk, data, gas in chunks:
+        print("lock dates", chunk[0][0], "-", chunk[-1][0], "(" + str(len(chunk)) + ") estimated gas:", gas)
+        if dryRun:
+            continue
+        txId = sendWithMultisig(multisigAddress, staking.address, data, sender)
+        if ledger is not None:
+            with open(ledger, 'a') as file:
+                file.write(json.dumps({"txId": txId, "dates": [item[0] for item in chunk], "values": [str(item[1]) for item in chunk]}) + "\n")
+    return chunks
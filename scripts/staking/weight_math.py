@@ -0,0 +1,97 @@
+'''
+Bit exact port of the staking weight function (StakingShared._computeWeightByDate) for analytics.
+
+The contract computes, with integer arithmetic:
+    x = (MAX_DURATION - (date - startDate)) / 1 days
+    weight = WEIGHT_FACTOR + MAX_VOTING_WEIGHT * WEIGHT_FACTOR * (MAX_DURATION_POW_2 - x * x) / MAX_DURATION_POW_2
+All intermediate values stay below 2**27, so the vectorized version computes them exactly in int64.
+
+usage:
+    weight = computeWeightByDate(lockDate, startDate)
+    weights = computeWeightsByDate(lockDates, startDates) # NumPy arrays (or anything array like), broadcast
+
+python scripts/staking/weight_math.py prints the batch throughput (differential test: tests/staking/test_weight_math.py)
+'''
+import numpy as np
+import time
+
+DAY = 24 * 60 * 60
+TWO_WEEKS = 1209600
+MAX_VOTING_WEIGHT = 9
+WEIGHT_FACTOR = 10
+MAX_DURATION = 1092 * DAY
+MAX_DURATION_POW_2 = 1092 * 1092
+
+def computeWeightByDate(date, startDate):
+    '''
+    returns the weight of tokens staked until date on startDate, reverts (ValueError) like the contract
+    '''
+    if date < startDate:
+        raise ValueError("date < startDate")
+    remainingTime = date - startDate
+    if remainingTime > MAX_DURATION:
+        raise ValueError("remaining time > max duration")
+    x = (MAX_DURATION - remainingTime) // DAY
+    return WEIGHT_FACTOR + MAX_VOTING_WEIGHT * WEIGHT_FACTOR * (MAX_DURATION_POW_2 - x * x) // MAX_DURATION_POW_2
+
+def computeWeightsByDate(dates, startDates):
+    '''
+    vectorized computeWeightByDate - returns an int64 array of the weights of the (broadcast) date and startDate arrays
+    raises ValueError if any pair would revert on the contract
+    '''
+    remainingTime = np.asarray(dates, dtype=np.int64) - np.asarray(startDates, dtype=np.int64)
+    if np.any(remainingTime < 0):
+        raise ValueError("date < startDate")
+    if np.any(remainingTime > MAX_DURATION):
+        raise ValueError("remaining time > max duration")
+    x = (MAX_DURATION - remainingTime) // DAY
+    return WEIGHT_FACTOR + MAX_VOTING_WEIGHT * WEIGHT_FACTOR * (MAX_DURATION_POW_2 - x * x) // MAX_DURATION_POW_2
+
+def timestampToLockDate(timestamp, kickoffTS):
+    '''
+    StakingShared._timestampToLockDate - rounds down to the lock date (kickoffTS + n * TWO_WEEKS)
+    '''
+    if timestamp < kickoffTS:
+        raise ValueError("timestamp < contract creation")
+    return kickoffTS + (timestamp - kickoffTS) // TWO_WEEKS * TWO_WEEKS
+
+def lockDates(startDate):
+    '''
+    the 79 lock dates the contract iterates for a start date, startDate to startDate + MAX_DURATION
+    '''
+    return np.arange(startDate, startDate + MAX_DURATION + 1, TWO_WEEKS, dtype=np.int64)
+
+def weightTable(startDate):
+    '''
+    returns (lockDates, weights) of all lock dates for a start date (a lock date itself)
+    '''
+    dates = lockDates(startDate)
+    return dates, computeWeightsByDate(dates, startDate)
+
+def power(staked, weight):
+    '''
+    voting power of a stake - uint96 stakes overflow int64, so this uses Python integers
+    '''
+    return int(staked) * int(weight) // WEIGHT_FACTOR
+
+def benchmark(pairs=1000000):
+    rng = np.random.default_rng(0)
+    startDates = rng.integers(1600000000, 1700000000, pairs, dtype=np.int64)
+    dates = startDates + rng.integers(0, MAX_DURATION + 1, pairs, dtype=np.int64)
+
+    start = time.perf_counter()
+    weights = computeWeightsByDate(dates, startDates)
+    vectorized = time.perf_counter() - start
+
+    sample = min(pairs, 100000)
+    start = time.perf_counter()
+    scalar = [computeWeightByDate(int(dates[i]), int(startDates[i])) for i in range(0, sample)]
+    scalarTime = (time.perf_counter() - start) * pairs / sample
+
+    assert scalar == weights[:sample].tolist()
+    print("weights of", pairs, "(date, startDate) pairs:")
+    print("vectorized:", round(vectorized, 4), "s -", int(pairs / vectorized), "weights/s")
+    print("scalar (extrapolated from", sample, "pairs):", round(scalarTime, 4), "s -", int(pairs / scalarTime), "weights/s")
+
+if __name__ == '__main__':
+    benchmark()
@@ -1,11 +1,73 @@
 from brownie import *
 import csv
+from scripts.contractInteraction.gas_chunks import packByGas, DEFAULT_GAS_LIMIT
 
 def sendWithMultisig(multisigAddress, contractAddress, data, sender, value = 0):
     multisig = Contract.from_abi("MultiSig", address=multisigAddress, abi=MultiSigWallet.abi, owner=multisigAddress)
     tx = multisig.submitTransaction(contractAddress,value,data, {'from': sender})
     txId = tx.events["Submission"]["transactionId"]
     print("tx id: ", txId)
+    return txId
+
+def sendBatchWithMultisig(multisigAddress, batchExecutorAddress, calls, sender, gasLimit = DEFAULT_GAS_LIMIT, atomic = True):
+    '''
+    submits the calls [(target, data)] executed by the BatchExecutor (owned by the multisig) in as few
+    multisig transactions as fit under gasLimit
+    atomic - True: a failed call reverts its whole batch (executeBatch)
+             False: the failed calls are skipped and reported with CallFailed events (executeBatchBestEffort)
+    returns the multisig tx ids
+    '''
+    executor = Contract.from_abi("BatchExecutor", address=batchExecutorAddress, abi=BatchExecutor.abi, owner=multisigAddress)
+    method = executor.executeBatch if atomic else executor.executeBatchBestEffort
+    buildData = lambda chunk: method.encode_input([(str(target), data) for target, data in chunk])
+    txIds = []
+    for chunk, data, gas in packByGas(calls, buildData, batchExecutorAddress, multisigAddress, gasLimit):
+        print("batch of", len(chunk), "calls, estimated gas:", gas)
+        txIds.append(sendWithMultisig(multisigAddress, batchExecutorAddress, data, sender))
+    return txIds
+
+class MultisigBatch:
+    '''
+    accumulates encoded calls and submits them as BatchExecutor transactions of the multisig, so a flow
+    of several actions needs one confirmation per signer instead of one per action
+    the BatchExecutor must hold the roles the calls need (owner/admin of the called contracts)
+
+    usage:
+        batch = MultisigBatch(conf.contracts['multisig'], conf.contracts['BatchExecutor'], conf.acct)
+        batch.add(liquidityMining.address, liquidityMining.add.encode_input(poolToken, 1, False))
+        batch.add(liquidityMining.address, liquidityMining.updateAllPools.encode_input())
+        batch.submit()
+    '''
+    def __init__(self, multisigAddress, batchExecutorAddress, sender, atomic = True, gasLimit = DEFAULT_GAS_LIMIT):
+        self.multisigAddress = multisigAddress
+        self.batchExecutorAddress = batchExecutorAddress
+        self.sender = sender
+        self.atomic = atomic
+        self.gasLimit = gasLimit
+        self.calls = []
+
+    def add(self, contractAddress, data):
+        self.calls.append((contractAddress, data))
+        return self
+
+    def submit(self):
+        '''
+        submits the accumulated calls (split by gas if needed) and clears them, returns the multisig tx ids
+        '''
+        if len(self.calls) == 0:
+            return []
+        txIds = sendBatchWithMultisig(self.multisigAddress, self.batchExecutorAddress, self.calls, self.sender, self.gasLimit, self.atomic)
+        self.calls = []
+        return txIds
+
+def requireBatchRole(batch, hasRole, role):
+    '''
+    the BatchExecutor makes the calls of a batch itself, so it needs the role they require (not the multisig)
+    raises if batch is a MultisigBatch and hasRole(batchExecutorAddress) is False, does nothing without a batch
+    role - the missing role and how to grant it, for the error message
+    '''
+    if batch != None and not hasRole(batch.batchExecutorAddress):
+        raise Exception("the BatchExecutor " + str(batch.batchExecutorAddress) + " is not the " + role)
 
 def printToCSV(fileName, rows):
     with open(fileName, 'w', newline='') as file:
@@ -0,0 +1,76 @@
+'''
+validates scripts/governance/voting_power.py (on scripts/staking/staking_index.py) against the Staking contract
+on the development chain: stakes, an extension, a delegation change and a withdrawal are indexed and the
+offline votes and total voting power are compared with getPriorVotes/getPriorTotalVotingPower
+at a block before and a block after the changes
+'''
+
+#!/usr/bin/python3
+import pytest
+from scripts.governance.voting_power import VotingPowerEngine, validate
+from scripts.staking.staking_index import StakingIndex
+
+WEEK = 7 * 24 * 3600
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+@pytest.fixture(scope="module")
+def staking(accounts, interface, Contract, TestToken, StakingProxy, ModulesProxy, ModulesProxyRegistry, StakingAdminModule, StakingGovernanceModule,
+        StakingStakeModule, StakingStorageModule, StakingVestingModule, StakingWithdrawModule, WeightedStakingModule):
+    token = TestToken.deploy("SOV", "SOV", 18, 10**26, {'from': accounts[0]})
+    stakingProxy = StakingProxy.deploy(token.address, {'from': accounts[0]})
+    modulesProxy = ModulesProxy.deploy({'from': accounts[0]})
+    stakingProxy.setImplementation(modulesProxy.address, {'from': accounts[0]})
+    modules = Contract.from_abi("StakingModulesProxy", address=stakingProxy.address, abi=ModulesProxyRegistry.abi, owner=accounts[0])
+    for module in [StakingAdminModule, StakingGovernanceModule, StakingStakeModule, StakingStorageModule,
+            StakingVestingModule, StakingWithdrawModule, WeightedStakingModule]:
+        modules.addModule(module.deploy({'from': accounts[0], 'gas_limit': 6800000}).address, {'from': accounts[0]})
+    for i in range(1, 3):
+        token.transfer(accounts[i], 10**24, {'from': accounts[0]})
+        token.approve(stakingProxy.address, 10**24, {'from': accounts[i]})
+    staking = Contract.from_abi("Staking", address=stakingProxy.address, abi=interface.IStaking.abi, owner=accounts[0])
+    return staking, stakingProxy.tx.block_number
+
+def blockTime(chain, blockNumber):
+    return chain[blockNumber].timestamp
+
+def assertSameVotingPower(engine, staking, accounts, blockNumber, timestamp):
+    assert engine.totalVotingPowerAt(blockNumber, timestamp) == staking.getPriorTotalVotingPower(blockNumber, timestamp)
+    votes = engine.allVotesAt(blockNumber, timestamp)
+    for account in accounts[1:5]:
+        expected = staking.getPriorVotes(account, blockNumber, timestamp)
+        assert engine.votesAt(account, blockNumber, timestamp) == expected
+        assert votes.get(account.address.lower(), 0) == expected
+    assert validate(engine, staking, blockNumber, timestamp, votes) == []
+
+def test_voting_power_matches_the_contract(accounts, chain, staking, tmp_path):
+    staking, deploymentBlock = staking
+    start = chain.time()
+    longLock = staking.timestampToLockDate(start + 26 * WEEK)
+    shortLock = staking.timestampToLockDate(start + 4 * WEEK)
+    otherLock = staking.timestampToLockDate(start + 52 * WEEK)
+    # self delegated stakes of accounts[1], stake of accounts[2] delegated to accounts[3]
+    staking.stake(1000 * 10**18, longLock, ZERO_ADDRESS, ZERO_ADDRESS, {'from': accounts[1]})
+    staking.stake(300 * 10**18, shortLock, ZERO_ADDRESS, ZERO_ADDRESS, {'from': accounts[1]})
+    staking.stake(500 * 10**18, otherLock, ZERO_ADDRESS, accounts[3], {'from': accounts[2]})
+    chain.mine()
+    before = chain.height
+
+    staking.extendStakingDuration(longLock, start + 78 * WEEK, {'from': accounts[1]})
+    staking.delegate(accounts[4], otherLock, {'from': accounts[2]})
+    chain.sleep(6 * WEEK)
+    chain.mine()
+    # after the lock date, no early withdrawal penalty
+    staking.withdraw(100 * 10**18, shortLock, accounts[1], {'from': accounts[1]})
+    chain.mine()
+    after = chain.height
+    chain.mine()
+
+    # a single getLogs range, then the same chain one block at a time
+    for maxStep in [100000, 1]:
+        index = StakingIndex(staking.address, path=str(tmp_path / ("index" + str(maxStep) + ".sqlite")),
+            startBlock=deploymentBlock, minStep=1, maxStep=maxStep)
+        index.sync(toBlock=chain.height - 1)
+        engine = VotingPowerEngine(index, staking.kickoffTS())
+        for blockNumber in [before, after]:
+            assertSameVotingPower(engine, staking, accounts, blockNumber, blockTime(chain, blockNumber))
+        index.close()
@@ -0,0 +1,80 @@
+'''
+tests confirmMultipleTxsWithMS (scripts/contractInteraction/multisig.py) against a MultiSigWallet of 3 owners, 3 required
+1. the executing confirmations run in txId order (a tx spending what the previous one left), the others are only confirmed,
+   executed and not submitted txs are skipped
+2. an execution failure stops the confirmations of the rest of the range
+3. confirmations whose receipts cannot be awaited are reported as unknown and the table is still printed
+'''
+
+#!/usr/bin/python3
+import pytest
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.multisig import confirmMultipleTxsWithMS
+
+@pytest.fixture(scope="function")
+def setup(accounts, monkeypatch, TestToken, MultiSigWallet):
+    multisig = MultiSigWallet.deploy([accounts[0], accounts[1], accounts[2]], 3, {'from': accounts[0]})
+    token = TestToken.deploy("Test", "TST", 18, 10**24, {'from': accounts[0]})
+    token.transfer(multisig.address, 100, {'from': accounts[0]})
+    monkeypatch.setitem(conf.__dict__, "contracts", {'multisig': multisig.address})
+    monkeypatch.setitem(conf.__dict__, "acct", accounts[0])
+    return token, multisig
+
+def submitTransfer(accounts, token, multisig, receiver, amount, confirmedByAll):
+    # submitted (and confirmed) by accounts[1], with accounts[2] the confirmation of accounts[0] executes it
+    tx = multisig.submitTransaction(token.address, 0, token.transfer.encode_input(receiver, amount), {'from': accounts[1]})
+    txId = tx.events["Submission"]["transactionId"]
+    if confirmedByAll:
+        multisig.confirmTransaction(txId, {'from': accounts[2]})
+    return txId
+
+def statusLines(output):
+    return [line for line in output.splitlines() if line.count("|") == 3][1:]
+
+def test_confirmations_in_order(accounts, capsys, setup):
+    token, multisig = setup
+    submitTransfer(accounts, token, multisig, accounts[5], 70, True)
+    submitTransfer(accounts, token, multisig, accounts[6], 10, False)
+    submitTransfer(accounts, token, multisig, accounts[7], 29, True)
+    txId = submitTransfer(accounts, token, multisig, accounts[8], 1, True)
+    multisig.confirmTransaction(txId, {'from': accounts[0]})
+    assert token.balanceOf(multisig.address) == 99
+
+    confirmMultipleTxsWithMS(0, 4)
+    # 70 and then the remaining 29, the 4th tx was executed before
+    assert multisig.transactions(0)[3] and multisig.transactions(2)[3]
+    assert token.balanceOf(accounts[5]) == 70 and token.balanceOf(accounts[7]) == 29
+    assert not multisig.transactions(1)[3] and multisig.getConfirmationCount(1) == 2
+    lines = statusLines(capsys.readouterr().out)
+    assert lines[0].endswith("confirmed") and lines[2].endswith("confirmed")
+    assert lines[3].endswith("skipped: executed")
+    assert lines[4].endswith("skipped: not submitted")
+
+def test_execution_failure_stops_the_range(accounts, capsys, setup):
+    token, multisig = setup
+    submitTransfer(accounts, token, multisig, accounts[5], 70, True)
+    # only 30 left after the first transfer
+    submitTransfer(accounts, token, multisig, accounts[6], 40, True)
+    submitTransfer(accounts, token, multisig, accounts[7], 10, True)
+
+    confirmMultipleTxsWithMS(0, 2)
+    assert multisig.transactions(0)[3]
+    assert not multisig.transactions(1)[3] and multisig.confirmations(1, accounts[0])
+    assert not multisig.confirmations(2, accounts[0])
+    lines = statusLines(capsys.readouterr().out)
+    assert lines[1].endswith("confirmed, execution failed")
+    assert lines[2].endswith("skipped: stopped after a failure")
+
+def test_unknown_receipts_are_reported(accounts, capsys, web3, setup):
+    token, multisig = setup
+    for i in range(0, 3):
+        submitTransfer(accounts, token, multisig, accounts[5], 1, False)
+    # the confirmations are sent but not mined before the receipts time out
+    web3.provider.make_request("miner_stop", [])
+    try:
+        confirmMultipleTxsWithMS(0, 2, receiptTimeout=1)
+    finally:
+        web3.provider.make_request("miner_start", [])
+    lines = statusLines(capsys.readouterr().out)
+    assert len(lines) == 3 and all("| unknown: 0x" in line for line in lines)
+    assert all(multisig.confirmations(txId, accounts[0]) for txId in range(0, 3))
@@ -0,0 +1,98 @@
+'''
+tests MultisigBatch (scripts/utils.py) against a MultiSigWallet owning a BatchExecutor
+1. atomic batches are executed in one multisig transaction
+2. an atomic batch with a failing call is not submitted (its gas estimate reverts)
+3. best effort batches skip the failing calls
+4. batches above the gas limit are split into several multisig transactions
+5. pauseAllLoanTokens/unpauseAllLoanTokens (scripts/contractInteraction/loan_tokens.py) in one batch, refused until
+   the BatchExecutor is the pauser of the beacons
+'''
+
+#!/usr/bin/python3
+import pytest
+from scripts.utils import MultisigBatch
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.loan_tokens import pauseAllLoanTokens, unpauseAllLoanTokens, setBatchExecutorAsLoanTokenLogicBeaconsPauser
+
+@pytest.fixture(scope="function")
+def setup(accounts, TestToken, MultiSigWallet, BatchExecutor):
+    token = TestToken.deploy("Test", "TST", 18, 10**24, {'from': accounts[0]})
+    multisig = MultiSigWallet.deploy([accounts[0]], 1, {'from': accounts[0]})
+    executor = BatchExecutor.deploy({'from': accounts[0]})
+    executor.transferOwnership(multisig.address, {'from': accounts[0]})
+    token.transfer(executor.address, 1000, {'from': accounts[0]})
+    return token, multisig, executor
+
+def transferCall(token, receiver, amount):
+    return token.address, token.transfer.encode_input(receiver, amount)
+
+def test_atomic_batch(accounts, setup):
+    token, multisig, executor = setup
+    batch = MultisigBatch(multisig.address, executor.address, accounts[0])
+    batch.add(*transferCall(token, accounts[1], 100)).add(*transferCall(token, accounts[2], 200))
+    txIds = batch.submit()
+    assert len(txIds) == 1
+    assert multisig.transactions(txIds[0])[3] # executed
+    assert token.balanceOf(accounts[1]) == 100
+    assert token.balanceOf(accounts[2]) == 200
+    assert batch.submit() == []
+
+def test_atomic_batch_with_failing_call(accounts, setup):
+    token, multisig, executor = setup
+    batch = MultisigBatch(multisig.address, executor.address, accounts[0])
+    batch.add(*transferCall(token, accounts[1], 100)).add(*transferCall(token, accounts[2], 2000))
+    with pytest.raises(Exception):
+        batch.submit()
+    assert multisig.transactionCount() == 0
+    assert token.balanceOf(accounts[1]) == 0
+
+def test_best_effort_batch(accounts, setup):
+    token, multisig, executor = setup
+    batch = MultisigBatch(multisig.address, executor.address, accounts[0], atomic=False)
+    batch.add(*transferCall(token, accounts[1], 100)).add(*transferCall(token, accounts[2], 2000)).add(*transferCall(token, accounts[2], 200))
+    txIds = batch.submit()
+    assert len(txIds) == 1
+    assert multisig.transactions(txIds[0])[3]
+    assert token.balanceOf(accounts[1]) == 100
+    assert token.balanceOf(accounts[2]) == 200
+    assert token.balanceOf(executor.address) == 700
+
+def test_batch_split_by_gas(accounts, setup):
+    token, multisig, executor = setup
+    batch = MultisigBatch(multisig.address, executor.address, accounts[0], gasLimit=150000)
+    for i in range(0, 10):
+        batch.add(*transferCall(token, accounts[1 + i % 3], 10))
+    txIds = batch.submit()
+    assert len(txIds) > 1
+    assert all(multisig.transactions(txId)[3] for txId in txIds)
+    assert token.balanceOf(executor.address) == 900
+
+def test_pause_all_loan_tokens_in_one_batch(accounts, monkeypatch, setup, LoanTokenLogicBeacon):
+    token, multisig, executor = setup
+    beacons = []
+    for i in range(0, 2):
+        beacon = LoanTokenLogicBeacon.deploy({'from': accounts[0]})
+        beacon.transferOwnership(multisig.address, {'from': accounts[0]})
+        beacons.append(beacon)
+    monkeypatch.setitem(conf.__dict__, "contracts", {'multisig': multisig.address, 'BatchExecutor': executor.address,
+        'LoanTokenLogicBeaconLM': beacons[0].address, 'LoanTokenLogicBeaconWrbtc': beacons[1].address})
+    monkeypatch.setitem(conf.__dict__, "acct", accounts[0])
+    batch = MultisigBatch(multisig.address, executor.address, accounts[0])
+
+    # the calls are made by the BatchExecutor, which is neither the owner nor the pauser yet
+    with pytest.raises(Exception, match="is not the pauser of LoanTokenLogicBeaconLM"):
+        pauseAllLoanTokens(batch)
+    assert batch.calls == []
+
+    setBatchExecutorAsLoanTokenLogicBeaconsPauser()
+    assert all(beacon.pauser() == executor.address for beacon in beacons)
+    transactionCount = multisig.transactionCount()
+
+    pauseAllLoanTokens(batch)
+    assert len(batch.submit()) == 1
+    assert multisig.transactionCount() == transactionCount + 1
+    assert all(beacon.paused() for beacon in beacons)
+
+    unpauseAllLoanTokens(batch)
+    assert len(batch.submit()) == 1
+    assert not any(beacon.paused() for beacon in beacons)
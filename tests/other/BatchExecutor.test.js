@@ -0,0 +1,128 @@
+const { expect } = require("chai");
+const { expectRevert, expectEvent, BN } = require("@openzeppelin/test-helpers");
+
+const BatchExecutor = artifacts.require("BatchExecutor");
+const MultiSigWallet = artifacts.require("MultiSigWallet");
+const TestToken = artifacts.require("TestToken");
+
+const TOTAL_SUPPLY = new BN(10).pow(new BN(24));
+
+contract("BatchExecutor", (accounts) => {
+    let root, account1, account2;
+    let executor, token;
+
+    beforeEach(async () => {
+        [root, account1, account2, ...accounts] = accounts;
+        executor = await BatchExecutor.new();
+        token = await TestToken.new("Test", "TST", 18, TOTAL_SUPPLY);
+        await token.transfer(executor.address, new BN(1000));
+    });
+
+    const transferCall = (receiver, amount) => [
+        token.address,
+        token.contract.methods.transfer(receiver, amount).encodeABI(),
+    ];
+
+    describe("executeBatch", () => {
+        it("executes all calls from the executor", async () => {
+            const tx = await executor.executeBatch([
+                transferCall(account1, 100),
+                transferCall(account2, 200),
+            ]);
+
+            expectEvent(tx, "BatchExecuted", { sender: root, numberOfCalls: new BN(2) });
+            expect(await token.balanceOf(account1)).to.be.bignumber.equal(new BN(100));
+            expect(await token.balanceOf(account2)).to.be.bignumber.equal(new BN(200));
+            expect(await token.balanceOf(executor.address)).to.be.bignumber.equal(new BN(700));
+        });
+
+        it("reverts the whole batch with the reason of the failed call", async () => {
+            await expectRevert(
+                executor.executeBatch([transferCall(account1, 100), transferCall(account2, 2000)]),
+                "invalid transfer"
+            );
+            expect(await token.balanceOf(account1)).to.be.bignumber.equal(new BN(0));
+        });
+
+        it("reverts with a generic reason if the call has no return data", async () => {
+            // a call to an account without code succeeds, a call of an unknown function reverts without data
+            await expectRevert(
+                executor.executeBatch([[executor.address, "0x12345678"]]),
+                "BatchExecutor: call failed"
+            );
+        });
+
+        it("only the owner can execute", async () => {
+            await expectRevert(
+                executor.executeBatch([transferCall(account1, 100)], { from: account1 }),
+                "unauthorized"
+            );
+        });
+    });
+
+    describe("executeBatchBestEffort", () => {
+        it("executes the successful calls and reports the failed ones", async () => {
+            const calls = [
+                transferCall(account1, 100),
+                transferCall(account2, 2000),
+                transferCall(account2, 200),
+            ];
+            const successes = await executor.executeBatchBestEffort.call(calls);
+            expect(successes).to.deep.equal([true, false, true]);
+
+            const tx = await executor.executeBatchBestEffort(calls);
+            expectEvent(tx, "CallFailed", { index: new BN(1), target: token.address });
+            expectEvent(tx, "BatchExecuted", { sender: root, numberOfCalls: new BN(3) });
+            expect(await token.balanceOf(account1)).to.be.bignumber.equal(new BN(100));
+            expect(await token.balanceOf(account2)).to.be.bignumber.equal(new BN(200));
+        });
+
+        it("only the owner can execute", async () => {
+            await expectRevert(
+                executor.executeBatchBestEffort([transferCall(account1, 100)], {
+                    from: account1,
+                }),
+                "unauthorized"
+            );
+        });
+    });
+
+    describe("through the multisig", () => {
+        let multisig;
+
+        beforeEach(async () => {
+            multisig = await MultiSigWallet.new([root], 1);
+            await executor.transferOwnership(multisig.address);
+        });
+
+        // a single multisig transaction executing the batch, executed on submission with 1 required confirmation
+        const submitBatch = (method, calls) =>
+            multisig.submitTransaction(
+                executor.address,
+                0,
+                executor.contract.methods[method](calls).encodeABI()
+            );
+
+        it("atomic: a failed call fails the multisig transaction and nothing is transferred", async () => {
+            const tx = await submitBatch("executeBatch", [
+                transferCall(account1, 100),
+                transferCall(account2, 2000),
+            ]);
+
+            expectEvent(tx, "ExecutionFailure", { transactionId: new BN(0) });
+            expect(await token.balanceOf(account1)).to.be.bignumber.equal(new BN(0));
+            expect(await token.balanceOf(executor.address)).to.be.bignumber.equal(new BN(1000));
+        });
+
+        it("best effort: the multisig transaction succeeds without the failed call", async () => {
+            const tx = await submitBatch("executeBatchBestEffort", [
+                transferCall(account1, 100),
+                transferCall(account2, 2000),
+            ]);
+
+            expectEvent(tx, "Execution", { transactionId: new BN(0) });
+            expect(await token.balanceOf(account1)).to.be.bignumber.equal(new BN(100));
+            expect(await token.balanceOf(account2)).to.be.bignumber.equal(new BN(0));
+        });
+    });
+});
@@ -0,0 +1,106 @@
+const { expect } = require("chai");
+const { expectRevert, BN } = require("@openzeppelin/test-helpers");
+
+const Multicall = artifacts.require("Multicall");
+const TestToken = artifacts.require("TestToken");
+
+const TOTAL_SUPPLY = new BN(10).pow(new BN(24));
+
+contract("Multicall", (accounts) => {
+    let root, account1;
+    let multicall, token, blockBeforeTransfer;
+
+    before(async () => {
+        [root, account1, ...accounts] = accounts;
+        multicall = await Multicall.new();
+        token = await TestToken.new("Test", "TST", 18, TOTAL_SUPPLY);
+        blockBeforeTransfer = await web3.eth.getBlockNumber();
+        await token.transfer(account1, new BN(1000));
+    });
+
+    const balanceOfCall = (holder) => [
+        token.address,
+        token.contract.methods.balanceOf(holder).encodeABI(),
+    ];
+
+    // the multicall has no allowance, so this call always reverts
+    const failingCall = () => [
+        token.address,
+        token.contract.methods.transferFrom(root, account1, 1).encodeABI(),
+    ];
+
+    const decodeUint = (data) => new BN(web3.eth.abi.decodeParameter("uint256", data));
+
+    describe("aggregate", () => {
+        it("returns the results of all calls and the block number", async () => {
+            const result = await multicall.aggregate.call([
+                balanceOfCall(root),
+                balanceOfCall(account1),
+                [token.address, token.contract.methods.totalSupply().encodeABI()],
+            ]);
+
+            expect(result.blockNumber).to.be.bignumber.gte(
+                new BN(await web3.eth.getBlockNumber())
+            );
+            expect(decodeUint(result.returnData[0])).to.be.bignumber.equal(
+                TOTAL_SUPPLY.sub(new BN(1000))
+            );
+            expect(decodeUint(result.returnData[1])).to.be.bignumber.equal(new BN(1000));
+            expect(decodeUint(result.returnData[2])).to.be.bignumber.equal(TOTAL_SUPPLY);
+        });
+
+        it("reverts if any call fails", async () => {
+            await expectRevert(
+                multicall.aggregate.call([balanceOfCall(root), failingCall()]),
+                "Multicall aggregate: call failed"
+            );
+        });
+    });
+
+    describe("tryAggregate", () => {
+        it("reports failed calls without reverting if success is not required", async () => {
+            const result = await multicall.tryAggregate.call(false, [
+                balanceOfCall(account1),
+                failingCall(),
+            ]);
+
+            expect(result[0].success).to.be.true;
+            expect(decodeUint(result[0].returnData)).to.be.bignumber.equal(new BN(1000));
+            expect(result[1].success).to.be.false;
+        });
+
+        it("reverts on a failed call if success is required", async () => {
+            await expectRevert(
+                multicall.tryAggregate.call(true, [balanceOfCall(account1), failingCall()]),
+                "Multicall aggregate: call failed"
+            );
+        });
+    });
+
+    describe("tryBlockAndAggregate", () => {
+        it("reads all calls at the requested block", async () => {
+            const result = await multicall.tryBlockAndAggregate.call(
+                false,
+                [balanceOfCall(account1), failingCall()],
+                {},
+                blockBeforeTransfer
+            );
+
+            expect(result.returnData[0].success).to.be.true;
+            // account1 only received tokens after the pinned block
+            expect(decodeUint(result.returnData[0].returnData)).to.be.bignumber.equal(new BN(0));
+            expect(result.returnData[1].success).to.be.false;
+        });
+    });
+
+    describe("block helpers", () => {
+        it("returns the current block number and native balances", async () => {
+            expect(await multicall.getBlockNumber()).to.be.bignumber.gte(
+                new BN(await web3.eth.getBlockNumber())
+            );
+            expect(await multicall.getEthBalance(account1)).to.be.bignumber.equal(
+                new BN(await web3.eth.getBalance(account1))
+            );
+        });
+    });
+});
@@ -0,0 +1,105 @@
+'''
+shared fixtures of the tests of the scripts: a fake JSON-RPC node to test the RPC transports without a chain
+'''
+
+#!/usr/bin/python3
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+class FakeNodeServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+class FakeNodeHandler(BaseHTTPRequestHandler):
+    '''
+    eth_call answers with its calldata, eth_blockNumber with 0x10, eth_chainId with 0x1f (RSK testnet),
+    eth_getLogs with the logs of server.logs in the block range, refused above server.maxLogs results,
+    eth_getBlockByNumber of block 0 with server.genesis as hash, hardhat_metadata with server.forkBlock as the
+    block of the fork (method not found if it is None, like a node that is not hardhat),
+    any other method with an error
+    a batch containing the method "reject" is answered with a single error object
+    '''
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.received.append(payload)
+        if isinstance(payload, list):
+            if any(request['method'] == "reject" for request in payload):
+                response = {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'batch too large'}}
+            else:
+                # answered out of order, the client maps the responses by id
+                response = [self.answer(request) for request in reversed(payload)]
+        else:
+            response = self.answer(payload)
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def answer(self, request):
+        if request['method'] == "eth_call":
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'][0]['data']}
+        if request['method'] == "eth_blockNumber":
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': "0x10"}
+        if request['method'] == "eth_chainId":
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': "0x1f"}
+        if request['method'] == "eth_getBlockByNumber" and request['params'][0] == "0x0":
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': {'number': "0x0", 'hash': self.server.genesis}}
+        if request['method'] == "hardhat_metadata" and self.server.forkBlock is not None:
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': {'chainId': 31337,
+                'forkedNetwork': {'chainId': 30, 'forkBlockNumber': self.server.forkBlock, 'forkBlockHash': "0x" + "22" * 32}}}
+        if request['method'] == "eth_getLogs":
+            fromBlock, toBlock = int(request['params'][0]['fromBlock'], 16), int(request['params'][0]['toBlock'], 16)
+            logs = [log for log in self.server.logs if fromBlock <= int(log['blockNumber'], 16) <= toBlock]
+            if len(logs) > self.server.maxLogs:
+                return {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32005, 'message': 'query returned more than ' + str(self.server.maxLogs) + ' results'}}
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': logs}
+        return {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32601, 'message': 'method not found'}}
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def startNode():
+    '''
+    starts a fake node, returns (server, uri), the nodes are stopped after the test
+    '''
+    servers = []
+    def start(genesis="0x" + "11" * 32, forkBlock=None):
+        server = FakeNodeServer(("127.0.0.1", 0), FakeNodeHandler)
+        server.received = []
+        server.logs = []
+        server.maxLogs = 10000
+        server.genesis = genesis
+        server.forkBlock = forkBlock
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server, "http://127.0.0.1:" + str(server.server_address[1])
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture
+def node(startNode):
+    return startNode()
+
+class EchoMethod:
+    '''
+    stands in for a brownie contract method: encodes the argument as calldata and decodes it back
+    '''
+    _address = "0x0000000000000000000000000000000000000001"
+    _name = "echo"
+
+    def encode_input(self, value):
+        return "0x" + hex(value)[2:].rjust(64, "0")
+
+    def decode_output(self, data):
+        return int(data if isinstance(data, str) else data.hex(), 16)
+
+@pytest.fixture
+def echo():
+    return EchoMethod()
@@ -0,0 +1,73 @@
+'''
+tests scripts/contractInteraction/async_reads.py
+1. the row results come back in input order, whatever order the rows complete in
+2. transient errors are retried, other errors are raised
+3. when a row fails the rows in progress are cancelled and no further rows are started
+4. the engine can run several times (a new event loop per run)
+'''
+
+#!/usr/bin/python3
+import asyncio
+import threading
+import time
+import pytest
+from scripts.contractInteraction.async_reads import AsyncReadEngine
+
+def slowEcho(value):
+    # later rows complete first
+    time.sleep(0.01 * (5 - value % 5))
+    return value
+
+def test_results_in_input_order():
+    engine = AsyncReadEngine(concurrency=4, window=8)
+    async def readRow(engine, row):
+        return await engine.call(slowEcho, row)
+    assert engine.mapRows(range(0, 20), readRow) == list(range(0, 20))
+    assert engine.calls == 20
+    engine.close()
+
+def test_transient_errors_are_retried():
+    engine = AsyncReadEngine(concurrency=2, retries=2, backoff=0.001)
+    attempts = []
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("connection reset")
+        return "ok"
+    async def readRow(engine, row):
+        return await engine.call(flaky)
+    assert engine.mapRows([0], readRow) == ["ok"]
+    assert engine.retried == 2
+    engine.close()
+
+def test_failed_row_cancels_the_rows_in_progress():
+    engine = AsyncReadEngine(concurrency=4, window=4)
+    started = []
+    finished = []
+    lock = threading.Lock()
+    def read(value):
+        if value == 0:
+            raise ValueError("execution reverted")
+        time.sleep(0.05)
+        return value
+    async def readRow(engine, row):
+        with lock:
+            started.append(row)
+        # two dependent reads: the second one must not run for a cancelled row
+        value = await engine.call(read, row)
+        value = await engine.call(read, value)
+        finished.append(row)
+        return value
+    with pytest.raises(ValueError, match="execution reverted"):
+        engine.mapRows(range(0, 100), readRow)
+    assert len(started) <= 4
+    assert finished == []
+    engine.close()
+
+def test_engine_runs_twice():
+    engine = AsyncReadEngine(concurrency=2)
+    async def readRow(engine, row):
+        return await engine.call(lambda: row * 2)
+    assert engine.mapRows(range(0, 3), readRow) == [0, 2, 4]
+    assert engine.mapRows(range(0, 3), readRow) == [0, 2, 4]
+    engine.close()
@@ -0,0 +1,104 @@
+'''
+tests CallCache of scripts/contractInteraction/call_cache.py
+1. hits and misses, keys are case insensitive
+2. hits do not commit, their access times are written in batches
+3. the eviction sees the access times not written yet
+4. close writes what is pending
+5. two forks with the same chainId do not share their entries, the blocks mined on a fork are not cached
+'''
+
+#!/usr/bin/python3
+import sqlite3
+from web3 import Web3
+from scripts.contractInteraction import call_cache
+from scripts.contractInteraction.call_cache import CallCache, enableCallCache, disableCallCache
+
+TO = "0x00000000000000000000000000000000000000AB"
+NETWORK = "0x" + "11" * 32
+
+def committedAccess(path, data):
+    # a second connection only sees what was committed
+    db = sqlite3.connect(str(path))
+    row = db.execute('SELECT lastAccess FROM calls WHERE data=?', (data,)).fetchone()
+    db.close()
+    return row[0] if row is not None else None
+
+def test_hits_and_misses(tmp_path):
+    cache = CallCache(str(tmp_path / "cache.sqlite"))
+    assert cache.get(NETWORK, 100, TO, "0x01") is None
+    cache.put(NETWORK, 100, TO, "0x01", "0x02")
+    assert cache.get(NETWORK, 100, TO.lower(), "0x01") == "0x02"
+    assert cache.get(NETWORK, 101, TO, "0x01") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+    cache.close()
+
+def test_hits_are_written_in_batches(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = CallCache(str(path), flushEvery=5, flushInterval=3600)
+    for i in range(0, 4):
+        cache.put(NETWORK, 100, TO, hex(i), "0x02")
+    assert committedAccess(path, "0x0") is None
+    cache.put(NETWORK, 100, TO, "0x4", "0x02")
+    inserted = committedAccess(path, "0x0")
+    assert inserted is not None
+    for i in range(0, 4):
+        cache.get(NETWORK, 100, TO, "0x0")
+    assert committedAccess(path, "0x0") == inserted
+    cache.get(NETWORK, 100, TO, "0x0")
+    assert committedAccess(path, "0x0") > inserted
+    cache.close()
+
+def test_eviction_uses_pending_access_times(tmp_path):
+    cache = CallCache(str(tmp_path / "cache.sqlite"), maxEntries=10, flushEvery=1000, flushInterval=3600)
+    for i in range(0, 10):
+        cache.put(NETWORK, 100, TO, hex(i), "0x02")
+    # the oldest entry is read again, so the next oldest ones are evicted instead (a tenth of the cap + 1)
+    cache.get(NETWORK, 100, TO, "0x0")
+    cache.put(NETWORK, 100, TO, "0xa", "0x02")
+    assert cache.stats()["evictions"] == 2
+    assert cache.get(NETWORK, 100, TO, "0x0") == "0x02"
+    assert cache.get(NETWORK, 100, TO, "0x1") is None
+    assert cache.get(NETWORK, 100, TO, "0x2") is None
+    assert cache.get(NETWORK, 100, TO, "0x3") == "0x02"
+    cache.close()
+
+def test_close_writes_pending(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = CallCache(str(path), flushEvery=1000, flushInterval=3600)
+    cache.put(NETWORK, 100, TO, "0x01", "0x02")
+    assert committedAccess(path, "0x01") is None
+    cache.close()
+    assert committedAccess(path, "0x01") is not None
+    reopened = CallCache(str(path))
+    assert reopened.get(NETWORK, 100, TO, "0x01") == "0x02"
+    reopened.close()
+
+def cachedRead(monkeypatch, uri, path, blockNumber):
+    # a read on the node of uri with the cache enabled, returns whether it was served from the cache
+    w3 = Web3(Web3.HTTPProvider(uri))
+    monkeypatch.setattr(call_cache, "web3", w3)
+    cache = enableCallCache(path=path)
+    try:
+        hits = cache.stats()["hits"]
+        assert w3.eth.call({'to': TO, 'data': "0x01"}, blockNumber) == bytes.fromhex("01")
+        return cache.stats()["hits"] > hits
+    finally:
+        disableCallCache()
+
+def test_forks_with_the_same_chain_id(startNode, tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite")
+    # forks of two networks, both answer eth_chainId with the same id
+    mainnet, mainnetUri = startNode(genesis="0x" + "aa" * 32, forkBlock=8)
+    testnet, testnetUri = startNode(genesis="0x" + "bb" * 32, forkBlock=8)
+    assert not cachedRead(monkeypatch, mainnetUri, path, 5)
+    assert cachedRead(monkeypatch, mainnetUri, path, 5)
+    assert not cachedRead(monkeypatch, testnetUri, path, 5)
+    # block 10 was mined on the fork: never cached
+    assert not cachedRead(monkeypatch, mainnetUri, path, 10)
+    assert not cachedRead(monkeypatch, mainnetUri, path, 10)
+    # another session of the same network forked later shares the blocks of the network
+    later, laterUri = startNode(genesis="0x" + "aa" * 32, forkBlock=12)
+    assert cachedRead(monkeypatch, laterUri, path, 5)
+    assert not cachedRead(monkeypatch, laterUri, path, 10)
+    assert cachedRead(monkeypatch, laterUri, path, 10)
+    assert [request['params'][1] for request in later.received if request['method'] == "eth_call"] == ["0xa"]
@@ -0,0 +1,97 @@
+'''
+tests the distribution CSV parser of scripts/contractInteraction/tasks/airdrop_distribution/functions/distribution_file.py
+1. amounts are converted to wei exactly, with exactly the decimals of the multiplier, other number forms
+   (exponents, underscores, signs, nan, infinity) are line numbered errors
+2. addresses: unchecksummed, EIP-55 and the EIP-1191 checksums of RSK mainnet/testnet are accepted, other mixed case is not
+3. duplicate receivers are aggregated, vestings only with the same schedule
+4. the artifact is reused for the same file and rebuilt when it changes
+'''
+
+#!/usr/bin/python3
+import pytest
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.distribution_file import toWei, validateAddress, parseDistribution, checksumAddress
+
+# the EIP-1191 test vectors
+LOWER = "5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"
+EIP55 = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+RSK_MAINNET = "0x5aaEB6053f3e94c9b9a09f33669435E7ef1bEAeD"
+RSK_TESTNET = "0x5aAeb6053F3e94c9b9A09F33669435E7EF1BEaEd"
+OTHER = "0x00000000000000000000000000000000000000aa"
+
+def writeCsv(tmp_path, lines):
+    fileName = str(tmp_path / "distribution.csv")
+    with open(fileName, 'w') as file:
+        file.write("\n".join(lines) + "\n")
+    return fileName
+
+def test_to_wei():
+    assert toWei("1,000.01", 2, 10**16) == 1000010000000000000000
+    assert toWei('"6,516.85"', 2, 10**16) == 6516850000000000000000
+    assert toWei("0.10", 2, 10**16) == 10**17
+    assert toWei("123", 0, 1) == 123
+    for text in ["1.1", "1.100", "1", "1.2.3", "abc.de", "0.00", "-1.00"]:
+        with pytest.raises(ValueError):
+            toWei(text, 2, 10**16)
+    with pytest.raises(ValueError):
+        toWei("1.5", 0, 1)
+    for text in ["1.e5", "1e2.00", "1_0.00", "+1.00", "Infinity", "NaN", "1,0,00.00", "1,0000.00", ".50", "1.00\n", "\u0661.00"]:
+        with pytest.raises(ValueError):
+            toWei(text, 2, 10**16)
+    for text in ["1e-5", "1E3", "Infinity", "NaN", "-0", "0"]:
+        with pytest.raises(ValueError):
+            toWei(text, 0, 1)
+
+def test_validate_address():
+    assert validateAddress("0x" + LOWER) == (LOWER, False)
+    assert validateAddress("0x" + LOWER.upper()) == (LOWER, False)
+    assert validateAddress(" " + EIP55 + " ") == (LOWER, True)
+    assert validateAddress(RSK_MAINNET) == (LOWER, True)
+    assert validateAddress(RSK_TESTNET) == (LOWER, True)
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        validateAddress(RSK_MAINNET, chainIds=())
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        validateAddress("0x5AAeb6053F3E94C9b9A09f33669435E7Ef1BeAed")
+    for text in ["0x" + LOWER[:-1], LOWER + "00", "0x" + LOWER[:-1] + "g"]:
+        with pytest.raises(ValueError, match="invalid address"):
+            validateAddress(text)
+
+def test_duplicates_are_aggregated(tmp_path):
+    fileName = writeCsv(tmp_path, [EIP55 + ",1.00", OTHER + ",2.50", "", "0x" + LOWER + ",0.25"])
+    data = parseDistribution(fileName, 'direct', 10**16)
+    assert data["receivers"] == [EIP55, checksumAddress(OTHER[2:])]
+    assert data["amounts"] == [125 * 10**16, 250 * 10**16]
+    assert data["totalAmount"] == 375 * 10**16
+    assert data["meta"]["rows"] == 3 and data["meta"]["duplicates"] == 1 and data["meta"]["unchecksummed"] == 2
+
+def test_vestings_are_aggregated_by_schedule(tmp_path):
+    # amount, -, -, address, -, cliff, duration, type
+    fileName = writeCsv(tmp_path, [
+        "1.00,,," + EIP55 + ",,6,26,OwnerVesting",
+        "2.00,,," + RSK_MAINNET + ",,6,26,OwnerVesting",
+        "4.00,,," + EIP55 + ",,6,26,TeamVesting",
+        "8.00,,," + EIP55 + ",,12,26,OwnerVesting",
+    ])
+    data = parseDistribution(fileName, 'vestings', 10**16)
+    assert data["teamVestingList"] == [
+        [EIP55, 3 * 10**18, 6, 26, False],
+        [EIP55, 4 * 10**18, 6, 26, True],
+        [EIP55, 8 * 10**18, 12, 26, False],
+    ]
+
+def test_errors_are_reported_with_their_lines(tmp_path):
+    fileName = writeCsv(tmp_path, [EIP55 + ",1.00", "0xabc,1.00", OTHER + ",1.0"])
+    with pytest.raises(Exception, match="line 2: invalid address(.|\n)*line 3: expected 2 decimals"):
+        parseDistribution(fileName, 'direct', 10**16)
+
+def test_number_forms_are_reported_with_their_lines(tmp_path):
+    fileName = writeCsv(tmp_path, [EIP55 + ",1.e5", OTHER + ",Infinity", OTHER + ",NaN", OTHER + ",1_0.00"])
+    with pytest.raises(Exception, match="line 1: not an amount(.|\n)*line 2: not an amount(.|\n)*line 3: not an amount(.|\n)*line 4: not an amount"):
+        parseDistribution(fileName, 'direct', 10**16)
+
+def test_artifact_is_reused_until_the_file_changes(tmp_path):
+    fileName = writeCsv(tmp_path, [OTHER + ",1.00"])
+    assert parseDistribution(fileName, 'direct', 10**16)["amounts"] == [10**18]
+    assert parseDistribution(fileName, 'direct', 10**16)["amounts"] == [10**18]
+    assert parseDistribution(fileName, 'direct', 10**15, decimals=2)["amounts"] == [10**17]
+    writeCsv(tmp_path, [OTHER + ",2.00"])
+    assert parseDistribution(fileName, 'direct', 10**16)["amounts"] == [2 * 10**18]
@@ -0,0 +1,51 @@
+'''
+tests the window splitting of scripts/contractInteraction/log_scan.py against the fake node
+1. the windows are fetched and the logs sorted by block and log index
+2. a window the node refuses (ValueError: too many results) is split in halves until it goes through
+3. a single block above the limit raises
+'''
+
+#!/usr/bin/python3
+import pytest
+from web3 import Web3
+from scripts.contractInteraction import log_scan
+from scripts.contractInteraction.log_scan import getLogsParallel, getLogsRange
+
+ADDRESS = "0x0000000000000000000000000000000000000001"
+
+def nodeLog(block, logIndex):
+    return {
+        'address': ADDRESS, 'blockHash': "0x" + hex(block)[2:].rjust(64, "0"), 'blockNumber': hex(block),
+        'data': "0x", 'logIndex': hex(logIndex), 'removed': False, 'topics': [],
+        'transactionHash': "0x" + (hex(block)[2:] + hex(logIndex)[2:].rjust(4, "0")).rjust(64, "0"), 'transactionIndex': "0x0"
+    }
+
+@pytest.fixture
+def logNode(node, monkeypatch):
+    server, uri = node
+    # 3 logs in every block of 0-99
+    server.logs = [nodeLog(block, logIndex) for block in range(0, 100) for logIndex in range(0, 3)]
+    monkeypatch.setattr(log_scan, "web3", Web3(Web3.HTTPProvider(uri)))
+    return server
+
+def requestedRanges(server):
+    return [(int(request['params'][0]['fromBlock'], 16), int(request['params'][0]['toBlock'], 16))
+        for request in server.received if request['method'] == "eth_getLogs"]
+
+def test_windows_are_merged_in_order(logNode):
+    logs = getLogsParallel({'address': ADDRESS}, 0, 99, step=30, concurrency=4)
+    assert [(log['blockNumber'], log['logIndex']) for log in logs] == [(block, logIndex) for block in range(0, 100) for logIndex in range(0, 3)]
+    assert sorted(requestedRanges(logNode)) == [(0, 29), (30, 59), (60, 89), (90, 99)]
+
+def test_refused_window_is_split(logNode):
+    logNode.maxLogs = 40
+    logs = getLogsParallel({'address': ADDRESS}, 10, 59, step=50)
+    assert len(logs) == 150
+    assert [log['blockNumber'] for log in logs] == sorted(log['blockNumber'] for log in logs)
+    # 50 blocks (150 logs) -> 2 x 25 blocks (75 logs) -> 4 x 12/13 blocks (36/39 logs)
+    assert requestedRanges(logNode) == [(10, 59), (10, 34), (10, 22), (23, 34), (35, 59), (35, 47), (48, 59)]
+
+def test_single_block_above_the_limit_raises(logNode):
+    logNode.maxLogs = 2
+    with pytest.raises(ValueError):
+        getLogsRange({'address': ADDRESS}, 0, 1)
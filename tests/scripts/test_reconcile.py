@@ -0,0 +1,71 @@
+'''
+tests the reconciliation of scripts/contractInteraction/tasks/airdrop_distribution/functions/reconcile.py
+1. joinPayments classifies ok, missing, duplicate and mismatch rows and counts the unexpected payments
+2. fetchPayments decodes the TokensTransferred events served by the fake node
+3. the join of a 100k row distribution stays a single pass over the rows
+'''
+
+#!/usr/bin/python3
+import time
+from web3 import Web3
+from scripts.contractInteraction import log_scan
+from scripts.contractInteraction.tasks.airdrop_distribution.functions import reconcile
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.reconcile import fetchPayments, joinPayments
+from scripts.contractInteraction.tasks.airdrop_distribution.functions.transfer_ledger import TOKENS_TRANSFERRED
+
+TOKEN_SENDER = "0x0000000000000000000000000000000000000001"
+TOKEN = "0x00000000000000000000000000000000000000ff"
+
+def receiver(i):
+    return "0x" + hex(0x1000 + i)[2:].rjust(40, "0")
+
+def test_join_statuses():
+    receivers = [receiver(i) for i in range(0, 6)]
+    amounts = [10, 10, 10, 10, 10, 10]
+    payments = {
+        receiver(0): [(10, "0x01")],
+        # receiver(1) missing
+        receiver(2): [(10, "0x02"), (10, "0x03")],
+        receiver(3): [(7, "0x04")],
+        receiver(4): [(10, "0x05"), (5, "0x06")],
+        receiver(5): [(5, "0x07"), (5, "0x08")],
+        receiver(6): [(10, "0x09"), (10, "0x0a")],
+    }
+    rows, unexpected = joinPayments([address.upper().replace("0X", "0x") for address in receivers], amounts, payments)
+    assert [row[4] for row in rows] == ["ok", "missing", "duplicate", "mismatch", "mismatch", "mismatch"]
+    assert [row[2] for row in rows] == [10, 0, 20, 7, 15, 10]
+    assert [row[3] for row in rows] == [1, 0, 2, 1, 2, 2]
+    assert unexpected == 2
+
+def test_fetch_payments(node, monkeypatch):
+    server, uri = node
+    w3 = Web3(Web3.HTTPProvider(uri))
+    monkeypatch.setattr(log_scan, "web3", w3)
+    monkeypatch.setattr(reconcile, "web3", w3)
+    topic = w3.toHex(w3.keccak(text=TOKENS_TRANSFERRED))
+    server.logs = [{
+        'address': TOKEN_SENDER, 'blockHash': "0x" + "11" * 32, 'blockNumber': hex(block), 'data': "0x" + hex(amount)[2:].rjust(64, "0"),
+        'logIndex': "0x0", 'removed': False, 'transactionHash': "0x" + hex(block)[2:].rjust(64, "0"), 'transactionIndex': "0x0",
+        'topics': [topic, "0x" + TOKEN[2:].rjust(64, "0"), "0x" + receiver(i)[2:].rjust(64, "0")]
+    } for block, i, amount in [(5, 0, 10), (6, 1, 20), (7, 0, 10)]]
+    server.maxLogs = 2
+    payments = fetchPayments(TOKEN_SENDER, TOKEN, 0, 9)
+    assert dict(payments) == {
+        receiver(0): [(10, "0x" + "5".rjust(64, "0")), (10, "0x" + "7".rjust(64, "0"))],
+        receiver(1): [(20, "0x" + "6".rjust(64, "0"))],
+    }
+
+def test_join_of_100k_rows():
+    count = 100000
+    receivers = [receiver(i) for i in range(0, count)]
+    amounts = [10**18 + i for i in range(0, count)]
+    # every 10th missing, every 100th paid twice
+    payments = {receiver(i): [(amounts[i], "0x01")] * (2 if i % 100 == 1 else 1) for i in range(0, count) if i % 10 != 0}
+    start = time.time()
+    rows, unexpected = joinPayments(receivers, amounts, payments)
+    elapsed = time.time() - start
+    print("join of", count, "rows:", round(elapsed, 3), "s")
+    statuses = [row[4] for row in rows]
+    assert statuses.count("missing") == 10000 and statuses.count("duplicate") == 1000 and statuses.count("ok") == 89000
+    assert unexpected == 0
+    assert elapsed < 5
@@ -0,0 +1,77 @@
+'''
+tests scripts/contractInteraction/rpc_batch.py
+1. requests are split into batches of batchSize and the responses mapped back by id
+2. JSON-RPC errors raise ValueError, a rejected batch fails all its requests
+3. on a non-HTTP endpoint readCallsRpc sends single eth_calls pinned to one block
+4. on the development node the batched reads equal the direct calls, also at a past block
+'''
+
+#!/usr/bin/python3
+import pytest
+from web3 import Web3
+from scripts.contractInteraction import rpc_batch
+from scripts.contractInteraction.rpc_batch import RpcBatchClient, readCallsRpc
+
+def test_requests_are_split_into_batches(node, echo):
+    server, uri = node
+    client = RpcBatchClient(uri, batchSize=3, maxInFlight=2)
+    futures = [client.ethCall(echo._address, echo.encode_input(i), 5) for i in range(0, 7)]
+    client.flush()
+    assert [int(future.result(), 16) for future in futures] == list(range(0, 7))
+    assert sorted(len(batch) for batch in server.received) == [1, 3, 3]
+    assert all(request['params'][1] == "0x5" for batch in server.received for request in batch)
+    assert client.batchesSent == 3 and client.requestsSent == 7
+
+def test_errors_raise_value_error(node, echo):
+    server, uri = node
+    client = RpcBatchClient(uri)
+    ok = client.ethCall(echo._address, "0x01")
+    failed = client.queue("eth_unknown", [])
+    client.flush()
+    assert ok.result() == "0x01"
+    with pytest.raises(ValueError):
+        failed.result()
+
+def test_rejected_batch_fails_all_requests(node, echo):
+    server, uri = node
+    client = RpcBatchClient(uri)
+    futures = [client.ethCall(echo._address, "0x01"), client.queue("reject", [])]
+    client.flush()
+    for future in futures:
+        with pytest.raises(ValueError, match="batch too large"):
+            future.result()
+
+def test_result_flushes_the_queue(node, echo):
+    server, uri = node
+    client = RpcBatchClient(uri)
+    future = client.ethCall(echo._address, "0x02")
+    assert len(server.received) == 0
+    assert future.result() == "0x02"
+    assert len(server.received) == 1
+
+def test_non_http_endpoint_is_rejected_by_the_client():
+    with pytest.raises(Exception, match="HTTP endpoint"):
+        RpcBatchClient("ws://127.0.0.1:4445/websocket")
+    assert not rpc_batch.isHttpEndpoint("ws://127.0.0.1:4445/websocket")
+    assert rpc_batch.isHttpEndpoint("https://mainnet.sovryn.app/rpc")
+
+def test_read_calls_fall_back_to_single_calls(node, echo, monkeypatch):
+    server, uri = node
+    # a separate web3 on the fake node, the brownie one stays connected to the development network
+    monkeypatch.setattr(rpc_batch, "web3", Web3(Web3.HTTPProvider(uri)))
+    monkeypatch.setattr(rpc_batch, "isHttpEndpoint", lambda endpointUri=None: False)
+    assert readCallsRpc([(echo, i) for i in range(0, 4)]) == list(range(0, 4))
+    calls = [request for request in server.received if request['method'] == "eth_call"]
+    assert len(calls) == 4 and not any(isinstance(request, list) for request in server.received)
+    # 'latest' is pinned to the block number read first, so all the calls see the same state
+    assert all(request['params'][1] == "0x10" for request in calls)
+
+def test_read_calls_on_dev_chain(accounts, TestToken, chain):
+    token = TestToken.deploy("Test", "TST", 18, 10**24, {'from': accounts[0]})
+    for i in range(1, 5):
+        token.transfer(accounts[i], i * 100, {'from': accounts[0]})
+    block = chain.height
+    token.transfer(accounts[1], 1000, {'from': accounts[0]})
+    calls = [(token.balanceOf, accounts[i]) for i in range(0, 5)]
+    assert readCallsRpc(calls) == [token.balanceOf(accounts[i]) for i in range(0, 5)]
+    assert readCallsRpc(calls, block) == [10**24 - 1000, 100, 200, 300, 400]
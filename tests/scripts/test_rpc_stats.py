@@ -0,0 +1,75 @@
+'''
+tests the helper attribution of scripts/contractInteraction/rpc_stats.py
+the RPC of reads going through the infrastructure modules (multicall, rpc_batch, async_reads)
+is attributed to the helper calling them, also when it is sent from their worker threads
+(the helpers are the functions of this file, it is under a scripts/ directory too)
+'''
+
+#!/usr/bin/python3
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from web3 import Web3
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction import multicall, rpc_batch, rpc_stats
+from scripts.contractInteraction.async_reads import AsyncReadEngine
+from scripts.contractInteraction.multicall import readCalls, readCallsChunked
+from scripts.contractInteraction.rpc_batch import readCallsRpc
+
+@pytest.fixture
+def stats(node, monkeypatch):
+    server, uri = node
+    stats = rpc_stats.RpcStats()
+    w3 = Web3(Web3.HTTPProvider(uri))
+    w3.middleware_onion.inject(rpc_stats.rpcStatsMiddleware(stats), name='rpcStats', layer=0)
+    monkeypatch.setattr(rpc_stats, "activeStats", stats)
+    monkeypatch.setattr(multicall, "web3", w3)
+    monkeypatch.setattr(rpc_batch, "web3", w3)
+    monkeypatch.setattr(rpc_batch, "_defaultClient", None)
+    # no Multicall contract: the reads fall back to JSON-RPC batches (or single calls)
+    monkeypatch.setitem(conf.__dict__, "contracts", {})
+    return stats
+
+def helpers(stats):
+    return {row["helper"]: row for row in stats.summary()}
+
+def readPoolState(echo):
+    return readCalls([(echo, 1), (echo, 2)])
+
+def readPoolStates(echo):
+    return readCallsChunked([(echo, i) for i in range(0, 10)], chunkSize=3)
+
+def test_batched_read_is_attributed_to_the_helper(stats, echo):
+    assert readPoolState(echo) == [1, 2]
+    rows = helpers(stats)
+    assert list(rows.keys()) == ["test_rpc_stats.readPoolState"]
+    assert "batch[eth_call]" in rows["test_rpc_stats.readPoolState"]["methods"]
+
+def test_single_calls_are_attributed_to_the_helper(stats, echo, monkeypatch):
+    monkeypatch.setattr(multicall, "isHttpEndpoint", lambda endpointUri=None: False)
+    assert readPoolState(echo) == [1, 2]
+    rows = helpers(stats)
+    assert list(rows.keys()) == ["test_rpc_stats.readPoolState"]
+    assert rows["test_rpc_stats.readPoolState"]["methods"]["eth_call"]["calls"] == 2
+
+def test_worker_threads_are_attributed_to_the_helper(stats, echo):
+    assert readPoolStates(echo) == list(range(0, 10))
+    rows = helpers(stats)
+    assert list(rows.keys()) == ["test_rpc_stats.readPoolStates"]
+    # eth_blockNumber pins the chunks to one block, then 4 chunks of up to 3 calls
+    assert rows["test_rpc_stats.readPoolStates"]["methods"]["batch[eth_call]"]["calls"] == 4
+
+def test_async_reads_are_attributed_to_the_row_function(stats, echo):
+    async def readRow(engine, row):
+        return (await engine.call(readCallsRpc, [(echo, row)]))[0]
+    engine = AsyncReadEngine(concurrency=2)
+    assert engine.mapRows(range(0, 3), readRow) == [0, 1, 2]
+    engine.close()
+    assert list(helpers(stats).keys()) == ["test_rpc_stats.readRow"]
+
+def test_helper_of_worker_threads():
+    assert rpc_stats.callingHelper() == "test_rpc_stats.test_helper_of_worker_threads"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # no helper on the stack of the worker thread
+        assert executor.submit(rpc_stats.callingHelper).result() == "<unknown>"
+        assert executor.submit(rpc_stats.runAsHelper, "loan_tokens.readLoanTokenState", rpc_stats.callingHelper).result() == "loan_tokens.readLoanTokenState"
+        assert executor.submit(rpc_stats.callingHelper).result() == "<unknown>"
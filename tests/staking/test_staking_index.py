@@ -0,0 +1,85 @@
+'''
+tests the event replay of scripts/staking/staking_index.py with synthetic Staking logs
+1. stake -> delegate -> extend -> withdraw inside one getLogs range gives the state of the contract
+2. the same logs synced one block at a time give the same index
+3. the historical reads see the state of every block of the range
+'''
+
+#!/usr/bin/python3
+import pytest
+from brownie import web3
+from eth_abi import encode_abi
+from hexbytes import HexBytes
+from scripts.staking.staking_index import StakingIndex, EVENTS, ZERO_ADDRESS
+
+STAKING = "0x5684a06cab22db16d901fee2a5c081b4c91ea40e"
+USER = "0x00000000000000000000000000000000000000aa"
+DELEGATE = "0x00000000000000000000000000000000000000bb"
+RECEIVER = "0x00000000000000000000000000000000000000cc"
+LOCK_DATE = 1700000000
+NEW_LOCK_DATE = LOCK_DATE + 1209600 * 4
+
+def topic(address):
+    return HexBytes("0x" + address[2:].rjust(64, "0"))
+
+def stakingLog(name, block, logIndex, indexed, data, txIndex=0):
+    return {
+        'topics': [HexBytes(web3.keccak(text=EVENTS[name][0]))] + [topic(address) for address in indexed],
+        'data': "0x" + encode_abi(EVENTS[name][1], data).hex(),
+        'blockNumber': block,
+        'logIndex': logIndex,
+        'transactionHash': HexBytes(block.to_bytes(16, 'big') + txIndex.to_bytes(16, 'big'))
+    }
+
+# the logs in the order the Staking modules emit them
+LOGS = [
+    # block 10: stake 100 until LOCK_DATE, delegated to DELEGATE
+    stakingLog("DelegateChanged", 10, 0, [USER, ZERO_ADDRESS, DELEGATE], [LOCK_DATE]),
+    stakingLog("DelegateStakeChanged", 10, 1, [DELEGATE], [LOCK_DATE, 0, 100]),
+    stakingLog("TokensStaked", 10, 2, [USER], [100, LOCK_DATE, 100]),
+    # block 12: extended to NEW_LOCK_DATE, the delegate stake moves along
+    stakingLog("DelegateStakeChanged", 12, 0, [DELEGATE], [LOCK_DATE, 100, 0]),
+    stakingLog("DelegateStakeChanged", 12, 1, [DELEGATE], [NEW_LOCK_DATE, 0, 100]),
+    stakingLog("ExtendedStakingDuration", 12, 2, [USER], [LOCK_DATE, NEW_LOCK_DATE, 100]),
+    # block 14: early withdrawal of 40, the event carries the amount after the penalty
+    stakingLog("DelegateStakeChanged", 14, 0, [DELEGATE], [NEW_LOCK_DATE, 100, 60]),
+    stakingLog("StakingWithdrawn", 14, 1, [USER, RECEIVER], [35, NEW_LOCK_DATE, False]),
+]
+
+def syncedIndex(tmp_path, maxStep):
+    index = StakingIndex(STAKING, path=str(tmp_path / "index.sqlite"), startBlock=10, minStep=1, maxStep=maxStep)
+    index._getLogs = lambda fromBlock, toBlock: [log for log in LOGS if fromBlock <= log['blockNumber'] <= toBlock]
+    index.sync(toBlock=20)
+    return index
+
+def assertFinalState(index):
+    assert index.stakesAt(USER) == ([NEW_LOCK_DATE], [60])
+    assert index.stakeOf(USER, LOCK_DATE) == 0
+    assert index.delegateOf(USER, NEW_LOCK_DATE) == DELEGATE
+    assert index.delegateOf(USER, LOCK_DATE) == ZERO_ADDRESS
+    assert index.delegatesAt(USER) == {NEW_LOCK_DATE: DELEGATE}
+    assert index.delegateStakesAt() == [(DELEGATE, NEW_LOCK_DATE, 60)]
+    assert index.totalStakesAt() == {NEW_LOCK_DATE: 60}
+
+def test_sequence_in_one_range(tmp_path):
+    index = syncedIndex(tmp_path, maxStep=100)
+    assert index.lastSyncedBlock() == 20
+    assertFinalState(index)
+
+def test_sequence_block_by_block(tmp_path):
+    index = syncedIndex(tmp_path, maxStep=1)
+    assertFinalState(index)
+
+def test_historical_state_inside_the_range(tmp_path):
+    index = syncedIndex(tmp_path, maxStep=100)
+    assert index.stakesAt(USER, 9) == ([], [])
+    assert index.stakesAt(USER, 11) == ([LOCK_DATE], [100])
+    assert index.delegatesAt(USER, 11) == {LOCK_DATE: DELEGATE}
+    assert index.stakesAt(USER, 13) == ([NEW_LOCK_DATE], [100])
+    assert index.delegatesAt(USER, 13) == {NEW_LOCK_DATE: DELEGATE}
+    assert index.stakesAt(USER, 14) == ([NEW_LOCK_DATE], [60])
+
+def test_index_of_another_contract_is_refused(tmp_path):
+    syncedIndex(tmp_path, maxStep=100).close()
+    with pytest.raises(Exception, match="is of the staking contract"):
+        StakingIndex(RECEIVER, path=str(tmp_path / "index.sqlite"))
@@ -0,0 +1,96 @@
+'''
+differential test of scripts/staking/weight_math.py against WeightedStakingModule.computeWeightByDate
+1. the edges of the weight curve (no time remaining, max duration, day boundaries)
+2. every lock date of a start date, scalar and vectorized
+3. random (date, startDate) pairs
+4. the reverting inputs
+5. the deployed Staking (proxy and modules): lock dates from its kickoffTS, the compute-weight.py table of a
+   non aligned timestamp and the weighted stakes of the stakes of an account
+'''
+
+#!/usr/bin/python3
+import pytest
+import random
+import brownie
+import numpy as np
+from scripts.staking.weight_math import *
+
+START = 1600000000
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+@pytest.fixture(scope="module")
+def weightedStaking(accounts, WeightedStakingModule):
+    return WeightedStakingModule.deploy({'from': accounts[0], 'gas_limit': 6800000})
+
+@pytest.fixture(scope="module")
+def staking(accounts, interface, Contract, TestToken, StakingProxy, ModulesProxy, ModulesProxyRegistry, StakingAdminModule, StakingGovernanceModule,
+        StakingStakeModule, StakingStorageModule, StakingVestingModule, StakingWithdrawModule, WeightedStakingModule):
+    token = TestToken.deploy("SOV", "SOV", 18, 10**26, {'from': accounts[0]})
+    stakingProxy = StakingProxy.deploy(token.address, {'from': accounts[0]})
+    modulesProxy = ModulesProxy.deploy({'from': accounts[0]})
+    stakingProxy.setImplementation(modulesProxy.address, {'from': accounts[0]})
+    modules = Contract.from_abi("StakingModulesProxy", address=stakingProxy.address, abi=ModulesProxyRegistry.abi, owner=accounts[0])
+    for module in [StakingAdminModule, StakingGovernanceModule, StakingStakeModule, StakingStorageModule,
+            StakingVestingModule, StakingWithdrawModule, WeightedStakingModule]:
+        modules.addModule(module.deploy({'from': accounts[0], 'gas_limit': 6800000}).address, {'from': accounts[0]})
+    token.approve(stakingProxy.address, 10**24, {'from': accounts[0]})
+    return Contract.from_abi("Staking", address=stakingProxy.address, abi=interface.IStaking.abi, owner=accounts[0])
+
+def test_weight_curve_edges(weightedStaking):
+    for remaining in [0, 1, DAY - 1, DAY, DAY + 1, TWO_WEEKS, MAX_DURATION // 2, MAX_DURATION - DAY, MAX_DURATION - 1, MAX_DURATION]:
+        expected = weightedStaking.computeWeightByDate(START + remaining, START)
+        assert computeWeightByDate(START + remaining, START) == expected
+        assert computeWeightsByDate([START + remaining], [START])[0] == expected
+
+def test_weight_table(weightedStaking):
+    dates, weights = weightTable(START)
+    assert len(dates) == 79
+    for i in range(0, len(dates)):
+        assert weights[i] == weightedStaking.computeWeightByDate(int(dates[i]), START)
+
+def test_random_pairs(weightedStaking):
+    rng = random.Random(1)
+    startDates = [rng.randint(START, START + 10**8) for i in range(0, 200)]
+    dates = [startDate + rng.randint(0, MAX_DURATION) for startDate in startDates]
+    weights = computeWeightsByDate(dates, startDates)
+    for i in range(0, len(dates)):
+        expected = weightedStaking.computeWeightByDate(dates[i], startDates[i])
+        assert computeWeightByDate(dates[i], startDates[i]) == expected
+        assert weights[i] == expected
+
+def test_reverting_inputs(weightedStaking):
+    with brownie.reverts("date < startDate"):
+        weightedStaking.computeWeightByDate(START - 1, START)
+    with pytest.raises(ValueError, match="date < startDate"):
+        computeWeightsByDate([START - 1], [START])
+    with brownie.reverts("remaining time > max duration"):
+        weightedStaking.computeWeightByDate(START + MAX_DURATION + 1, START)
+    with pytest.raises(ValueError, match="remaining time > max duration"):
+        computeWeightByDate(START + MAX_DURATION + 1, START)
+
+def test_deployed_staking(accounts, chain, staking):
+    kickoffTS = staking.kickoffTS()
+    for timestamp in [kickoffTS, kickoffTS + 1, kickoffTS + TWO_WEEKS - 1, kickoffTS + TWO_WEEKS, chain.time() + 12345]:
+        assert timestampToLockDate(timestamp, kickoffTS) == staking.timestampToLockDate(timestamp)
+
+    # the table of scripts/staking/compute-weight.py
+    ts = chain.time() + 12345
+    lockedTS = timestampToLockDate(ts, kickoffTS)
+    lockedDates = lockedTS + TWO_WEEKS * np.arange(1, 79, dtype=np.int64)
+    weights = computeWeightsByDate(lockedDates, ts)
+    for i in range(0, len(lockedDates)):
+        assert weights[i] == staking.computeWeightByDate(int(lockedDates[i]), ts)
+
+    stakes = []
+    for amount, twoWeeks in [(10**18 + 1, 4), (7 * 10**20 + 3, 26), (5 * 10**23, 78)]:
+        lockDate = staking.timestampToLockDate(chain.time() + twoWeeks * TWO_WEEKS)
+        staking.stake(amount, lockDate, ZERO_ADDRESS, ZERO_ADDRESS, {'from': accounts[0]})
+        stakes.append((amount, lockDate))
+    chain.mine()
+    blockNumber = chain.height - 1
+    startDate = timestampToLockDate(chain.time(), kickoffTS)
+    for amount, lockDate in stakes:
+        staked = staking.getPriorUserStakeByDate(accounts[0], lockDate, blockNumber)
+        assert staked == amount
+        expected = staking.weightedStakeByDate(accounts[0], lockDate, startDate, blockNumber)
+        assert power(staked, computeWeightByDate(lockDate, startDate)) == expected
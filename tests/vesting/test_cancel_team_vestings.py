@@ -0,0 +1,88 @@
+'''
+tests cancelTeamVestingsOfAccounts (scripts/contractInteraction/staking_vesting.py) on the development chain:
+Staking, an upgradable VestingRegistry and a MultiSigWallet owning a BatchExecutor which is a Staking admin
+1. the team vestings of the offboarded accounts are cancelled in one multisig transaction, their stakes are
+   sent to the multisig, the vestings of other owners and of other accounts are left alone
+2. with a lower gas limit the cancellations are split into several multisig transactions
+'''
+
+#!/usr/bin/python3
+import pytest
+import scripts.contractInteraction.config as conf
+from scripts.contractInteraction.staking_vesting import cancelTeamVestingsOfAccounts
+
+FOUR_WEEKS = 4 * 7 * 24 * 3600
+AMOUNT = 1000 * 10**18
+
+@pytest.fixture(scope="function")
+def setup(accounts, monkeypatch, interface, Contract, TestToken, StakingProxy, ModulesProxy, ModulesProxyRegistry, StakingAdminModule,
+        StakingGovernanceModule, StakingStakeModule, StakingStorageModule, StakingVestingModule, StakingWithdrawModule, WeightedStakingModule,
+        VestingLogic, VestingFactory, VestingRegistryLogic, VestingRegistryProxy, MultiSigWallet, BatchExecutor):
+    token = TestToken.deploy("SOV", "SOV", 18, 10**26, {'from': accounts[0]})
+    stakingProxy = StakingProxy.deploy(token.address, {'from': accounts[0]})
+    modulesProxy = ModulesProxy.deploy({'from': accounts[0]})
+    stakingProxy.setImplementation(modulesProxy.address, {'from': accounts[0]})
+    modules = Contract.from_abi("StakingModulesProxy", address=stakingProxy.address, abi=ModulesProxyRegistry.abi, owner=accounts[0])
+    for module in [StakingAdminModule, StakingGovernanceModule, StakingStakeModule, StakingStorageModule,
+            StakingVestingModule, StakingWithdrawModule, WeightedStakingModule]:
+        modules.addModule(module.deploy({'from': accounts[0], 'gas_limit': 6800000}).address, {'from': accounts[0]})
+    staking = Contract.from_abi("Staking", address=stakingProxy.address, abi=interface.IStaking.abi, owner=accounts[0])
+    staking.setMaxVestingWithdrawIterations(50, {'from': accounts[0]})
+
+    multisig = MultiSigWallet.deploy([accounts[0]], 1, {'from': accounts[0]})
+    executor = BatchExecutor.deploy({'from': accounts[0]})
+    executor.transferOwnership(multisig.address, {'from': accounts[0]})
+    staking.addAdmin(executor.address, {'from': accounts[0]})
+
+    vestingFactory = VestingFactory.deploy(VestingLogic.deploy({'from': accounts[0]}).address, {'from': accounts[0]})
+    registryProxy = VestingRegistryProxy.deploy({'from': accounts[0]})
+    registryProxy.setImplementation(VestingRegistryLogic.deploy({'from': accounts[0]}).address, {'from': accounts[0]})
+    registry = Contract.from_abi("VestingRegistryLogic", address=registryProxy.address, abi=VestingRegistryLogic.abi, owner=accounts[0])
+    vestingFactory.transferOwnership(registry.address, {'from': accounts[0]})
+    # fee sharing and LockedSOV are not used by the cancellation
+    registry.initialize(vestingFactory.address, token.address, staking.address, accounts[9], multisig.address, accounts[9], [], {'from': accounts[0]})
+    staking.setVestingRegistry(registry.address, {'from': accounts[0]})
+
+    monkeypatch.setitem(conf.__dict__, "contracts", {'Staking': staking.address, 'VestingRegistryProxy': registry.address,
+        'multisig': multisig.address, 'BatchExecutor': executor.address})
+    monkeypatch.setitem(conf.__dict__, "acct", accounts[0])
+    return token, staking, registry, multisig
+
+def createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, tokenOwner, team, duration):
+    create = registry.createTeamVesting if team else registry.createVestingAddr
+    create(tokenOwner, AMOUNT, FOUR_WEEKS, duration, 3, {'from': accounts[0]})
+    vesting = Contract.from_abi("VestingLogic", address=registry.getVestingsOf(tokenOwner)[-1][2], abi=VestingLogic.abi, owner=accounts[0])
+    staking.addContractCodeHash(vesting.address, {'from': accounts[0]})
+    token.approve(vesting.address, AMOUNT, {'from': accounts[0]})
+    vesting.stakeTokens(AMOUNT, {'from': accounts[0]})
+    return vesting
+
+def test_cancel_team_vestings_in_one_batch(accounts, Contract, VestingLogic, setup):
+    token, staking, registry, multisig = setup
+    offboarded = [
+        createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, accounts[2], True, 10 * FOUR_WEEKS),
+        createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, accounts[2], True, 20 * FOUR_WEEKS),
+        createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, accounts[3], True, 10 * FOUR_WEEKS),
+    ]
+    # owned by its token owner, not a team vesting of the multisig
+    ownerVesting = createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, accounts[2], False, 10 * FOUR_WEEKS)
+    otherTeamVesting = createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, accounts[4], True, 10 * FOUR_WEEKS)
+
+    txIds = cancelTeamVestingsOfAccounts([accounts[2], accounts[3]], 0)
+    assert len(txIds) == 1
+    assert multisig.transactions(txIds[0])[3]
+    assert token.balanceOf(multisig.address) == len(offboarded) * AMOUNT
+    assert all(staking.balanceOf(vesting.address) == 0 for vesting in offboarded)
+    assert staking.balanceOf(ownerVesting.address) == AMOUNT
+    assert staking.balanceOf(otherTeamVesting.address) == AMOUNT
+
+def test_cancellations_split_by_gas(accounts, Contract, VestingLogic, setup):
+    token, staking, registry, multisig = setup
+    vestings = [createStakedVesting(accounts, Contract, VestingLogic, token, staking, registry, accounts[2 + i], True, 20 * FOUR_WEEKS)
+        for i in range(0, 3)]
+    gas = staking.cancelTeamVesting.estimate_gas(vestings[0].address, multisig.address, 0, {'from': accounts[0]})
+
+    txIds = cancelTeamVestingsOfAccounts([accounts[2], accounts[3], accounts[4]], 0, gasLimit=int(gas * 1.5))
+    assert len(txIds) > 1
+    assert all(multisig.transactions(txId)[3] for txId in txIds)
+    assert token.balanceOf(multisig.address) == len(vestings) * AMOUNT